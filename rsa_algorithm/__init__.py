@@ -0,0 +1,9 @@
+"""RSA key generation, encryption and signatures without any GUI dependency."""
+from .core import RSA_Implementation
+from .engine import RSAEngine
+from .keys import PrivateKey, PublicKey
+from .metrics import Metrics, NULL_METRICS, NullMetrics
+from .tracing import LazyTracer, NULL_TRACER, NullTracer
+
+__all__ = ["RSA_Implementation", "RSAEngine", "PublicKey", "PrivateKey",
+           "LazyTracer", "NULL_TRACER", "NullTracer", "Metrics", "NULL_METRICS", "NullMetrics"]
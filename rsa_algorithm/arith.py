@@ -0,0 +1,129 @@
+"""Big-integer arithmetic backends.
+
+The pure-Python backend is always available. The gmpy2 backend is picked at
+import time when gmpy2 is installed, unless the RSA_ARITH_BACKEND environment
+variable names another backend.
+"""
+import math
+import os
+
+from . import primality
+
+try:
+    import gmpy2
+except ImportError:  # gmpy2 is optional
+    gmpy2 = None
+
+
+def extended_gcd(a, b):
+    """Iterative extended Euclid: returns (g, x, y) with a*x + b*y = g"""
+    x0, x1, y0, y1 = 1, 0, 0, 1
+    while b:
+        quotient, a, b = a // b, b, a % b
+        x0, x1 = x1, x0 - quotient * x1
+        y0, y1 = y1, y0 - quotient * y1
+    return a, x0, y0
+
+
+def batch_invert(values, modulus, invert):
+    """Invert many values modulo one modulus with a single inversion (Montgomery's trick)
+
+    Prefix products are inverted once and the individual inverses are peeled
+    off backwards, trading n - 1 inversions for 3(n - 1) multiplications.
+    """
+    values = [value % modulus for value in values]
+    if not values:
+        return []
+    prefix = [values[0]]
+    for value in values[1:]:
+        prefix.append(prefix[-1] * value % modulus)
+    try:
+        inverse = invert(prefix[-1], modulus)
+    except ValueError:
+        raise ValueError("Modular inverse does not exist for every value") from None
+    inverses = [0] * len(values)
+    for i in range(len(values) - 1, 0, -1):
+        inverses[i] = inverse * prefix[i - 1] % modulus
+        inverse = inverse * values[i] % modulus
+    inverses[0] = inverse
+    return inverses
+
+
+class PythonBackend:
+    """Arithmetic on built-in Python ints"""
+    name = "python"
+
+    def powmod(self, base, exponent, modulus):
+        return pow(base, exponent, modulus)
+
+    def gcd(self, a, b):
+        """Calculate the greatest common divisor of two numbers (Lehmer's algorithm in C)"""
+        return math.gcd(a, b)
+
+    def invert(self, a, modulus):
+        """Calculate the modular multiplicative inverse"""
+        try:
+            return pow(a, -1, modulus)
+        except ValueError:
+            raise ValueError("Modular inverse does not exist") from None
+
+    def batch_invert(self, values, modulus):
+        return batch_invert(values, modulus, self.invert)
+
+    def is_prime(self, n, rounds=primality.DEFAULT_ROUNDS, mode=primality.MODE_MILLER_RABIN,
+                 prefiltered=False):
+        """Probable-prime test; prefiltered skips the small prime trial division"""
+        if prefiltered:
+            return primality.strong_test(n, rounds, mode)
+        return primality.is_probable_prime(n, rounds, mode)
+
+    def next_prime(self, n, rounds=primality.DEFAULT_ROUNDS, mode=primality.MODE_MILLER_RABIN):
+        return primality.next_prime(n, rounds, mode)
+
+
+class Gmpy2Backend:
+    """Arithmetic on GMP through gmpy2; results are converted back to Python ints"""
+    name = "gmpy2"
+
+    def powmod(self, base, exponent, modulus):
+        return int(gmpy2.powmod(base, exponent, modulus))
+
+    def gcd(self, a, b):
+        return int(gmpy2.gcd(a, b))
+
+    def invert(self, a, modulus):
+        try:
+            return int(gmpy2.invert(a, modulus))
+        except ZeroDivisionError:
+            raise ValueError("Modular inverse does not exist") from None
+
+    def batch_invert(self, values, modulus):
+        return batch_invert(values, modulus, self.invert)
+
+    def is_prime(self, n, rounds=primality.DEFAULT_ROUNDS, mode=primality.MODE_MILLER_RABIN,
+                 prefiltered=False):
+        if mode == primality.MODE_BAILLIE_PSW:
+            return n > 1 and (n in (2, 3) or bool(n % 2 and gmpy2.is_bpsw_prp(n)))
+        return bool(gmpy2.is_prime(n, rounds))
+
+    def next_prime(self, n, rounds=primality.DEFAULT_ROUNDS, mode=primality.MODE_MILLER_RABIN):
+        return int(gmpy2.next_prime(n))
+
+
+BACKENDS = {"python": PythonBackend}
+if gmpy2 is not None:
+    BACKENDS["gmpy2"] = Gmpy2Backend
+
+
+def get_backend(name=None):
+    """Return a backend instance by name, or the fastest available one"""
+    if name is None:
+        name = "gmpy2" if "gmpy2" in BACKENDS else "python"
+    try:
+        return BACKENDS[name]()
+    except KeyError:
+        raise ValueError(f"Unknown or unavailable arithmetic backend: {name}") from None
+
+
+# Backend used by RSA_Implementation unless one is passed in explicitly
+BACKEND = get_backend(os.environ.get("RSA_ARITH_BACKEND") or None)
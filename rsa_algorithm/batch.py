@@ -0,0 +1,51 @@
+import os
+from collections import deque
+from itertools import islice
+
+EXECUTOR_THREAD = "thread"
+EXECUTOR_PROCESS = "process"
+
+DEFAULT_CHUNK_SIZE = 64
+
+
+def chunked(items, size):
+    """Yield lists of up to size items from any iterable without materializing it"""
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def make_executor(kind, workers):
+    """Create a thread or process pool executor"""
+    # Imported here so that single-process callers do not pay for multiprocessing
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+    if kind == EXECUTOR_PROCESS:
+        return ProcessPoolExecutor(max_workers=workers)
+    if kind == EXECUTOR_THREAD:
+        return ThreadPoolExecutor(max_workers=workers)
+    raise ValueError(f"Unknown executor kind: {kind}")
+
+
+def map_ordered(fn, chunks, workers=None, executor=EXECUTOR_PROCESS, *args):
+    """Apply fn(*args, chunk) to each chunk on a pool and yield the results in input order
+
+    At most two chunks per worker are in flight, so memory stays bounded no matter
+    how long the input is.
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        for chunk in chunks:
+            yield fn(*args, chunk)
+        return
+    with make_executor(executor, workers) as pool:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(fn, *args, chunk))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
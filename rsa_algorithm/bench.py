@@ -0,0 +1,722 @@
+import json
+import math
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from . import arith, blinding, primality, vectorized
+from .keys import PublicKey
+from .keystore import KeyStore
+from .core import RSA_Implementation
+
+
+def benchmark_primality(bit_sizes=(512, 1024, 2048), duration=2.0, seed=1234):
+    """Measure is_prime candidates/second on random odd candidates of each size"""
+    results = []
+    for mode in (primality.MODE_MILLER_RABIN, primality.MODE_BAILLIE_PSW):
+        rsa = RSA_Implementation(primality_mode=mode)
+        for bits in bit_sizes:
+            rng = random.Random(seed)
+            tested = 0
+            primes = 0
+            start = time.perf_counter()
+            while time.perf_counter() - start < duration:
+                if rsa.is_prime(primality.random_odd(bits, rng)):
+                    primes += 1
+                tested += 1
+            elapsed = time.perf_counter() - start
+            results.append({
+                "mode": mode,
+                "bits": bits,
+                "candidates": tested,
+                "primes": primes,
+                "candidates_per_second": tested / elapsed,
+            })
+    return results
+
+
+def benchmark_prime_search(bit_sizes=(512, 1024), count=5, seed=1234):
+    """Compare random-draw and incremental sieve search for key-sized primes"""
+    results = []
+    for bits in bit_sizes:
+        timings = {}
+        for mode in (primality.SEARCH_RANDOM, primality.SEARCH_INCREMENTAL):
+            rng = random.Random(seed)
+            rsa = RSA_Implementation(search_mode=mode)
+            start = time.perf_counter()
+            for _ in range(count):
+                rsa.generate_prime_bits(bits, rng)
+            timings[mode] = (time.perf_counter() - start) / count
+        results.append({
+            "bits": bits,
+            "random_seconds": timings[primality.SEARCH_RANDOM],
+            "incremental_seconds": timings[primality.SEARCH_INCREMENTAL],
+            "speedup": timings[primality.SEARCH_RANDOM] / timings[primality.SEARCH_INCREMENTAL],
+        })
+    return results
+
+
+def benchmark_parallel_keygen(bit_sizes=(2048, 3072), worker_counts=(1, 2, 4), seed=1234):
+    """Time seeded key generation for several worker counts"""
+    results = []
+    for bits in bit_sizes:
+        for workers in worker_counts:
+            rsa = RSA_Implementation()
+            start = time.perf_counter()
+            rsa.generate_keys(bits=bits, workers=workers, seed=seed)
+            results.append({
+                "bits": bits,
+                "workers": workers,
+                "seconds": time.perf_counter() - start,
+                "modulus_bits": rsa.n.bit_length(),
+            })
+    return results
+
+
+def benchmark_crt_decrypt(bit_sizes=(1024, 2048), count=200, seed=1234):
+    """Compare CRT private-key operations with the plain c^d mod n path"""
+    results = []
+    for bits in bit_sizes:
+        rsa = RSA_Implementation()
+        rsa.generate_keys(bits=bits, seed=seed)
+        n, d = rsa.private_key
+        rng = random.Random(seed)
+        ciphertexts = [rng.randrange(2, n) for _ in range(count)]
+        start = time.perf_counter()
+        for c in ciphertexts:
+            pow(c, d, n)
+        plain = (time.perf_counter() - start) / count
+        start = time.perf_counter()
+        for c in ciphertexts:
+            rsa.private_operation(c)
+        crt = (time.perf_counter() - start) / count
+        results.append({"bits": bits, "plain_seconds": plain, "crt_seconds": crt,
+                        "speedup": plain / crt})
+    return results
+
+
+def benchmark_block_mode(bits=2048, message_bytes=10_000, seed=1234):
+    """Compare per-character and block-packed encryption throughput in MB/s"""
+    rsa = RSA_Implementation()
+    rsa.generate_keys(bits=bits, seed=seed)
+    rng = random.Random(seed)
+    message = "".join(chr(rng.randrange(32, 127)) for _ in range(message_bytes))
+    size_mb = len(message.encode("utf-8")) / 1e6
+
+    start = time.perf_counter()
+    encrypted, _ = rsa.encrypt(message)
+    char_encrypt = time.perf_counter() - start
+    start = time.perf_counter()
+    rsa.decrypt(encrypted)
+    char_decrypt = time.perf_counter() - start
+
+    start = time.perf_counter()
+    blocks = rsa.encrypt_blocks(message)
+    block_encrypt = time.perf_counter() - start
+    start = time.perf_counter()
+    rsa.decrypt_blocks(blocks)
+    block_decrypt = time.perf_counter() - start
+
+    return {
+        "bits": bits,
+        "message_bytes": message_bytes,
+        "char_encrypt_mb_s": size_mb / char_encrypt,
+        "char_decrypt_mb_s": size_mb / char_decrypt,
+        "block_encrypt_mb_s": size_mb / block_encrypt,
+        "block_decrypt_mb_s": size_mb / block_decrypt,
+    }
+
+
+def benchmark_batch_scaling(worker_counts=None, bits=1024, messages=2000, seed=1234):
+    """Measure decrypt_many throughput for 1 to N worker processes"""
+    if worker_counts is None:
+        worker_counts = sorted({1, 2, os.cpu_count() or 1})
+    rsa = RSA_Implementation()
+    rsa.generate_keys(bits=bits, seed=seed)
+    rng = random.Random(seed)
+    records = [f"record-{rng.getrandbits(64):016x}" for _ in range(messages)]
+    encrypted = list(rsa.encrypt_many(records, workers=1, blocks=True))
+    results = []
+    for workers in worker_counts:
+        start = time.perf_counter()
+        for _ in rsa.decrypt_many(encrypted, workers=workers, blocks=True):
+            pass
+        elapsed = time.perf_counter() - start
+        results.append({"workers": workers, "seconds": elapsed,
+                        "messages_per_second": messages / elapsed})
+    return results
+
+
+def benchmark_vectorized(message_chars=50_000, seed=1234):
+    """Compare the NumPy backend with Python ints on a demonstration-sized modulus"""
+    rsa = RSA_Implementation(symbol_cache_bytes=0)
+    rsa.generate_keys(prime_range=(10000, 99999), seed=seed)
+    rng = random.Random(seed)
+    message = "".join(chr(rng.randrange(32, 127)) for _ in range(message_chars))
+    results = {"modulus_bits": rsa.n.bit_length(), "chars": message_chars,
+               "numpy": vectorized.load_numpy() is not None}
+    for label, vectorize in (("python", False), ("vectorized", True)):
+        rsa.vectorize = vectorize
+        start = time.perf_counter()
+        encrypted, _ = rsa.encrypt(message)
+        rsa.decrypt(encrypted)
+        results[f"{label}_seconds"] = time.perf_counter() - start
+    return results
+
+
+def benchmark_backends(bit_sizes=(1024, 2048, 4096), count=20, seed=1234):
+    """Time powmod, invert and is_prime for every available arithmetic backend"""
+    results = []
+    for name in arith.BACKENDS:
+        backend = arith.get_backend(name)
+        for bits in bit_sizes:
+            rng = random.Random(seed)
+            modulus = rng.getrandbits(bits) | (1 << (bits - 1)) | 1
+            values = [rng.getrandbits(bits) for _ in range(count)]
+            row = {"backend": name, "bits": bits}
+            start = time.perf_counter()
+            for value in values:
+                backend.powmod(value, modulus - 2, modulus)
+            row["powmod_seconds"] = (time.perf_counter() - start) / count
+            start = time.perf_counter()
+            for value in values:
+                if backend.gcd(value, modulus) == 1:
+                    backend.invert(value, modulus)
+            row["invert_seconds"] = (time.perf_counter() - start) / count
+            start = time.perf_counter()
+            for value in values:
+                backend.is_prime(value | 1)
+            row["is_prime_seconds"] = (time.perf_counter() - start) / count
+            results.append(row)
+    return results
+
+
+def benchmark_inversion(bit_sizes=(512, 1024, 2048, 4096, 8192), count=200, seed=1234):
+    """Microbenchmark modular inversion: extended Euclid, pow(a, -1, m) and batch inversion"""
+    results = []
+    for bits in bit_sizes:
+        rng = random.Random(seed)
+        modulus = rng.getrandbits(bits) | (1 << (bits - 1)) | 1
+        values = [a for a in (rng.getrandbits(bits) for _ in range(count))
+                  if math.gcd(a, modulus) == 1]
+        backend = arith.PythonBackend()
+        timings = {}
+        start = time.perf_counter()
+        for value in values:
+            g, x, _ = arith.extended_gcd(value, modulus)
+            x % modulus
+        timings["extended_gcd"] = time.perf_counter() - start
+        start = time.perf_counter()
+        for value in values:
+            backend.invert(value, modulus)
+        timings["pow"] = time.perf_counter() - start
+        start = time.perf_counter()
+        backend.batch_invert(values, modulus)
+        timings["batch"] = time.perf_counter() - start
+        results.append({"bits": bits, "values": len(values),
+                        **{f"{name}_us": seconds / len(values) * 1e6
+                           for name, seconds in timings.items()}})
+    return results
+
+
+def benchmark_multiprime(bit_sizes=(3072, 4096), prime_counts=(2, 3, 4), count=20, seed=1234):
+    """Time key generation and CRT private-key operations for k-prime keys"""
+    results = []
+    for bits in bit_sizes:
+        for primes in prime_counts:
+            rsa = RSA_Implementation()
+            random.seed(seed)
+            start = time.perf_counter()
+            rsa.generate_keys(bits=bits, primes=primes)
+            keygen_seconds = time.perf_counter() - start
+            rng = random.Random(seed)
+            ciphertexts = [rng.randrange(2, rsa.n) for _ in range(count)]
+            start = time.perf_counter()
+            for c in ciphertexts:
+                rsa.private_operation(c)
+            results.append({
+                "bits": bits,
+                "primes": primes,
+                "keygen_seconds": keygen_seconds,
+                "private_op_seconds": (time.perf_counter() - start) / count,
+            })
+    return results
+
+
+def benchmark_verify(batch_sizes=(1, 10, 100, 1000, 10_000, 100_000), bits=2048, workers=None,
+                     seed=1234):
+    """Measure verify_many throughput in verifications/second for growing batch sizes"""
+    rsa = RSA_Implementation()
+    rsa.generate_keys(bits=bits, seed=seed, e=65537)
+    # Signing is the slow side, so a small set of signed messages is cycled through
+    messages = [f"message {i}".encode() for i in range(100)]
+    signed = [(message, rsa.sign(message)) for message in messages]
+    results = []
+    for size in batch_sizes:
+        pairs = [signed[i % len(signed)] for i in range(size)]
+        start = time.perf_counter()
+        valid = sum(rsa.verify_many(pairs, workers=workers))
+        elapsed = time.perf_counter() - start
+        assert valid == size
+        results.append({"batch": size, "seconds": elapsed,
+                        "verifications_per_second": size / elapsed})
+    return results
+
+
+def benchmark_keystore(sizes=(1_000, 10_000, 100_000, 1_000_000), sample=1000, bits=2048, seed=1234):
+    """Measure keystore insert and lookup latency as the store grows
+
+    The keys are public-only with random moduli, which is enough to exercise
+    the index and data file; one private key is looked up with the cache
+    disabled to time parsing and CRT setup.
+    """
+    rng = random.Random(seed)
+    rsa = RSA_Implementation()
+    rsa.e = 65537
+    rsa.private_key_crt = None
+    private = RSA_Implementation()
+    private.generate_keys(bits=bits, seed=seed, e=65537)
+    results = []
+    with tempfile.TemporaryDirectory() as path, KeyStore(path, cache_size=0) as store:
+        private_fingerprint = store.add(private)
+        fingerprints = []
+        for size in sizes:
+            insert_seconds = 0.0
+            while len(store) < size:
+                batch = min(sample, size - len(store))
+                moduli = [rng.getrandbits(bits) | 1 for _ in range(batch)]
+                start = time.perf_counter()
+                for n in moduli:
+                    rsa.n = n
+                    fingerprints.append(store.add(rsa))
+                insert_seconds = (time.perf_counter() - start) / batch
+            probes = [rng.choice(fingerprints) for _ in range(sample)]
+            start = time.perf_counter()
+            for fingerprint in probes:
+                store.public_key(fingerprint)
+            lookup_seconds = (time.perf_counter() - start) / sample
+            start = time.perf_counter()
+            for _ in range(sample // 10):
+                store.get(private_fingerprint)
+            private_seconds = (time.perf_counter() - start) / (sample // 10)
+            results.append({"keys": len(store), "insert_seconds": insert_seconds,
+                            "lookup_seconds": lookup_seconds,
+                            "private_load_seconds": private_seconds})
+    return results
+
+
+def benchmark_blinding(bit_sizes=(1024, 2048), count=200, repeats=5, seed=1234):
+    """Measure private operations unblinded, blinded with a fresh pair per call, and with cached pairs
+
+    The three variants are timed in turn repeats times and the best run of each
+    is kept, so that machine noise does not swamp the small blinding overhead.
+    """
+    results = []
+    for bits in bit_sizes:
+        rsa = RSA_Implementation()
+        rsa.generate_keys(bits=bits, seed=seed, e=65537)
+        rng = random.Random(seed)
+        ciphertexts = [rng.randrange(2, rsa.n) for _ in range(count)]
+        n = rsa.n
+        fresh_pairs = blinding.BlindingCache(n, rsa.e, rsa.arith)
+        cache = rsa.blinding_cache()
+        cache.prefill()
+        cache.start()
+
+        def unblinded():
+            rsa.blinding = False
+            for c in ciphertexts:
+                rsa.private_operation(c)
+
+        def fresh():
+            rsa.blinding = False
+            for c in ciphertexts:
+                blind, unblind, _ = fresh_pairs.fresh_pair()
+                rsa.private_operation(c * blind % n) * unblind % n
+
+        def cached():
+            rsa.blinding = True
+            for c in ciphertexts:
+                rsa.private_operation(c)
+
+        best = {}
+        for _ in range(repeats):
+            for name, fn in (("unblinded", unblinded), ("fresh", fresh), ("cached", cached)):
+                start = time.perf_counter()
+                fn()
+                elapsed = (time.perf_counter() - start) / count
+                best[name] = min(best.get(name, elapsed), elapsed)
+        cache.close()
+        results.append({
+            "bits": bits,
+            "unblinded_seconds": best["unblinded"],
+            "fresh_seconds": best["fresh"],
+            "cached_seconds": best["cached"],
+            "cache_misses": cache.misses,
+        })
+    return results
+
+
+def benchmark_key_objects(bits=2048, keys=8, copies=200, thread_counts=(1, 4, 8), signatures=400,
+                          seed=1234):
+    """Compare RSA_Implementation instances with PublicKey/PrivateKey values and RSAEngine
+
+    Memory is the traced allocation per loaded private key, big integers
+    included, with every copy unpickled from its own bytes so that nothing is
+    shared between copies. Throughput signs round-robin over the keys from each
+    thread: before, every thread loads its own RSA_Implementation per key since
+    the instances are mutable; after, all threads share one engine and one
+    PrivateKey per key.
+    """
+    import pickle
+    import threading
+    import tracemalloc
+    from .engine import RSAEngine
+    from .keys import PrivateKey
+    states = []
+    for i in range(keys):
+        rsa = RSA_Implementation()
+        rsa.generate_keys(bits=bits, seed=seed + i, e=65537)
+        states.append(rsa._key_state())
+    blob = pickle.dumps(states[0])
+
+    def per_key_bytes(load):
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        loaded = [load(pickle.loads(blob)) for _ in range(copies)]
+        used = tracemalloc.get_traced_memory()[0] - before
+        tracemalloc.stop()
+        del loaded
+        return used / copies
+
+    def as_private_key(state):
+        n, e, d, crt, crt_extra = state[2], state[3], state[4], state[5], state[7]
+        return PrivateKey._from_parameters(PublicKey(n, e), d, crt, crt_extra)
+
+    instance_bytes = per_key_bytes(RSA_Implementation._from_key_state)
+    key_bytes = per_key_bytes(as_private_key)
+    shared_keys = [as_private_key(state) for state in states]
+    engine = RSAEngine()
+    message = b"key objects benchmark"
+
+    def run(threads, work):
+        per_thread = signatures // threads
+        workers = [threading.Thread(target=work, args=(per_thread,)) for _ in range(threads)]
+        start = time.perf_counter()
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        return per_thread * threads / (time.perf_counter() - start)
+
+    def with_instances(count):
+        own = [RSA_Implementation._from_key_state(state) for state in states]
+        for i in range(count):
+            own[i % keys].sign(message)
+
+    def with_engine(count):
+        for i in range(count):
+            engine.sign(shared_keys[i % keys], message)
+
+    throughput = []
+    for threads in thread_counts:
+        throughput.append({
+            "threads": threads,
+            "instances_per_second": run(threads, with_instances),
+            "engine_per_second": run(threads, with_engine),
+        })
+    return {
+        "bits": bits,
+        "keys": keys,
+        "instance_bytes": instance_bytes,
+        "key_bytes": key_bytes,
+        "throughput": throughput,
+    }
+
+
+def measure_cold_start(runs=5):
+    """Time a fresh interpreter running the CLI and check that tkinter stays unloaded"""
+    command = [sys.executable, "-m", "rsa_algorithm", "--help"]
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(command, check=True, stdout=subprocess.DEVNULL)
+        timings.append(time.perf_counter() - start)
+    probe = subprocess.run(
+        [sys.executable, "-c", "import sys, rsa_algorithm.cli; print('tkinter' in sys.modules)"],
+        check=True, capture_output=True, text=True)
+    return {
+        "runs": runs,
+        "best_seconds": min(timings),
+        "mean_seconds": sum(timings) / runs,
+        "imports_tkinter": probe.stdout.strip() == "True",
+    }
+
+
+SUITE_VERSION = 1
+SUITE_SEED = 1234
+DEFAULT_THRESHOLD = 0.10
+
+
+def _time_case(fn, repeats, seed):
+    """Run fn repeats times from the same random state and return its timings"""
+    timings = []
+    for _ in range(repeats):
+        random.seed(seed)
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return {"min_seconds": min(timings), "median_seconds": statistics.median(timings),
+            "runs": repeats}
+
+
+def benchmark_suite(bit_sizes=(512, 1024, 2048), message_lengths=(16, 256, 4096), repeats=3,
+                    seed=SUITE_SEED, candidates=100, inversions=1000):
+    """Time every primitive across key sizes and message lengths from a fixed seed
+
+    Every run starts from the same random state, so each case does identical
+    work each time it is timed and across invocations on the same machine.
+    """
+    rsa = RSA_Implementation()
+    cases = {}
+    for bits in bit_sizes:
+        rng = random.Random(seed)
+        odd = [primality.random_odd(bits // 2, rng) for _ in range(candidates)]
+        cases[f"is_prime/{bits}"] = _time_case(
+            lambda: [rsa.is_prime(candidate) for candidate in odd], repeats, seed)
+        cases[f"generate_prime/{bits}"] = _time_case(
+            lambda: rsa.generate_prime_bits(bits // 2, random.Random(seed)), repeats, seed)
+        cases[f"generate_keys/{bits}"] = _time_case(
+            lambda: rsa.generate_keys(bits=bits, seed=seed, e=65537), repeats, seed)
+        values = []
+        while len(values) < inversions:
+            value = rng.randrange(2, rsa.phi_n)
+            if math.gcd(value, rsa.phi_n) == 1:
+                values.append(value)
+        cases[f"mod_inverse/{bits}"] = _time_case(
+            lambda: [rsa.mod_inverse(value, rsa.phi_n) for value in values], repeats, seed)
+        for length in message_lengths:
+            message = "".join(chr(rng.randrange(32, 127)) for _ in range(length))
+            encrypted = rsa.encrypt(message)[0]
+
+            def encrypt():
+                rsa.symbol_cache.clear()
+                rsa.encrypt(message)
+
+            def decrypt():
+                rsa.symbol_cache.clear()
+                rsa.decrypt(encrypted)
+
+            cases[f"encrypt/{bits}/{length}"] = _time_case(encrypt, repeats, seed)
+            cases[f"decrypt/{bits}/{length}"] = _time_case(decrypt, repeats, seed)
+    return {
+        "version": SUITE_VERSION,
+        "seed": seed,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "backend": rsa.arith.name,
+        "cases": cases,
+    }
+
+
+def compare_to_baseline(results, baseline, threshold=DEFAULT_THRESHOLD):
+    """Return the cases whose best time grew by more than threshold over the baseline"""
+    if baseline.get("version") != results["version"] or baseline.get("seed") != results["seed"]:
+        raise ValueError("The baseline was recorded with a different suite version or seed")
+    if baseline.get("backend") != results["backend"]:
+        raise ValueError(f"The baseline was recorded with the {baseline.get('backend')} backend, "
+                         f"not {results['backend']}")
+    regressions = []
+    for name, case in results["cases"].items():
+        before = baseline["cases"].get(name)
+        if before is None:
+            continue
+        change = case["min_seconds"] / before["min_seconds"] - 1
+        if change > threshold:
+            regressions.append({"case": name, "baseline_seconds": before["min_seconds"],
+                                "seconds": case["min_seconds"], "change": change})
+    return regressions
+
+
+def run_suite(json_path=None, baseline_path=None, threshold=DEFAULT_THRESHOLD, repeats=3):
+    """Run the suite, optionally save it as JSON and check it against a baseline
+
+    Returns 1 if any case regressed beyond threshold, 0 otherwise.
+    """
+    results = benchmark_suite(repeats=repeats)
+    # Keep standard output clean when the JSON goes there
+    out = sys.stderr if json_path == "-" else sys.stdout
+    for name, case in results["cases"].items():
+        print(f"  {name:<22} {case['min_seconds'] * 1000:10.3f} ms", file=out)
+    if json_path == "-":
+        json.dump(results, sys.stdout, indent=2)
+        print()
+    elif json_path:
+        with open(json_path, "w") as f:
+            json.dump(results, f, indent=2)
+    if baseline_path is None:
+        return 0
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+    regressions = compare_to_baseline(results, baseline, threshold)
+    for field in ("python", "machine"):
+        if baseline.get(field) != results[field]:
+            print(f"warning: the baseline was recorded on {field} {baseline.get(field)}, "
+                  f"this run is on {results[field]}", file=sys.stderr)
+    for row in regressions:
+        print(f"regression: {row['case']} {row['baseline_seconds'] * 1000:.3f} ms -> "
+              f"{row['seconds'] * 1000:.3f} ms (+{row['change']:.0%})", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+def report_primality():
+    print("Primality test throughput (random odd candidates)")
+    for row in benchmark_primality():
+        print(f"  {row['mode']:>13} {row['bits']:>5} bits: "
+              f"{row['candidates_per_second']:>10.1f} candidates/s "
+              f"({row['primes']} primes in {row['candidates']} candidates)")
+
+
+def report_prime_search():
+    print("Prime search, random draw vs incremental sieve")
+    for row in benchmark_prime_search():
+        print(f"  {row['bits']:>5} bits: random {row['random_seconds'] * 1000:.1f} ms, "
+              f"incremental {row['incremental_seconds'] * 1000:.1f} ms "
+              f"({row['speedup']:.1f}x)")
+
+
+def report_crt():
+    print("Private-key operation, plain vs CRT")
+    for row in benchmark_crt_decrypt():
+        print(f"  {row['bits']:>5} bits: plain {row['plain_seconds'] * 1000:.2f} ms, "
+              f"CRT {row['crt_seconds'] * 1000:.2f} ms ({row['speedup']:.1f}x)")
+
+
+def report_block_mode():
+    row = benchmark_block_mode()
+    print(f"Encryption throughput, {row['bits']}-bit key, {row['message_bytes']} byte message")
+    print(f"  per-character: encrypt {row['char_encrypt_mb_s']:.4f} MB/s, "
+          f"decrypt {row['char_decrypt_mb_s']:.4f} MB/s")
+    print(f"  block mode:    encrypt {row['block_encrypt_mb_s']:.4f} MB/s, "
+          f"decrypt {row['block_decrypt_mb_s']:.4f} MB/s")
+
+
+def report_parallel_keygen():
+    print("Seeded key generation across a process pool")
+    for row in benchmark_parallel_keygen():
+        print(f"  {row['bits']:>5} bits, {row['workers']} workers: {row['seconds']:.2f} s")
+
+
+def report_batch():
+    print("Batch decrypt_many scaling (1024-bit key, block mode)")
+    for row in benchmark_batch_scaling():
+        print(f"  {row['workers']:>3} workers: {row['messages_per_second']:>8.1f} messages/s")
+
+
+def report_vectorized():
+    row = benchmark_vectorized()
+    print(f"Per-character round trip, {row['modulus_bits']}-bit modulus, {row['chars']} chars")
+    if not row["numpy"]:
+        print("  NumPy is not installed; both runs used Python ints")
+    print(f"  python ints: {row['python_seconds'] * 1000:.1f} ms, "
+          f"vectorized: {row['vectorized_seconds'] * 1000:.1f} ms")
+
+
+def report_backends():
+    print("Arithmetic backends (per operation)")
+    for row in benchmark_backends():
+        print(f"  {row['backend']:>6} {row['bits']:>5} bits: "
+              f"powmod {row['powmod_seconds'] * 1000:8.3f} ms, "
+              f"invert {row['invert_seconds'] * 1000:8.3f} ms, "
+              f"is_prime {row['is_prime_seconds'] * 1000:8.3f} ms")
+
+
+def report_inversion():
+    print("Modular inversion, microseconds per value (Python backend)")
+    for row in benchmark_inversion():
+        print(f"  {row['bits']:>5} bits: extended Euclid {row['extended_gcd_us']:9.1f}, "
+              f"pow(a, -1, m) {row['pow_us']:9.1f}, batch {row['batch_us']:9.1f}")
+
+
+def report_multiprime():
+    print("Multi-prime keys: key generation and CRT private-key operation")
+    for row in benchmark_multiprime():
+        print(f"  {row['bits']:>5} bits, k = {row['primes']}: keygen {row['keygen_seconds']:6.2f} s, "
+              f"private op {row['private_op_seconds'] * 1000:7.2f} ms")
+
+
+def report_verify():
+    print("Signature verification with verify_many (2048-bit key, e = 65537)")
+    for row in benchmark_verify():
+        print(f"  batch {row['batch']:>7}: {row['verifications_per_second']:>10.1f} verifications/s")
+
+
+def report_keystore():
+    print("Keystore latency as it grows (microseconds per operation)")
+    for row in benchmark_keystore():
+        print(f"  {row['keys']:>9} keys: insert {row['insert_seconds'] * 1e6:7.1f}, "
+              f"public lookup {row['lookup_seconds'] * 1e6:7.1f}, "
+              f"private load {row['private_load_seconds'] * 1e6:7.1f}")
+
+
+def report_blinding():
+    print("Private-key operation with and without blinding (microseconds per operation)")
+    for row in benchmark_blinding():
+        base = row["unblinded_seconds"]
+        print(f"  {row['bits']:>5} bits: unblinded {base * 1e6:8.1f}, "
+              f"fresh pair per call {row['fresh_seconds'] * 1e6:8.1f} "
+              f"({(row['fresh_seconds'] - base) * 1e6:+.1f}), "
+              f"cached pairs {row['cached_seconds'] * 1e6:8.1f} "
+              f"({(row['cached_seconds'] - base) * 1e6:+.1f}, {row['cache_misses']} misses)")
+
+
+def report_key_objects():
+    row = benchmark_key_objects()
+    print(f"RSA_Implementation vs PrivateKey and RSAEngine ({row['bits']}-bit keys)")
+    print(f"  memory per loaded key: instance {row['instance_bytes']:.0f} bytes, "
+          f"PrivateKey {row['key_bytes']:.0f} bytes")
+    for entry in row["throughput"]:
+        print(f"  {entry['threads']:>3} threads, {row['keys']} keys: "
+              f"per-thread instances {entry['instances_per_second']:8.1f} signatures/s, "
+              f"shared engine {entry['engine_per_second']:8.1f} signatures/s")
+
+
+def report_cold_start():
+    row = measure_cold_start()
+    print("CLI cold start (python -m rsa_algorithm --help)")
+    print(f"  best {row['best_seconds'] * 1000:.1f} ms, mean {row['mean_seconds'] * 1000:.1f} ms "
+          f"over {row['runs']} runs, tkinter imported: {row['imports_tkinter']}")
+
+
+REPORTS = {
+    "primality": report_primality,
+    "prime-search": report_prime_search,
+    "crt": report_crt,
+    "block-mode": report_block_mode,
+    "parallel-keygen": report_parallel_keygen,
+    "batch": report_batch,
+    "vectorized": report_vectorized,
+    "backends": report_backends,
+    "inversion": report_inversion,
+    "multiprime": report_multiprime,
+    "verify": report_verify,
+    "keystore": report_keystore,
+    "blinding": report_blinding,
+    "key-objects": report_key_objects,
+    "cold-start": report_cold_start,
+}
+
+
+def main(names=None):
+    """Run the selected benchmarks (all by default) and print a short report"""
+    for name in names or REPORTS:
+        REPORTS[name]()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,111 @@
+import secrets
+import threading
+from collections import deque
+
+DEFAULT_POOL_SIZE = 4
+
+# A pair is squared after each use and replaced by a fresh one after this many
+# uses, so a long run of operations never shares one predictable sequence
+DEFAULT_REFRESH_USES = 32
+
+# The refill thread exits after this long with a full pool and starts again when needed
+IDLE_SECONDS = 1.0
+
+
+class BlindingCache:
+    """Pool of RSA blinding pairs (r^e mod n, r^-1 mod n) for one key
+
+    Blinding runs the private operation on c * r^e and multiplies the result by
+    r^-1, so its timing no longer depends on the ciphertext the caller chose.
+    A fresh pair costs a modexp and an inversion, so pairs are made ahead of
+    time on a background thread. Between uses a pair is squared in place,
+    (r^e)^2 and (r^-1)^2 being the pair for r^2, which costs two modular
+    multiplications. A pair retires after refresh_uses uses. If the pool ever
+    runs dry, a pair is made inline and counted in misses.
+    """
+
+    def __init__(self, n, e, arith, size=DEFAULT_POOL_SIZE, refresh_uses=DEFAULT_REFRESH_USES):
+        self.n = n
+        self.e = e
+        self.arith = arith
+        self.size = size
+        self.refresh_uses = refresh_uses
+        self.hits = 0
+        self.misses = 0
+        self._pairs = deque()  # [r^e, r^-1, uses]
+        self._lock = threading.Lock()
+        self._wanted = threading.Condition(self._lock)
+        self._thread = None
+        self._closed = False
+
+    def fresh_pair(self):
+        """Draw a random r coprime to n and return [r^e mod n, r^-1 mod n, 0]"""
+        while True:
+            r = secrets.randbelow(self.n - 2) + 2
+            try:
+                r_inv = self.arith.invert(r, self.n)
+            except ValueError:
+                continue
+            return [self.arith.powmod(r, self.e, self.n), r_inv, 0]
+
+    def _refill(self):
+        """Background thread: keep the pool at size fresh pairs"""
+        while True:
+            with self._lock:
+                while not self._closed and len(self._pairs) >= self.size:
+                    if not self._wanted.wait(IDLE_SECONDS) and len(self._pairs) >= self.size:
+                        self._thread = None
+                        return
+                if self._closed:
+                    self._thread = None
+                    return
+            pair = self.fresh_pair()
+            with self._lock:
+                self._pairs.append(pair)
+
+    def prefill(self):
+        """Fill the pool now on the calling thread"""
+        with self._lock:
+            missing = self.size - len(self._pairs)
+        for _ in range(missing):
+            pair = self.fresh_pair()
+            with self._lock:
+                self._pairs.append(pair)
+
+    def start(self):
+        """Start the background thread that fills the pool, unless it is already running"""
+        with self._lock:
+            if self._thread is None and not self._closed:
+                self._thread = threading.Thread(target=self._refill, daemon=True,
+                                                name="rsa-blinding-refill")
+                self._thread.start()
+
+    def take(self):
+        """Return (r^e, r^-1) for one private operation"""
+        blind = None
+        with self._lock:
+            if self._pairs:
+                self.hits += 1
+                blind, unblind, uses = self._pairs.popleft()
+                if uses + 1 < self.refresh_uses:
+                    # Square for next time and put the pair back at the end of the queue
+                    n = self.n
+                    self._pairs.append([blind * blind % n, unblind * unblind % n, uses + 1])
+                    return blind, unblind
+            else:
+                self.misses += 1
+            # A pair retired or the pool is empty, so the refill thread has work
+            running = self._thread is not None
+            if running:
+                self._wanted.notify()
+        if not running:
+            self.start()
+        if blind is None:
+            blind, unblind, _ = self.fresh_pair()
+        return blind, unblind
+
+    def close(self):
+        """Stop the background thread"""
+        with self._lock:
+            self._closed = True
+            self._wanted.notify()
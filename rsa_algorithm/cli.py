@@ -0,0 +1,206 @@
+import argparse
+import sys
+
+from . import stream
+from .core import RSA_Implementation
+
+
+def load_rsa(path):
+    """Create an RSA_Implementation holding the key stored at path"""
+    rsa = RSA_Implementation()
+    rsa.load_keys(path)
+    return rsa
+
+
+def read_input(path, mode="rb"):
+    """Read a whole input file, with '-' meaning standard input"""
+    if path == "-":
+        return sys.stdin.buffer.read() if "b" in mode else sys.stdin.read()
+    with open(path, mode) as f:
+        return f.read()
+
+
+def write_output(path, data):
+    """Write bytes or text to a file, with '-' meaning standard output"""
+    if path == "-":
+        if isinstance(data, bytes):
+            sys.stdout.buffer.write(data)
+        else:
+            sys.stdout.write(data)
+        return
+    with open(path, "wb" if isinstance(data, bytes) else "w") as f:
+        f.write(data)
+
+
+def cmd_keygen(args):
+    rsa = RSA_Implementation()
+    rsa.generate_keys(bits=args.bits, workers=args.workers, seed=args.seed)
+    rsa.save_keys(args.key)
+    if args.public:
+        rsa.save_keys(args.public, include_private=False)
+
+
+def cmd_encrypt(args):
+    rsa = load_rsa(args.key)
+    write_output(args.output, rsa.encrypt_blocks(read_input(args.input, "r")))
+
+
+def cmd_decrypt(args):
+    rsa = load_rsa(args.key)
+    write_output(args.output, rsa.decrypt_blocks(read_input(args.input)))
+
+
+def cmd_sign(args):
+    rsa = load_rsa(args.key)
+    write_output(args.signature, rsa.sign(read_input(args.input)))
+
+
+def cmd_verify(args):
+    rsa = load_rsa(args.key)
+    valid = rsa.verify(read_input(args.input), read_input(args.signature))
+    print("valid" if valid else "invalid")
+    return 0 if valid else 1
+
+
+def cmd_encrypt_file(args):
+    stream.encrypt_file(load_rsa(args.key), args.input, args.output, args.chunk_size)
+
+
+def cmd_decrypt_file(args):
+    stream.decrypt_file(load_rsa(args.key), args.input, args.output)
+
+
+def cmd_bench(args):
+    from . import bench
+    if args.json or args.baseline:
+        if args.names:
+            raise ValueError("--json and --baseline run the regression suite, not named benchmarks")
+        return bench.run_suite(args.json, args.baseline, args.threshold, args.repeats)
+    unknown = [name for name in args.names if name not in bench.REPORTS]
+    if unknown:
+        raise ValueError(f"unknown benchmark {unknown[0]!r}; choose from {', '.join(bench.REPORTS)}")
+    bench.main(args.names)
+
+
+def cmd_serve(args):
+    import asyncio
+    from . import service
+    rsa = load_rsa(args.key)
+    server = service.RSAService(rsa, workers=args.workers, window=args.window_ms / 1000,
+                                max_batch=args.max_batch)
+    try:
+        asyncio.run(server.serve_forever(args.socket, port=args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+def cmd_loadgen(args):
+    import asyncio
+    from . import service
+    row = asyncio.run(service.load_test(args.socket, port=args.port, op=args.op,
+                                        requests=args.requests, concurrency=args.concurrency,
+                                        message_bytes=args.bytes, deadline_ms=args.deadline_ms))
+    print(f"{row['op']}: {row['requests']} requests, concurrency {row['concurrency']}, "
+          f"{row['errors']} errors, {row['requests_per_second']:.1f} requests/s")
+    print(f"  p50 {row['p50_seconds'] * 1000:.2f} ms, p99 {row['p99_seconds'] * 1000:.2f} ms, "
+          f"max {row['max_seconds'] * 1000:.2f} ms")
+
+
+def cmd_gui(args):
+    from . import gui
+    gui.main()
+
+
+def build_parser():
+    """Build the argument parser with one subcommand per operation"""
+    parser = argparse.ArgumentParser(prog="python -m rsa_algorithm",
+                                     description="RSA command line tools")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    keygen = commands.add_parser("keygen", help="generate a keypair")
+    keygen.add_argument("key", help="path of the private key file to write")
+    keygen.add_argument("--public", help="also write the public key to this path")
+    keygen.add_argument("--bits", type=int, default=2048)
+    keygen.add_argument("--workers", type=int, default=1)
+    keygen.add_argument("--seed")
+    keygen.set_defaults(func=cmd_keygen)
+
+    encrypt = commands.add_parser("encrypt", help="block-encrypt a UTF-8 text")
+    encrypt.add_argument("key", help="public or private key file")
+    encrypt.add_argument("input", help="text file, or - for standard input")
+    encrypt.add_argument("output", help="ciphertext file, or - for standard output")
+    encrypt.set_defaults(func=cmd_encrypt)
+
+    decrypt = commands.add_parser("decrypt", help="decrypt the output of encrypt")
+    decrypt.add_argument("key", help="private key file")
+    decrypt.add_argument("input", help="ciphertext file, or - for standard input")
+    decrypt.add_argument("output", help="text file, or - for standard output")
+    decrypt.set_defaults(func=cmd_decrypt)
+
+    sign = commands.add_parser("sign", help="sign a file")
+    sign.add_argument("key", help="private key file")
+    sign.add_argument("input", help="file to sign, or - for standard input")
+    sign.add_argument("signature", help="signature file to write, or - for standard output")
+    sign.set_defaults(func=cmd_sign)
+
+    verify = commands.add_parser("verify", help="verify a signature; exits 1 if invalid")
+    verify.add_argument("key", help="public or private key file")
+    verify.add_argument("input", help="signed file, or - for standard input")
+    verify.add_argument("signature", help="signature file")
+    verify.set_defaults(func=cmd_verify)
+
+    encrypt_file = commands.add_parser("encrypt-file", help="hybrid RSA-KEM file encryption")
+    encrypt_file.add_argument("key", help="public or private key file")
+    encrypt_file.add_argument("input")
+    encrypt_file.add_argument("output")
+    encrypt_file.add_argument("--chunk-size", type=int, default=stream.DEFAULT_CHUNK_SIZE)
+    encrypt_file.set_defaults(func=cmd_encrypt_file)
+
+    decrypt_file = commands.add_parser("decrypt-file", help="decrypt a file from encrypt-file")
+    decrypt_file.add_argument("key", help="private key file")
+    decrypt_file.add_argument("input")
+    decrypt_file.add_argument("output")
+    decrypt_file.set_defaults(func=cmd_decrypt_file)
+
+    bench = commands.add_parser("bench", help="run the benchmarks")
+    bench.add_argument("names", nargs="*", help="benchmarks to run (default: all)")
+    bench.add_argument("--json", help="run the regression suite and write its results here (- for stdout)")
+    bench.add_argument("--baseline", help="run the regression suite and compare it with this JSON file")
+    bench.add_argument("--threshold", type=float, default=0.10,
+                       help="slowdown that counts as a regression (default: 0.10)")
+    bench.add_argument("--repeats", type=int, default=3, help="timed runs per suite case")
+    bench.set_defaults(func=cmd_bench)
+
+    serve = commands.add_parser("serve", help="serve encrypt/decrypt/sign/verify requests")
+    serve.add_argument("key", help="private key file")
+    serve.add_argument("--socket", help="Unix socket path (default: TCP on 127.0.0.1)")
+    serve.add_argument("--port", type=int, default=8765)
+    serve.add_argument("--workers", type=int, help="worker processes (default: CPU count)")
+    serve.add_argument("--window-ms", type=float, default=2.0, help="batching window")
+    serve.add_argument("--max-batch", type=int, default=256)
+    serve.set_defaults(func=cmd_serve)
+
+    loadgen = commands.add_parser("loadgen", help="measure the latency of a running service")
+    loadgen.add_argument("--socket", help="Unix socket path (default: TCP on 127.0.0.1)")
+    loadgen.add_argument("--port", type=int, default=8765)
+    loadgen.add_argument("--op", choices=("encrypt", "decrypt", "sign", "verify"), default="sign")
+    loadgen.add_argument("--requests", type=int, default=1000)
+    loadgen.add_argument("--concurrency", type=int, default=64)
+    loadgen.add_argument("--bytes", type=int, default=64, help="message size")
+    loadgen.add_argument("--deadline-ms", type=float)
+    loadgen.set_defaults(func=cmd_loadgen)
+
+    gui = commands.add_parser("gui", help="start the desktop demonstration")
+    gui.set_defaults(func=cmd_gui)
+
+    return parser
+
+
+def main(argv=None):
+    """Entry point of the command line interface"""
+    args = build_parser().parse_args(argv)
+    try:
+        return args.func(args) or 0
+    except (OSError, ValueError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
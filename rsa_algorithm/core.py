@@ -0,0 +1,781 @@
+import functools
+import hashlib
+import json
+import math
+import mmap
+import os
+import random
+import threading
+from collections import OrderedDict
+
+from . import arith, batch, blinding, keygen, primality, serialization, vectorized
+from .keys import PrivateKey, PublicKey
+from .metrics import NULL_METRICS, InstrumentedBackend, Metrics, profiled
+from .symbolcache import DEFAULT_MAX_BYTES, SymbolCache
+from .tracing import NULL_TRACER
+
+# Below this bound the small prime table in the primality module decides exactly,
+# so the simple 6k±1 trial division is kept for the demonstration-sized numbers
+TRIAL_DIVISION_LIMIT = primality.SMALL_PRIME_LIMIT * primality.SMALL_PRIME_LIMIT
+
+# DER DigestInfo prefix for SHA-256 used by PKCS#1 v1.5 signatures
+SHA256_DIGEST_INFO = bytes.fromhex("3031300d060960864801650304020105000420")
+SHA256_SIZE = hashlib.sha256().digest_size
+
+# The first entry of common_e_values, F4 = 2^16 + 1
+F4 = 65537
+
+# Key file formats accepted by save_keys
+FORMAT_JSON = "json"
+FORMAT_PEM = "pem"
+FORMAT_DER = "der"
+
+# Keys a batch worker thread keeps loaded between chunks, see worker_instance
+WORKER_KEY_CACHE_SIZE = 8
+
+def crt_private_operation(c, crt, crt_extra, powmod=pow):
+    """Compute c^d mod n from (p, q, dP, dQ, qInv) and the multi-prime (r_i, d_i, t_i) triples"""
+    p, q, dP, dQ, q_inv = crt
+    m1 = powmod(c, dP, p)
+    m2 = powmod(c, dQ, q)
+    h = q_inv * (m1 - m2) % p
+    m = m2 + h * q
+    
+    # Fold in the remaining primes of a multi-prime key one at a time
+    product = p * q
+    for prime, d_i, t_i in crt_extra:
+        m_i = powmod(c, d_i, prime)
+        h = (m_i - m) * t_i % prime
+        m += product * h
+        product *= prime
+    return m
+
+
+def signature_encoding(message, size):
+    """EMSA-PKCS1-v1_5 encoding of the SHA-256 hash of message into size bytes"""
+    if isinstance(message, str):
+        message = message.encode("utf-8")
+    digest_info = SHA256_DIGEST_INFO + hashlib.sha256(message).digest()
+    if size < len(digest_info) + 11:
+        raise ValueError("Modulus is too small for PKCS#1 v1.5 SHA-256 signatures")
+    padding = b"\xff" * (size - len(digest_info) - 3)
+    return b"\x00\x01" + padding + b"\x00" + digest_info
+
+
+def pad_message(message, plain_size):
+    """UTF-8 encode message and pad it with 0x80 then zeros to whole plaintext blocks"""
+    # The 0x80 marker keeps the length recoverable when the padding is stripped
+    data = message.encode("utf-8") + b"\x80"
+    return data + b"\x00" * (-len(data) % plain_size)
+
+
+def unpad_message(data):
+    """Strip the padding added by pad_message and decode the UTF-8 text"""
+    end = bytes(data).rstrip(b"\x00")
+    if not end or end[-1] != 0x80:
+        raise ValueError("Invalid block padding")
+    return end[:-1].decode("utf-8")
+
+
+def modulus_block_sizes(n):
+    """Return (plaintext, ciphertext) block sizes in bytes for modulus n"""
+    plain_size = (n.bit_length() - 1) // 8  # largest byte count whose values all stay below n
+    cipher_size = (n.bit_length() + 7) // 8
+    if plain_size < 1:
+        raise ValueError("Modulus is too small for block mode")
+    return plain_size, cipher_size
+
+
+def block_encrypt(message, n, e, powmod=pow):
+    """Encrypt a message as UTF-8 bytes packed into as few modulus-sized blocks as possible"""
+    plain_size, cipher_size = modulus_block_sizes(n)
+    data = pad_message(message, plain_size)
+    encrypted = bytearray()
+    for start in range(0, len(data), plain_size):
+        m = int.from_bytes(data[start:start + plain_size], "big")
+        encrypted += powmod(m, e, n).to_bytes(cipher_size, "big")
+    return bytes(encrypted)
+
+
+def block_decrypt(encrypted, n, private_operation):
+    """Decrypt the bytes produced by block_encrypt, computing c^d mod n with private_operation"""
+    plain_size, cipher_size = modulus_block_sizes(n)
+    if len(encrypted) % cipher_size:
+        raise ValueError("Ciphertext length is not a multiple of the block size")
+    limit = 1 << (8 * plain_size)
+    decrypted = bytearray()
+    for start in range(0, len(encrypted), cipher_size):
+        c = int.from_bytes(encrypted[start:start + cipher_size], "big")
+        if c >= n:
+            raise ValueError("Invalid ciphertext block")
+        m = private_operation(c)
+        # A wrong key or a corrupted block decrypts to a value too wide for a block
+        if m >= limit:
+            raise ValueError("Invalid block padding")
+        decrypted += m.to_bytes(plain_size, "big")
+    return unpad_message(decrypted)
+
+
+@functools.lru_cache(maxsize=16)
+def _signature_prefix(size):
+    """signature_encoding of an all-zero digest as an int, for the e = F4 fast path"""
+    zero_digest = signature_encoding(b"", size)[:-SHA256_SIZE] + bytes(SHA256_SIZE)
+    return int.from_bytes(zero_digest, "big")
+
+
+def verify_signature(message, signature, n, e, powmod=pow):
+    """Check a PKCS#1 v1.5 SHA-256 signature of message against the public key (n, e)"""
+    size = (n.bit_length() + 7) // 8
+    if len(signature) != size:
+        return False
+    s = int.from_bytes(signature, "big")
+    if s >= n:
+        return False
+    if e != F4:
+        return powmod(s, e, n).to_bytes(size, "big") == signature_encoding(message, size)
+    
+    # Fast path for e = F4: compare integers against the cached padding prefix
+    # instead of re-encoding the padding and converting s^e back to bytes
+    if isinstance(message, str):
+        message = message.encode("utf-8")
+    expected = _signature_prefix(size) | int.from_bytes(hashlib.sha256(message).digest(), "big")
+    return powmod(s, F4, n) == expected
+
+
+def _json_key_field(data, name, default=None):
+    """Read an integer field of a JSON key, naming the field when it is missing or malformed"""
+    value = data.get(name, default) if isinstance(data, dict) else default
+    if value is None:
+        raise ValueError(f"JSON key is missing the field {name!r}")
+    if isinstance(value, bool) or not isinstance(value, int) or value < 0:
+        raise ValueError(f"JSON key field {name!r} must be a non-negative integer")
+    return value
+
+
+class RSA_Implementation:
+    def __init__(self, primality_rounds=primality.DEFAULT_ROUNDS,
+                 primality_mode=primality.MODE_MILLER_RABIN,
+                 search_mode=primality.SEARCH_INCREMENTAL,
+                 symbol_cache_bytes=DEFAULT_MAX_BYTES, vectorize=True, backend=None,
+                 blinding=False):
+        """Initialize the RSA implementation with default values"""
+        self.arith = backend or arith.BACKEND  # Big-integer arithmetic (Python ints or gmpy2)
+        self.primality_rounds = primality_rounds
+        self.primality_mode = primality_mode
+        self.search_mode = search_mode
+        self.p = 0
+        self.q = 0
+        self.n = 0
+        self.phi_n = 0
+        self.e = 0
+        self.d = 0
+        self.public_key = (0, 0)
+        self.private_key = (0, 0)
+        self.private_key_crt = None  # (p, q, dP, dQ, qInv) for CRT private operations
+        self.extra_primes = ()  # r_3 ... r_k of a multi-prime key
+        self.private_key_crt_extra = ()  # (r_i, d_i, t_i) for every extra prime
+        self.steps = NULL_TRACER  # Step-by-step details, recorded only when a tracer is given
+        self.symbol_cache = SymbolCache(symbol_cache_bytes, self.arith.powmod)  # Per-character tables
+        self.vectorize = vectorize  # Use the NumPy backend for small moduli when available
+        self.metrics = NULL_METRICS  # Counters and timings, see enable_metrics
+        self.blinding = blinding  # Blind every private-key operation
+        self._blinding = None  # BlindingCache of the current key
+        
+    def __getstate__(self):
+        # The blinding pool holds a lock and a thread; a copy makes its own
+        state = self.__dict__.copy()
+        state["_blinding"] = None
+        return state
+        
+    def enable_metrics(self, metrics=None):
+        """Start counting prime candidates, Miller-Rabin rounds, modexps and bytes processed"""
+        self.disable_metrics()
+        self.metrics = metrics or Metrics()
+        self.arith = InstrumentedBackend(self.arith, self.metrics)
+        self._rebind_backend()
+        return self.metrics
+    
+    def disable_metrics(self):
+        """Stop recording and go back to the uninstrumented backend"""
+        if isinstance(self.arith, InstrumentedBackend):
+            self.arith = self.arith.inner
+            self._rebind_backend()
+        self.metrics = NULL_METRICS
+    
+    def _rebind_backend(self):
+        """Point the caches that hold on to the arithmetic backend at the current one"""
+        self.symbol_cache.powmod = self.arith.powmod
+        if self._blinding is not None:
+            self._blinding.arith = self.arith
+    
+    def metrics_snapshot(self):
+        """Return the recorded counters and timing histograms as a plain dict"""
+        return self.metrics.snapshot()
+    
+    def profile(self, cpu=True, memory=False):
+        """Context manager running its block under cProfile and/or tracemalloc"""
+        return profiled(cpu, memory)
+        
+    def is_prime(self, num):
+        """Check if a number is prime, using a probabilistic test for large numbers"""
+        if num >= TRIAL_DIVISION_LIMIT:
+            return self.arith.is_prime(num, self.primality_rounds, self.primality_mode)
+        if num <= 1:
+            return False
+        if num <= 3:
+            return True
+        if num % 2 == 0 or num % 3 == 0:
+            return False
+        i = 5
+        while i * i <= num:
+            if num % i == 0 or num % (i + 2) == 0:
+                return False
+            i += 6
+        return True
+    
+    def generate_prime(self, min_val=100, max_val=1000, rng=None):
+        """Generate a random prime number within the given range
+        
+        Candidates come from the OS CSPRNG; pass rng (e.g. random.Random(seed)) for a
+        reproducible search.
+        """
+        rng = rng or primality.SYSTEM_RANDOM
+        if (self.search_mode == primality.SEARCH_INCREMENTAL
+                and min_val > primality.SIEVE_PRIMES[-1] and max_val >= TRIAL_DIVISION_LIMIT):
+            return primality.incremental_prime_search(min_val, max_val, self._strong_test, rng)
+        while True:
+            num = rng.randint(min_val, max_val)
+            if num >= TRIAL_DIVISION_LIMIT:
+                # Even numbers are never prime at this size, so skip them
+                num |= 1
+                if num > max_val:
+                    continue
+            if self.is_prime(num):
+                return num
+    
+    def _strong_test(self, num):
+        """Probabilistic test for candidates that already passed the sieve"""
+        return self.arith.is_prime(num, self.primality_rounds, self.primality_mode,
+                                   prefiltered=True)
+    
+    def generate_prime_bits(self, bits, rng=None):
+        """Generate a random prime with exactly the given number of bits"""
+        return self.generate_prime(1 << (bits - 1), (1 << bits) - 1, rng)
+    
+    def gcd(self, a, b):
+        """Calculate the greatest common divisor of two numbers"""
+        return self.arith.gcd(a, b)
+    
+    def mod_inverse(self, e, phi):
+        """Calculate the modular multiplicative inverse"""
+        return self.arith.invert(e, phi)
+    
+    def mod_inverse_many(self, values, phi):
+        """Invert many values modulo the same phi with one modular inversion"""
+        return self.arith.batch_invert(values, phi)
+    
+    def next_prime(self, num):
+        """Return the smallest prime greater than num"""
+        return self.arith.next_prime(num, self.primality_rounds, self.primality_mode)
+    
+    def select_primes(self, min_val=100, max_val=500, bits=None, workers=1, seed=None, count=2):
+        """Pick count distinct primes, searching for them in parallel when asked to
+        
+        With bits set, the primes share the bits evenly and the last one takes the
+        remainder. A seed or more than one worker uses the seeded segment search in
+        keygen, whose result depends only on the seed and not on the number of workers.
+        Without bits a seed makes the draw from the range reproducible.
+        """
+        if bits is not None:
+            size = bits // count
+            last_size = bits - size * (count - 1)
+        if bits is not None and (workers != 1 or seed is not None):
+            primes = keygen.find_primes(size, count - 1, workers, seed,
+                                        self.primality_rounds, self.primality_mode, self.metrics)
+            last_seed = None if seed is None else f"{seed}:last"
+            while True:
+                last = keygen.find_primes(last_size, 1, workers, last_seed, self.primality_rounds,
+                                          self.primality_mode, self.metrics)[0]
+                if last not in primes:
+                    return tuple(primes) + (last,)
+                last_seed = f"{last_seed}:again"
+        
+        rng = None if seed is None else random.Random(seed)
+        primes = []
+        for i in range(count):
+            if bits is not None:
+                # Setting the top two bits keeps n close to the full key size
+                prime_bits = last_size if i == count - 1 else size
+                min_val, max_val = 3 << (prime_bits - 2), (1 << prime_bits) - 1
+            prime = self.generate_prime(min_val, max_val, rng)
+            
+            # Ensure the primes are different
+            while prime in primes:
+                prime = self.generate_prime(min_val, max_val, rng)
+            primes.append(prime)
+        return tuple(primes)
+    
+    def _accepts_primes(self, primes, e, bits):
+        """Check that the primes give a bits-bit modulus with e as a valid public exponent"""
+        if bits is not None and math.prod(primes).bit_length() != bits:
+            return False
+        if e is None:
+            return True
+        phi = math.prod(prime - 1 for prime in primes)
+        return e < phi and self.gcd(e, phi) == 1
+    
+    def generate_keys(self, bits=None, workers=1, seed=None, e=None, tracer=None,
+                      prime_range=(100, 500), primes=2):
+        """Generate public and private keys with detailed steps
+        
+        Without bits the primes come from prime_range, by default the small
+        demonstration range 100-500.
+        With e set, primes are drawn until e is coprime to φ(n). Steps are only
+        recorded when a tracer such as tracing.LazyTracer is passed in. primes > 2
+        generates an RFC 8017 multi-prime key.
+        """
+        if primes < 2:
+            raise ValueError("An RSA key needs at least two primes")
+        self.steps = tracer if tracer is not None else NULL_TRACER
+        self.symbol_cache.clear()
+        started = self.metrics.clock()
+        
+        # Step 1: Generate two distinct prime numbers
+        if primes == 2:
+            self.steps.step("Step 1: Generating two distinct prime numbers p and q...")
+        else:
+            self.steps.step("Step 1: Generating {} distinct prime numbers...", primes)
+        selected = self.select_primes(*prime_range, bits=bits, workers=workers, seed=seed,
+                                      count=primes)
+        retries = 0
+        while not self._accepts_primes(selected, e, bits):
+            retries += 1
+            if retries > 100:
+                raise ValueError(f"Could not find primes compatible with e = {e}")
+            retry_seed = None if seed is None else f"{seed}:retry{retries}"
+            selected = self.select_primes(*prime_range, bits=bits, workers=workers,
+                                          seed=retry_seed, count=primes)
+        self.p, self.q = selected[:2]
+        self.extra_primes = tuple(selected[2:])
+        
+        self.steps.step("Selected prime p = {}", self.p)
+        self.steps.step("Selected prime q = {}", self.q)
+        for i, prime in enumerate(self.extra_primes, start=3):
+            self.steps.step("Selected prime r{} = {}", i, prime)
+        
+        # Step 2: Calculate n = p * q
+        self.steps.step("\nStep 2: Calculating n = p × q...")
+        self.n = math.prod(selected)
+        self.steps.step("n = " + " × ".join(["{}"] * len(selected)) + " = {}", *selected, self.n)
+        
+        # Step 3: Calculate phi(n) = (p-1) * (q-1)
+        self.steps.step("\nStep 3: Calculating φ(n) = (p-1) × (q-1)...")
+        self.phi_n = math.prod(prime - 1 for prime in selected)
+        if self.extra_primes:
+            self.steps.step("φ(n) = " + " × ".join(["({}-1)"] * len(selected)) + " = {}",
+                            *selected, self.phi_n)
+        else:
+            self.steps.step("φ(n) = ({}-1) × ({}-1) = {} × {} = {}",
+                            self.p, self.q, self.p - 1, self.q - 1, self.phi_n)
+        
+        # Step 4: Choose e such that 1 < e < phi(n) and gcd(e, phi(n)) = 1
+        self.steps.step("\nStep 4: Selecting public exponent e...")
+        
+        # For educational purposes, try some common values first
+        common_e_values = [65537, 17, 5, 3]  # Common choices for e
+        if e is not None:
+            common_e_values = [e]
+        e_found = False
+        
+        for potential_e in common_e_values:
+            if potential_e < self.phi_n and self.gcd(potential_e, self.phi_n) == 1:
+                self.e = potential_e
+                e_found = True
+                self.steps.step("Selected e = {} (a common choice)", self.e)
+                self.steps.step("Verified gcd({}, {}) = 1", self.e, self.phi_n)
+                break
+        
+        # If no common value works, find another suitable e
+        if not e_found:
+            attempts = 0
+            while True:
+                attempts += 1
+                self.e = random.randint(3, self.phi_n - 1)
+                if self.gcd(self.e, self.phi_n) == 1:
+                    self.steps.step("Selected e = {} after {} attempts", self.e, attempts)
+                    self.steps.step("Verified gcd({}, {}) = 1", self.e, self.phi_n)
+                    break
+        
+        # Step 5: Calculate d, the modular multiplicative inverse of e (mod phi(n))
+        self.steps.step("\nStep 5: Calculating private exponent d...")
+        self.steps.step("d = e⁻¹ mod φ(n) = {}⁻¹ mod {}", self.e, self.phi_n)
+        self.d = self.mod_inverse(self.e, self.phi_n)
+        self.steps.step("d = {}", self.d)
+        
+        # Step 6: Set public and private keys
+        self.steps.step("\nStep 6: Forming the key pairs...")
+        self.public_key = (self.n, self.e)
+        self.private_key = (self.n, self.d)
+        self.precompute_crt()
+        
+        self.steps.step("Public key (n, e) = {}", self.public_key)
+        self.steps.step("Private key (n, d) = {}", self.private_key)
+        
+        self.metrics.record("generate_keys", started, (self.n.bit_length() + 7) // 8)
+        return self.public_key, self.private_key, self.steps
+    
+    def precompute_crt(self):
+        """Precompute dP, dQ, qInv and the (r_i, d_i, t_i) triples for CRT private-key operations"""
+        primes = (self.p, self.q) + tuple(self.extra_primes)
+        if self.n == 0 or math.prod(primes) != self.n:
+            self.private_key_crt = None
+            self.private_key_crt_extra = ()
+            return None
+        dP = self.d % (self.p - 1)
+        dQ = self.d % (self.q - 1)
+        q_inv = self.mod_inverse(self.q, self.p)
+        self.private_key_crt = (self.p, self.q, dP, dQ, q_inv)
+        
+        # RFC 8017: t_i is the inverse of r_1 ⋯ r_(i-1) modulo r_i
+        extra = []
+        product = self.p * self.q
+        for prime in self.extra_primes:
+            extra.append((prime, self.d % (prime - 1), self.mod_inverse(product % prime, prime)))
+            product *= prime
+        self.private_key_crt_extra = tuple(extra)
+        if self.blinding:
+            # Start making blinding pairs for the new key in the background
+            self.blinding_cache().start()
+        return self.private_key_crt
+    
+    def blinding_cache(self):
+        """Return the BlindingCache of the current key, replacing one left from an earlier key"""
+        cache = self._blinding
+        if cache is None or cache.n != self.n or cache.e != self.e:
+            if cache is not None:
+                cache.close()
+            cache = self._blinding = blinding.BlindingCache(self.n, self.e, self.arith)
+        return cache
+    
+    def private_operation(self, c):
+        """Compute c^d mod n, blinded when self.blinding is set"""
+        self._require_private_key()
+        if self.blinding:
+            n = self.n
+            blind, unblind = self.blinding_cache().take()
+            return self._crt_operation(c * blind % n) * unblind % n
+        return self._crt_operation(c)
+    
+    def _require_private_key(self):
+        """Raise ValueError when only the public half of the key is loaded"""
+        if self.d == 0 and self.private_key_crt is None:
+            raise ValueError("This operation needs the private key; only a public key is loaded")
+    
+    def _crt_operation(self, c):
+        """Compute c^d mod n, using the CRT with Garner recombination when possible"""
+        if self.private_key_crt is None:
+            n, d = self.private_key
+            return self.arith.powmod(c, d, n)
+        return crt_private_operation(c, self.private_key_crt, self.private_key_crt_extra,
+                                     self.arith.powmod)
+    
+    def encrypt(self, message, tracer=None):
+        """Encrypt a message using the public key, recording steps when a tracer is given"""
+        n, e = self.public_key
+        encrypted_steps = tracer if tracer is not None else NULL_TRACER
+        metrics = self.metrics
+        started = metrics.clock()
+        encrypted_message = []
+        
+        encrypted_steps.step("ENCRYPTION PROCESS")
+        encrypted_steps.step("Using public key (n, e) = {}", self.public_key)
+        
+        # Small moduli are encrypted as one NumPy array; steps are then traced from the results
+        values = None
+        if self.vectorize and vectorized.available(n):
+            values = vectorized.encrypt(message, e, n)
+            if not encrypted_steps.enabled:
+                metrics.record("encrypt", started, len(message))
+                return values, encrypted_steps
+        
+        cache = self.symbol_cache
+        cache.bind(self.public_key, self.private_key)
+        if not encrypted_steps.enabled:
+            encrypted_message = [cache.encrypt(ord(char), e, n) for char in message]
+            metrics.record("encrypt", started, len(message))
+            return encrypted_message, encrypted_steps
+        
+        for i, char in enumerate(message):
+            m = ord(char)
+            c = values[i] if values is not None else cache.encrypt(m, e, n)
+            encrypted_message.append(c)
+            
+            # Show detailed steps
+            encrypted_steps.step("\nEncrypting character '{}' (position {}):", char, i + 1)
+            encrypted_steps.step("1. Convert to ASCII: '{}' → {}", char, m)
+            encrypted_steps.step("2. Apply formula c = m^e mod n:")
+            encrypted_steps.step("   c = {}^{} mod {}", m, e, n)
+            encrypted_steps.step("3. Result: c = {}", c)
+            encrypted_steps.progress(i + 1, len(message))
+            
+        metrics.record("encrypt", started, len(message))
+        return encrypted_message, encrypted_steps
+    
+    def decrypt(self, encrypted_message, tracer=None):
+        """Decrypt a message using the private key, recording steps when a tracer is given"""
+        n, d = self.private_key
+        decrypted_steps = tracer if tracer is not None else NULL_TRACER
+        if decrypted_steps.enabled:
+            # Traced runs read the ciphertext twice and report progress against its length
+            encrypted_message = list(encrypted_message)
+        metrics = self.metrics
+        started = metrics.clock()
+        
+        decrypted_steps.step("DECRYPTION PROCESS")
+        decrypted_steps.step("Using private key (n, d) = {}", self.private_key)
+        
+        values = None
+        if self.vectorize and vectorized.available(n):
+            self._require_private_key()
+            crt = None if self.private_key_crt_extra else self.private_key_crt
+            values = vectorized.decrypt(encrypted_message, n, d, crt)
+            if not decrypted_steps.enabled:
+                metrics.record("decrypt", started, len(values))
+                return values, decrypted_steps
+        
+        cache = self.symbol_cache
+        cache.bind(self.public_key, self.private_key)
+        private_operation = self.private_operation
+        if not decrypted_steps.enabled:
+            decrypted_message = "".join(chr(cache.decrypt(c, private_operation))
+                                        for c in encrypted_message)
+            metrics.record("decrypt", started, len(decrypted_message))
+            return decrypted_message, decrypted_steps
+        
+        chars = []
+        for i, c in enumerate(encrypted_message):
+            m = ord(values[i]) if values is not None else cache.decrypt(c, private_operation)
+            char = chr(m)
+            chars.append(char)
+            
+            # Show detailed steps
+            decrypted_steps.step("\nDecrypting cipher value {} (position {}):", c, i + 1)
+            decrypted_steps.step("1. Apply formula m = c^d mod n:")
+            decrypted_steps.step("   m = {}^{} mod {}", c, d, n)
+            decrypted_steps.step("2. Result: m = {}", m)
+            decrypted_steps.step("3. Convert to character: {} → '{}'", m, char)
+            decrypted_steps.progress(i + 1, len(encrypted_message))
+            
+        decrypted_message = "".join(chars)
+        decrypted_steps.step("\nFinal decrypted message: '{}'", decrypted_message)
+        metrics.record("decrypt", started, len(decrypted_message))
+        return decrypted_message, decrypted_steps
+    
+    def block_sizes(self):
+        """Return (plaintext, ciphertext) block sizes in bytes for the current modulus"""
+        return modulus_block_sizes(self.public_key[0])
+    
+    def encrypt_blocks(self, message):
+        """Encrypt a message as UTF-8 bytes packed into as few modulus-sized blocks as possible"""
+        n, e = self.public_key
+        plain_size, cipher_size = self.block_sizes()
+        started = self.metrics.clock()
+        encrypted = block_encrypt(message, n, e, self.arith.powmod)
+        self.metrics.record("encrypt_blocks", started, len(encrypted) // cipher_size * plain_size)
+        return encrypted
+    
+    def decrypt_blocks(self, encrypted):
+        """Decrypt the bytes produced by encrypt_blocks back into a string"""
+        started = self.metrics.clock()
+        decrypted = block_decrypt(encrypted, self.public_key[0], self.private_operation)
+        self.metrics.record("decrypt_blocks", started, len(encrypted))
+        return decrypted
+
+    def sign(self, message):
+        """Hash-then-sign a message (PKCS#1 v1.5 with SHA-256) and return the signature bytes"""
+        size = (self.n.bit_length() + 7) // 8
+        encoded = int.from_bytes(signature_encoding(message, size), "big")
+        return self.private_operation(encoded).to_bytes(size, "big")
+    
+    def verify(self, message, signature):
+        """Check a signature produced by sign against the public key"""
+        n, e = self.public_key
+        return verify_signature(message, signature, n, e, self.arith.powmod)
+    
+    def verify_many(self, pairs, workers=None, executor=batch.EXECUTOR_PROCESS, chunk_size=256):
+        """Verify an iterable of (message, signature) pairs on a worker pool, yielding bools in order"""
+        chunks = batch.chunked(pairs, chunk_size)
+        for results in batch.map_ordered(_verify_chunk, chunks, workers, executor,
+                                         self._key_state()):
+            yield from results
+    
+    def export_keys(self):
+        """Return the key as immutable (PublicKey, PrivateKey) values, PrivateKey being None for a public key"""
+        public = PublicKey(self.n, self.e)
+        if self.private_key_crt is None:
+            return public, None
+        return public, PrivateKey._from_parameters(public, self.d, self.private_key_crt,
+                                                   self.private_key_crt_extra)
+    
+    @classmethod
+    def from_keys(cls, public, private=None):
+        """Create an instance holding the given PublicKey and optional PrivateKey"""
+        rsa = cls()
+        rsa.n, rsa.e = public.n, public.e
+        if private is not None:
+            rsa.d, rsa.p, rsa.q = private.d, private.p, private.q
+            rsa.extra_primes = private.extra_primes
+            rsa.phi_n = math.prod(prime - 1 for prime in (rsa.p, rsa.q) + rsa.extra_primes)
+            rsa.private_key_crt = private.private_key_crt
+            rsa.private_key_crt_extra = private.extra
+        rsa.public_key = (rsa.n, rsa.e)
+        rsa.private_key = (rsa.n, rsa.d)
+        return rsa
+    
+    def _key_state(self):
+        """The key fields a worker process needs to rebuild this key"""
+        return (self.p, self.q, self.n, self.e, self.d, self.private_key_crt,
+                self.extra_primes, self.private_key_crt_extra, self.blinding)
+    
+    @classmethod
+    def _from_key_state(cls, state):
+        rsa = cls()
+        (rsa.p, rsa.q, rsa.n, rsa.e, rsa.d, rsa.private_key_crt,
+         rsa.extra_primes, rsa.private_key_crt_extra, rsa.blinding) = state
+        rsa.public_key = (rsa.n, rsa.e)
+        rsa.private_key = (rsa.n, rsa.d)
+        return rsa
+    
+    def encrypt_many(self, messages, workers=None, executor=batch.EXECUTOR_PROCESS,
+                     chunk_size=batch.DEFAULT_CHUNK_SIZE, blocks=False):
+        """Encrypt an iterable of messages on a worker pool, yielding ciphertexts in order
+        
+        Each ciphertext is what encrypt (or encrypt_blocks with blocks=True) returns,
+        without steps.
+        """
+        chunks = batch.chunked(messages, chunk_size)
+        for results in batch.map_ordered(_encrypt_chunk, chunks, workers, executor,
+                                         self._key_state(), blocks):
+            yield from results
+    
+    def decrypt_many(self, encrypted_messages, workers=None, executor=batch.EXECUTOR_PROCESS,
+                     chunk_size=batch.DEFAULT_CHUNK_SIZE, blocks=False):
+        """Decrypt an iterable of ciphertexts on a worker pool, yielding messages in order"""
+        chunks = batch.chunked(encrypted_messages, chunk_size)
+        for results in batch.map_ordered(_decrypt_chunk, chunks, workers, executor,
+                                         self._key_state(), blocks):
+            yield from results
+    
+    def save_keys(self, path, include_private=True, format=None):
+        """Write the key as JSON, PKCS#1 PEM or DER; the format defaults from the file extension"""
+        if format is None:
+            format = os.path.splitext(path)[1].lstrip(".").lower()
+            if format not in (FORMAT_PEM, FORMAT_DER):
+                format = FORMAT_JSON
+        if format == FORMAT_JSON:
+            data = {"n": self.n, "e": self.e}
+            if include_private:
+                data.update({"d": self.d, "p": self.p, "q": self.q})
+                if self.extra_primes:
+                    data["other_primes"] = [
+                        {"r": prime, "d": d_i, "t": t_i}
+                        for prime, d_i, t_i in self.private_key_crt_extra
+                    ]
+            with open(path, "w") as f:
+                json.dump(data, f, indent=2)
+            return
+        if format not in (FORMAT_PEM, FORMAT_DER):
+            raise ValueError(f"Unknown key format {format!r}")
+        if include_private:
+            der, label = serialization.private_key_der(self), serialization.PEM_PRIVATE
+        else:
+            der, label = serialization.public_key_der(self), serialization.PEM_PUBLIC
+        with open(path, "wb") as f:
+            f.write(serialization.to_pem(der, label).encode("ascii") if format == FORMAT_PEM else der)
+    
+    def load_keys(self, path):
+        """Read a key written by save_keys, detecting JSON, PEM or DER from the content"""
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                raise ValueError(f"{path} is empty")
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                if mapped[0] == 0x30:
+                    # DER is parsed straight out of the mapping
+                    serialization.load_key_der(mapped, self)
+                    return
+                data = mapped[:]
+        if data.lstrip().startswith(b"-----BEGIN "):
+            serialization.load_key_der(serialization.from_pem(data)[1], self)
+            return
+        data = json.loads(data)
+        if not isinstance(data, dict):
+            raise ValueError(f"{path} is not a JSON key object")
+        n, e = _json_key_field(data, "n"), _json_key_field(data, "e")
+        d, p, q = (_json_key_field(data, name, 0) for name in ("d", "p", "q"))
+        other_primes = data.get("other_primes", [])
+        if not isinstance(other_primes, list):
+            raise ValueError("JSON key field 'other_primes' must be a list")
+        extra_primes = tuple(_json_key_field(entry, "r") for entry in other_primes)
+        self.n, self.e, self.d, self.p, self.q = n, e, d, p, q
+        self.extra_primes = extra_primes
+        primes = (self.p, self.q) + self.extra_primes
+        self.phi_n = math.prod(prime - 1 for prime in primes) if self.p and self.q else 0
+        self.public_key = (self.n, self.e)
+        self.private_key = (self.n, self.d)
+        self.precompute_crt()
+        self.symbol_cache.clear()
+    
+    def pack_encrypted(self, encrypted_message):
+        """Pack a per-character ciphertext list into fixed-width binary blocks"""
+        return serialization.pack_ciphertext(encrypted_message, self.n)
+    
+    def unpack_encrypted(self, buffer):
+        """Read a ciphertext list written by pack_encrypted from any buffer"""
+        return serialization.unpack_ciphertext(buffer)
+
+
+_worker_keys = threading.local()
+
+
+def worker_instance(state):
+    """Return the calling thread's RSA_Implementation for a _key_state tuple, loading it once
+
+    Batch workers get the key as state with every chunk. Reusing one instance
+    per worker keeps its symbol tables and blinding pool warm across chunks,
+    instead of starting a new blinding refill thread for every chunk.
+    """
+    instances = getattr(_worker_keys, "instances", None)
+    if instances is None:
+        instances = _worker_keys.instances = OrderedDict()
+    rsa = instances.get(state)
+    if rsa is not None:
+        instances.move_to_end(state)
+        return rsa
+    rsa = instances[state] = RSA_Implementation._from_key_state(state)
+    if len(instances) > WORKER_KEY_CACHE_SIZE:
+        evicted = instances.popitem(last=False)[1]
+        if evicted._blinding is not None:
+            evicted._blinding.close()
+    return rsa
+
+
+def _encrypt_chunk(state, blocks, messages):
+    """Encrypt one chunk of messages; runs inside a batch worker"""
+    rsa = worker_instance(state)
+    if blocks:
+        return [rsa.encrypt_blocks(message) for message in messages]
+    return [rsa.encrypt(message)[0] for message in messages]
+
+
+def _decrypt_chunk(state, blocks, encrypted_messages):
+    """Decrypt one chunk of ciphertexts; runs inside a batch worker"""
+    rsa = worker_instance(state)
+    if blocks:
+        return [rsa.decrypt_blocks(encrypted) for encrypted in encrypted_messages]
+    return [rsa.decrypt(encrypted)[0] for encrypted in encrypted_messages]
+
+
+def _verify_chunk(state, pairs):
+    """Verify one chunk of (message, signature) pairs; runs inside a batch worker"""
+    rsa = worker_instance(state)
+    return [rsa.verify(message, signature) for message, signature in pairs]
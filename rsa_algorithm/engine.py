@@ -0,0 +1,74 @@
+import threading
+from collections import OrderedDict
+
+from . import arith, blinding
+from .core import (block_decrypt, block_encrypt, crt_private_operation, signature_encoding,
+                   verify_signature)
+
+# Blinding pools kept by one engine before the least recently used is dropped
+MAX_BLINDING_CACHES = 256
+
+
+class RSAEngine:
+    """RSA operations on PublicKey and PrivateKey values
+
+    Unlike RSA_Implementation, the engine holds no key of its own: every
+    operation takes the key as an argument, and the keys are immutable, so one
+    engine can serve any number of keys from any number of threads. The only
+    shared state is the optional per-key blinding pools, which are locked.
+    """
+
+    def __init__(self, backend=None, blinding=False):
+        self.arith = backend or arith.BACKEND
+        self.blinding = blinding
+        self._blinding = OrderedDict()  # PrivateKey -> BlindingCache
+        self._lock = threading.Lock()
+
+    def blinding_cache(self, key):
+        """Return the blinding pool of key, creating and starting it on first use"""
+        with self._lock:
+            cache = self._blinding.get(key)
+            if cache is not None:
+                self._blinding.move_to_end(key)
+                return cache
+            cache = self._blinding[key] = blinding.BlindingCache(key.n, key.e, self.arith)
+            if len(self._blinding) > MAX_BLINDING_CACHES:
+                self._blinding.popitem(last=False)[1].close()
+        cache.start()
+        return cache
+
+    def private_operation(self, key, c):
+        """Compute c^d mod n with the CRT, blinded when the engine was created with blinding"""
+        if self.blinding:
+            n = key.n
+            blind, unblind = self.blinding_cache(key).take()
+            m = crt_private_operation(c * blind % n, key.private_key_crt, key.extra,
+                                      self.arith.powmod)
+            return m * unblind % n
+        return crt_private_operation(c, key.private_key_crt, key.extra, self.arith.powmod)
+
+    def encrypt(self, public, message):
+        """Per-character encryption, as RSA_Implementation.encrypt without steps"""
+        powmod, n, e = self.arith.powmod, public.n, public.e
+        return [powmod(ord(char), e, n) for char in message]
+
+    def decrypt(self, key, encrypted_message):
+        """Inverse of encrypt"""
+        return "".join(chr(self.private_operation(key, c)) for c in encrypted_message)
+
+    def encrypt_blocks(self, public, message):
+        """Encrypt a message as padded UTF-8 blocks, as RSA_Implementation.encrypt_blocks"""
+        return block_encrypt(message, public.n, public.e, self.arith.powmod)
+
+    def decrypt_blocks(self, key, encrypted):
+        """Decrypt the bytes produced by encrypt_blocks back into a string"""
+        return block_decrypt(encrypted, key.n, lambda c: self.private_operation(key, c))
+
+    def sign(self, key, message):
+        """PKCS#1 v1.5 SHA-256 signature of message"""
+        encoded = int.from_bytes(signature_encoding(message, key.size), "big")
+        return self.private_operation(key, encoded).to_bytes(key.size, "big")
+
+    def verify(self, public, message, signature):
+        """Check a signature produced by sign"""
+        return verify_signature(message, signature, public.n, public.e, self.arith.powmod)
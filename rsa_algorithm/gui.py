@@ -0,0 +1,803 @@
+import multiprocessing
+import tkinter as tk
+from concurrent.futures import ProcessPoolExecutor
+from tkinter import ttk, messagebox, scrolledtext
+from tkinter import font as tkfont
+
+from . import keygen, primality, tracing
+from .core import RSA_Implementation, worker_instance
+from .metrics import Metrics
+
+# Interval between progress updates of a background task, about one frame at 60 fps
+POLL_MS = 16
+
+# Moduli from this size up search for their primes in parallel worker processes
+PARALLEL_KEY_BITS = 2048
+
+# Key size choices: label, prime range for the demonstration sizes, modulus bits otherwise
+KEY_SIZES = [
+    ("Demonstration (2-digit primes)", (10, 99), None),
+    ("5-digit primes", (10000, 99999), None),
+    ("512-bit modulus", None, 512),
+    ("1024-bit modulus", None, 1024),
+    ("2048-bit modulus", None, 2048),
+    ("4096-bit modulus", None, 4096),
+]
+
+
+class TaskCancelled(Exception):
+    """Raised inside a background task once its Cancel button was pressed"""
+
+
+class BackgroundTask:
+    """Progress counter and cancel flag shared between the GUI and its worker process
+
+    The crypto runs in a separate process because a single big modexp holds the
+    GIL for longer than a frame. One task runs at a time, so the same shared
+    objects are reset and reused for every task.
+    """
+
+    def __init__(self):
+        self._done = multiprocessing.Value("q", 0, lock=False)
+        self._cancelled = multiprocessing.Event()
+        self.total = 0
+
+    def start(self, total):
+        self._done.value = 0
+        self._cancelled.clear()
+        self.total = total
+
+    @property
+    def done(self):
+        return self._done.value
+
+    @done.setter
+    def done(self, value):
+        self._done.value = value
+
+    def cancel(self):
+        self._cancelled.set()
+
+    def check(self):
+        if self._cancelled.is_set():
+            raise TaskCancelled()
+
+
+class _ProgressMetrics(Metrics):
+    """Metrics that count prime candidates into a task and stop it when cancelled"""
+
+    def __init__(self, task):
+        super().__init__()
+        self.task = task
+
+    def count(self, name, amount=1):
+        self.task.check()
+        if name == "prime_candidates":
+            self.task.done += amount
+        super().count(name, amount)
+
+
+class _ProgressTracer(tracing.NullTracer):
+    """Tracer that keeps no steps, only reporting characters processed into a task
+
+    The GUI rebuilds the steps on demand from the message and ciphertext with
+    tracing.EncryptionSteps and DecryptionSteps, so nothing but the results has
+    to come back from the worker.
+    """
+    enabled = True
+
+    def __init__(self, task, offset=0):
+        self.task = task
+        self.offset = offset
+
+    def progress(self, done, total):
+        self.task.check()
+        self.task.done = self.offset + done
+
+
+# The task of the GUI that started this worker process
+_worker_task = None
+
+
+def _init_worker(task):
+    global _worker_task
+    _worker_task = task
+
+
+def build_keys(prime_range, bits):
+    """Generate a key in the worker process; the GUI keeps its current key until this returns"""
+    rsa = RSA_Implementation()
+    rsa.enable_metrics(_ProgressMetrics(_worker_task))
+    
+    # Large moduli race the prime search across processes, checking for Cancel between segments
+    workers = keygen.default_workers() if bits and bits >= PARALLEL_KEY_BITS else 1
+    rsa.generate_keys(bits=bits, prime_range=prime_range or (0, 0), workers=workers)
+    rsa.disable_metrics()
+    return rsa
+
+
+def encrypt_and_decrypt(state, message):
+    """Round-trip a message in the worker process, counting characters as progress"""
+    rsa = worker_instance(state)
+    encrypted, _ = rsa.encrypt(message, _ProgressTracer(_worker_task))
+    
+    # Format encrypted data for display
+    encrypted_display = "Encrypted values (decimal):\n"
+    encrypted_display += str(encrypted)
+    
+    decrypted, _ = rsa.decrypt(encrypted, _ProgressTracer(_worker_task, len(message)))
+    return encrypted, encrypted_display, decrypted
+
+
+class StepLogView(ttk.Frame):
+    """Read-only step log that only renders the steps in view
+
+    The source can be any sequence of step strings, such as a LazyTracer or
+    tracing.EncryptionSteps, which format a step only when it is indexed. Scrolling moves a window over the
+    source and re-renders just that window, so the Text widget never holds more
+    than a screenful whatever the number of steps. A step can span several
+    lines once wrapped, so the window is measured in display lines: the
+    position is the first step rendered plus the display lines of it that are
+    scrolled past.
+    """
+
+    def __init__(self, master, font):
+        super().__init__(master)
+        self.source = ()
+        self.top = 0  # Index of the first step rendered
+        self.offset = 0  # Display lines of the rendered steps scrolled above the view
+        self.line_height = max(1, font.metrics("linespace"))
+        
+        self.scrollbar = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self.scroll)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.text = tk.Text(self, wrap=tk.WORD, font=font, state=tk.DISABLED)
+        self.text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        
+        # The view scrolls the source rather than the widget
+        self.text.bind("<Configure>", lambda event: self.render())
+        self.text.bind("<MouseWheel>", self.on_wheel)
+        self.text.bind("<Button-4>", lambda event: self.scroll("scroll", -1, "units"))
+        self.text.bind("<Button-5>", lambda event: self.scroll("scroll", 1, "units"))
+        self.text.bind("<Prior>", lambda event: self.scroll("scroll", -1, "pages"))
+        self.text.bind("<Next>", lambda event: self.scroll("scroll", 1, "pages"))
+        self.text.bind("<Control-Home>", lambda event: self.scroll("moveto", 0))
+        self.text.bind("<Control-End>", lambda event: self.scroll("moveto", 1))
+        self.text.bind("<Button-1>", lambda event: self.text.focus_set())
+    
+    def on_wheel(self, event):
+        """Mouse wheel on Windows and macOS; X11 sends Button-4 and Button-5 instead"""
+        return self.scroll("scroll", -1 if event.delta > 0 else 1, "units")
+    
+    def set_source(self, source):
+        """Show a new sequence of steps from the top"""
+        self.source = source
+        self.top = 0
+        self.offset = 0
+        self.render()
+    
+    def rows(self):
+        """Number of lines that fit in the widget"""
+        return max(1, self.text.winfo_height() // self.line_height)
+    
+    def scroll(self, action, amount, what=None):
+        """Scrollbar and key binding command: 'moveto' a fraction or 'scroll' by units or pages"""
+        if action == "moveto":
+            # A top past the last step makes render show the last screenful
+            self.top = int(float(amount) * len(self.source))
+            self.offset = 0
+        elif what == "pages":
+            self.offset += int(amount) * self.rows()
+        else:
+            self.offset += int(amount) * 3
+        self.render()
+        return "break"
+    
+    def display_lines(self, start="1.0", end=tk.END):
+        """Display lines between two widget indices, counting wrapped lines"""
+        count = self.text.count(start, end, "update", "displaylines")
+        if isinstance(count, tuple):
+            count = count[0]
+        return count or 0
+    
+    def _first_step_end(self):
+        """Widget index just past the first rendered step and its separating newline"""
+        lines = self.source[self.top].count("\n") + 1
+        return f"{lines + 1}.0"
+    
+    def _pull_back(self):
+        """Render earlier steps above the view while the offset is negative, stopping at the first step"""
+        while self.offset < 0 and self.top > 0:
+            self.top -= 1
+            before = self.display_lines()
+            self.text.insert(1.0, self.source[self.top] + "\n")
+            self.offset += self.display_lines() - before
+        self.offset = max(0, self.offset)
+    
+    def render(self):
+        """Replace the widget contents with the steps in view"""
+        total = len(self.source)
+        rows = self.rows()
+        text = self.text
+        text.configure(state=tk.NORMAL)
+        text.delete(1.0, tk.END)
+        at_end = self.top >= total
+        self.top = max(0, min(self.top, total - 1))
+        end = self.top
+        if total:
+            text.insert(tk.END, self.source[self.top])
+            end += 1
+            if at_end:
+                self.offset = self.display_lines()
+            self._pull_back()
+            while True:
+                # Fill below until the view is full or the source runs out
+                while end < total and self.display_lines() < self.offset + rows:
+                    text.insert(tk.END, "\n" + self.source[end])
+                    end += 1
+                # Drop a first step that is scrolled entirely out of view
+                first = self.display_lines(1.0, self._first_step_end())
+                if end - self.top > 1 and self.offset >= first:
+                    text.delete(1.0, self._first_step_end())
+                    self.top += 1
+                    self.offset -= first
+                    continue
+                break
+            # At the end of the source, bring earlier steps back so the view stays full
+            shown = self.display_lines()
+            if shown - self.offset < rows:
+                self.offset = shown - rows
+                self._pull_back()
+        text.yview_moveto(0)
+        text.yview_scroll(self.offset, "units")
+        text.configure(state=tk.DISABLED)
+        if total:
+            self.scrollbar.set(self.top / total, end / total)
+        else:
+            self.scrollbar.set(0, 1)
+
+
+class ModernRSA_Interface:
+    def __init__(self, root):
+        """Initialize the GUI interface"""
+        self.root = root
+        self.root.title("RSA Cryptography System")
+        self.root.geometry("1000x700")
+        self.root.minsize(800, 600)
+        
+        # Create RSA instance
+        self.rsa = RSA_Implementation()
+        
+        # Crypto runs in a worker process, started on first use, so the Tk event loop never blocks
+        self.executor = None
+        self.task = BackgroundTask()
+        self.running = False
+        self.root.protocol("WM_DELETE_WINDOW", self.close)
+        
+        # Configure theme colors
+        self.bg_color = "#f5f5f5"
+        self.header_bg = "#3a6ea5"
+        self.header_fg = "white"
+        self.accent_color = "#4a86e8"
+        self.success_color = "#43a047"
+        
+        # Set background color
+        self.root.configure(bg=self.bg_color)
+        
+        # Configure styles
+        self.style = ttk.Style()
+        self.style.theme_use('alt')  # Use clam theme as base
+        
+        # Define custom fonts
+        self.default_font = tkfont.nametofont("TkDefaultFont")
+        self.default_font.configure(family="Segoe UI", size=10)
+        
+        self.header_font = tkfont.Font(family="Segoe UI", size=14, weight="bold")
+        self.section_font = tkfont.Font(family="Segoe UI", size=12, weight="bold")
+        self.code_font = tkfont.Font(family="Consolas", size=10)
+        
+        # Configure ttk styles
+        self.style.configure("TFrame", background=self.bg_color)
+        self.style.configure("TLabel", background=self.bg_color, font=self.default_font)
+        self.style.configure("TLabelframe", background=self.bg_color)
+        self.style.configure("TLabelframe.Label", background=self.bg_color, font=self.section_font)
+        
+        # Button styles
+        self.style.configure("TButton", 
+                             background=self.accent_color, 
+                             foreground="white", 
+                             font=("Segoe UI", 11),
+                             relief="flat", 
+                             borderwidth=0)
+        
+        self.style.map("TButton",
+                       background=[('active', '#2a5db0')],
+                       relief=[('pressed', 'sunken')])
+        
+        # Primary button style
+        self.style.configure("Primary.TButton", 
+                             background=self.accent_color, 
+                             foreground="white", 
+                             font=("Segoe UI", 11, "bold"))
+        
+        self.style.map("Primary.TButton",
+                       background=[('active', '#2a5db0')],
+                       relief=[('pressed', 'sunken')])
+        
+        # Create main container with padding
+        self.main_frame = ttk.Frame(root, padding="10")
+        self.main_frame.pack(fill=tk.BOTH, expand=True)
+        
+        # Create header
+        self.create_header()
+        
+        # Create notebook for tabs
+        self.notebook = ttk.Notebook(self.main_frame)
+        self.notebook.pack(fill=tk.BOTH, expand=True, pady=(10, 5))
+        
+        # Create tabs
+        self.create_key_generation_tab()
+        self.create_encryption_tab()
+        self.create_step_by_step_tab()
+        
+        # Status bar
+        self.status_frame = ttk.Frame(self.main_frame)
+        self.status_frame.pack(fill=tk.X, pady=(5, 0))
+        
+        self.status_var = tk.StringVar()
+        self.status_var.set("Ready")
+        
+        self.cancel_button = ttk.Button(self.status_frame, text="Cancel",
+                                        command=self.cancel_task, state=tk.DISABLED)
+        self.cancel_button.pack(side=tk.RIGHT, padx=(5, 0))
+        
+        self.progress = ttk.Progressbar(self.status_frame, length=200, mode="determinate")
+        self.progress.pack(side=tk.RIGHT, padx=(5, 0))
+        
+        self.status_bar = ttk.Label(self.status_frame, textvariable=self.status_var, 
+                                   relief=tk.SUNKEN, padding=(5, 2))
+        self.status_bar.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        
+        # Initialize encryption/decryption result storage
+        self.encrypted_result = []
+        self.encryption_steps = []
+        self.decryption_steps = []
+    
+    def create_header(self):
+        """Create the application header"""
+        header_frame = ttk.Frame(self.main_frame)
+        header_frame.pack(fill=tk.X, pady=(0, 10))
+        
+        # Application icon/logo placeholder
+        logo_label = ttk.Label(header_frame, text="🔒", font=("Segoe UI", 24))
+        logo_label.pack(side=tk.LEFT, padx=(0, 10))
+        
+        # Title and subtitle
+        title_frame = ttk.Frame(header_frame)
+        title_frame.pack(side=tk.LEFT)
+        
+        title_label = ttk.Label(title_frame, text="RSA Cryptography System (Musaafir)", 
+                               font=self.header_font)
+        title_label.pack(anchor=tk.W)
+        
+        subtitle_label = ttk.Label(title_frame, 
+                                  text="A step-by-step demonstration of public key encryption")
+        subtitle_label.pack(anchor=tk.W)
+    
+    def create_key_generation_tab(self):
+        """Create the key generation tab"""
+        key_tab = ttk.Frame(self.notebook)
+        self.notebook.add(key_tab, text=" Key Generation ")
+        
+        # Configure custom style for Checkbutton
+        self.style.configure("Custom.TCheckbutton",
+                            font=("Segoe UI", 10),
+                            indicatorsize=15)
+        self.style.map("Custom.TCheckbutton",
+                    indicator=[('selected', '✔'), ('!selected', '☐')])  # Unicode tick and empty box
+        
+        # Instructions frame
+        instruction_frame = ttk.LabelFrame(key_tab, text="Instructions")
+        instruction_frame.pack(fill=tk.X, padx=5, pady=5)
+        
+        instruction_text = ("RSA encryption requires generating a pair of keys: a public key for encryption "
+                           "and a private key for decryption. Click 'Generate Keys' to create a new key pair.")
+        
+        instruction_label = ttk.Label(instruction_frame, text=instruction_text, wraplength=900)
+        instruction_label.pack(fill=tk.X, padx=10, pady=10)
+        
+        # Action frame
+        action_frame = ttk.Frame(key_tab)
+        action_frame.pack(fill=tk.X, padx=5, pady=5)
+        
+        # Key size selection, small primes by default for demonstration
+        ttk.Label(action_frame, text="Key size:").pack(side=tk.LEFT, padx=5)
+        self.key_size_var = tk.StringVar(value=KEY_SIZES[0][0])
+        key_size_box = ttk.Combobox(action_frame, textvariable=self.key_size_var, state="readonly",
+                                    values=[label for label, _, _ in KEY_SIZES], width=30)
+        key_size_box.pack(side=tk.LEFT, padx=5)
+        
+        # Add spacer
+        spacer = ttk.Frame(action_frame)
+        spacer.pack(side=tk.LEFT, expand=True)
+        
+        # Generate keys button
+        self.generate_button = ttk.Button(action_frame, text="Generate Keys", 
+                                         style="Primary.TButton",
+                                         command=self.generate_keys)
+        self.generate_button.pack(side=tk.RIGHT, padx=5, pady=5)
+        
+        # Results frame
+        results_frame = ttk.LabelFrame(key_tab, text="Key Parameters")
+        results_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        
+        # Key display using grid layout for better organization
+        params_frame = ttk.Frame(results_frame)
+        params_frame.pack(fill=tk.BOTH, padx=10, pady=10)
+        
+        # Prime numbers
+        ttk.Label(params_frame, text="Prime p:", font=("Segoe UI", 11, "bold")).grid(row=0, column=0, sticky=tk.W, pady=3)
+        self.p_var = tk.StringVar()
+        ttk.Label(params_frame, textvariable=self.p_var, font=self.code_font).grid(row=0, column=1, sticky=tk.W, padx=10)
+        
+        ttk.Label(params_frame, text="Prime q:", font=("Segoe UI", 11, "bold")).grid(row=1, column=0, sticky=tk.W, pady=3)
+        self.q_var = tk.StringVar()
+        ttk.Label(params_frame, textvariable=self.q_var, font=self.code_font).grid(row=1, column=1, sticky=tk.W, padx=10)
+        
+        # Modulus and totient
+        ttk.Label(params_frame, text="Modulus n = p × q:", font=("Segoe UI", 11, "bold")).grid(row=2, column=0, sticky=tk.W, pady=3)
+        self.n_var = tk.StringVar()
+        ttk.Label(params_frame, textvariable=self.n_var, font=self.code_font).grid(row=2, column=1, sticky=tk.W, padx=10)
+        
+        ttk.Label(params_frame, text="φ(n) = (p-1) × (q-1):", font=("Segoe UI", 11, "bold")).grid(row=3, column=0, sticky=tk.W, pady=3)
+        self.phi_var = tk.StringVar()
+        ttk.Label(params_frame, textvariable=self.phi_var, font=self.code_font).grid(row=3, column=1, sticky=tk.W, padx=10)
+        
+        # Keys
+        key_frame = ttk.Frame(results_frame)
+        key_frame.pack(fill=tk.X, padx=10, pady=(0, 10))
+        
+        # Public key
+        public_key_frame = ttk.LabelFrame(key_frame, text="Public Key")
+        public_key_frame.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 5))
+        
+        public_key_content = ttk.Frame(public_key_frame)
+        public_key_content.pack(fill=tk.X, padx=10, pady=10)
+        
+        ttk.Label(public_key_content, text="n:", font=("Segoe UI", 11, "bold")).grid(row=0, column=0, sticky=tk.W, pady=3)
+        self.pub_n_var = tk.StringVar()
+        ttk.Label(public_key_content, textvariable=self.pub_n_var, font=self.code_font).grid(row=0, column=1, sticky=tk.W, padx=10)
+        
+        ttk.Label(public_key_content, text="e:", font=("Segoe UI", 11, "bold")).grid(row=1, column=0, sticky=tk.W, pady=3)
+        self.e_var = tk.StringVar()
+        ttk.Label(public_key_content, textvariable=self.e_var, font=self.code_font).grid(row=1, column=1, sticky=tk.W, padx=10)
+        
+        # Private key
+        private_key_frame = ttk.LabelFrame(key_frame, text="Private Key")
+        private_key_frame.pack(side=tk.RIGHT, fill=tk.X, expand=True, padx=(5, 0))
+        
+        private_key_content = ttk.Frame(private_key_frame)
+        private_key_content.pack(fill=tk.X, padx=10, pady=10)
+        
+        ttk.Label(private_key_content, text="n:", font=("Segoe UI", 11, "bold")).grid(row=0, column=0, sticky=tk.W, pady=3)
+        self.priv_n_var = tk.StringVar()
+        ttk.Label(private_key_content, textvariable=self.priv_n_var, font=self.code_font).grid(row=0, column=1, sticky=tk.W, padx=10)
+        
+        ttk.Label(private_key_content, text="d:", font=("Segoe UI", 11, "bold")).grid(row=1, column=0, sticky=tk.W, pady=3)
+        self.d_var = tk.StringVar()
+        ttk.Label(private_key_content, textvariable=self.d_var, font=self.code_font).grid(row=1, column=1, sticky=tk.W, padx=10)
+    
+    def create_encryption_tab(self):
+        """Create the encryption/decryption tab"""
+        encrypt_tab = ttk.Frame(self.notebook)
+        self.notebook.add(encrypt_tab, text=" Encryption & Decryption ")
+        
+        # Instructions frame
+        instruction_frame = ttk.LabelFrame(encrypt_tab, text="Instructions")
+        instruction_frame.pack(fill=tk.X, padx=5, pady=5)
+        
+        instruction_text = ("Enter your message below and click 'Process' to see the encryption and decryption results. "
+                           "Make sure you've generated keys in the Key Generation tab first.")
+        
+        instruction_label = ttk.Label(instruction_frame, text=instruction_text, wraplength=900)
+        instruction_label.pack(fill=tk.X, padx=10, pady=10)
+        
+        # Input frame
+        input_frame = ttk.LabelFrame(encrypt_tab, text="Input")
+        input_frame.pack(fill=tk.X, padx=5, pady=5)
+        
+        input_content = ttk.Frame(input_frame)
+        input_content.pack(fill=tk.X, padx=10, pady=10)
+        
+        ttk.Label(input_content, text="Enter message:").grid(row=0, column=0, sticky=tk.W, pady=5)
+        
+        self.message_var = tk.StringVar()
+        self.message_entry = ttk.Entry(input_content, textvariable=self.message_var, width=50)
+        self.message_entry.grid(row=0, column=1, sticky=tk.W+tk.E, padx=5, pady=5)
+        
+        # Process button
+        button_frame = ttk.Frame(input_content)
+        button_frame.grid(row=1, column=0, columnspan=2, pady=5)
+        
+        self.process_button = ttk.Button(button_frame, text="Process", 
+                                        style="Primary.TButton",
+                                        command=self.process_message)
+        self.process_button.pack(pady=5)
+        
+        # Results frames
+        results_pane = ttk.PanedWindow(encrypt_tab, orient=tk.VERTICAL)
+        results_pane.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        
+        # Encrypted results
+        encrypted_frame = ttk.LabelFrame(results_pane, text="Encrypted Message")
+        results_pane.add(encrypted_frame, weight=1)
+        
+        self.encrypted_text = scrolledtext.ScrolledText(encrypted_frame, wrap=tk.WORD, 
+                                                       font=self.code_font, height=5)
+        self.encrypted_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        
+        # Decrypted results
+        decrypted_frame = ttk.LabelFrame(results_pane, text="Decrypted Message")
+        results_pane.add(decrypted_frame, weight=1)
+        
+        self.decrypted_text = scrolledtext.ScrolledText(decrypted_frame, wrap=tk.WORD, 
+                                                       font=self.code_font, height=5)
+        self.decrypted_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+    
+    def create_step_by_step_tab(self):
+        """Create the step-by-step details tab"""
+        steps_tab = ttk.Frame(self.notebook)
+        self.notebook.add(steps_tab, text=" Step-by-Step Details ")
+        
+        # Create notebook for detailed steps
+        self.steps_notebook = ttk.Notebook(steps_tab)
+        self.steps_notebook.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        
+        # Key generation steps tab
+        key_steps_tab = ttk.Frame(self.steps_notebook)
+        self.steps_notebook.add(key_steps_tab, text=" Key Generation Steps ")
+        
+        self.key_steps_view = StepLogView(key_steps_tab, self.code_font)
+        self.key_steps_view.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        
+        # Encryption steps tab
+        enc_steps_tab = ttk.Frame(self.steps_notebook)
+        self.steps_notebook.add(enc_steps_tab, text=" Encryption Steps ")
+        
+        self.encryption_steps_view = StepLogView(enc_steps_tab, self.code_font)
+        self.encryption_steps_view.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        
+        # Decryption steps tab
+        dec_steps_tab = ttk.Frame(self.steps_notebook)
+        self.steps_notebook.add(dec_steps_tab, text=" Decryption Steps ")
+        
+        self.decryption_steps_view = StepLogView(dec_steps_tab, self.code_font)
+        self.decryption_steps_view.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+    
+    def run_task(self, status, done, total, fn, *args):
+        """Run fn(*args) in the worker process and call done(result) on the Tk thread"""
+        if self.running:
+            return
+        if self.executor is None:
+            self.executor = ProcessPoolExecutor(max_workers=1, initializer=_init_worker,
+                                                initargs=(self.task,))
+        self.running = True
+        self.task.start(total)
+        self.status_var.set(status)
+        self.progress.configure(value=0, maximum=max(total, 1))
+        self.generate_button.configure(state=tk.DISABLED)
+        self.process_button.configure(state=tk.DISABLED)
+        self.cancel_button.configure(state=tk.NORMAL)
+        future = self.executor.submit(fn, *args)
+        self.root.after(POLL_MS, self.poll_task, future, status, done)
+    
+    def poll_task(self, future, status, done):
+        """Update the progress bar until the background task finishes"""
+        task = self.task
+        if not future.done():
+            if task.total:
+                # Candidate counts are estimates, so keep a little room at the end
+                self.progress.configure(value=min(task.done, task.total * 0.95))
+            self.status_var.set(f"{status} ({task.done} done)")
+            self.root.after(POLL_MS, self.poll_task, future, status, done)
+            return
+        
+        self.running = False
+        self.progress.configure(value=0)
+        self.generate_button.configure(state=tk.NORMAL)
+        self.process_button.configure(state=tk.NORMAL)
+        self.cancel_button.configure(state=tk.DISABLED)
+        try:
+            result = future.result()
+        except TaskCancelled:
+            self.status_var.set("Cancelled")
+            return
+        except Exception as e:
+            messagebox.showerror("Error", f"{status.rstrip('.')} failed: {str(e)}")
+            self.status_var.set("Error")
+            return
+        done(result)
+    
+    def cancel_task(self):
+        """Ask the running background task to stop"""
+        if self.running:
+            self.task.cancel()
+            self.status_var.set("Cancelling...")
+    
+    def close(self):
+        """Stop any background task and close the window"""
+        self.task.cancel()
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+        self.root.destroy()
+    
+    def generate_keys(self):
+        """Generate RSA key pairs in the background and display the parameters"""
+        label = self.key_size_var.get()
+        prime_range, bits = next((r, b) for l, r, b in KEY_SIZES if l == label)
+        total = 0
+        if bits is not None and (bits < PARALLEL_KEY_BITS or keygen.default_workers() == 1):
+            # Candidates tested by parallel search processes are not counted, so those show no total
+            total = round(2 * primality.expected_strong_tests(bits // 2))
+        self.run_task("Generating keys...", self.show_keys, total, build_keys, prime_range, bits)
+    
+    def show_keys(self, rsa):
+        """Install a freshly generated key and display its parameters"""
+        self.rsa = rsa
+        
+        # Generate steps for display (calling a modified method that accepts our generated values)
+        steps = self.generate_key_steps()
+        
+        # Update key parameter displays
+        self.p_var.set(str(self.rsa.p))
+        self.q_var.set(str(self.rsa.q))
+        self.n_var.set(str(self.rsa.n))
+        self.phi_var.set(str(self.rsa.phi_n))
+        
+        # Update public key display
+        self.pub_n_var.set(str(self.rsa.public_key[0]))
+        self.e_var.set(str(self.rsa.public_key[1]))
+        
+        # Update private key display
+        self.priv_n_var.set(str(self.rsa.private_key[0]))
+        self.d_var.set(str(self.rsa.private_key[1]))
+        
+        # Update key generation steps
+        self.key_steps_view.set_source(steps)
+        
+        # Update status
+        self.status_var.set("Keys generated successfully")
+        
+        # Switch to the step-by-step tab and show key generation steps
+        self.notebook.select(2)  # Select Step-by-Step tab
+        self.steps_notebook.select(0)  # Select Key Generation Steps tab
+            
+    def generate_key_steps(self):
+        """Generate step-by-step details for key generation"""
+        steps = []
+        
+        # Step 1: Prime selection
+        steps.append("Step 1: Generating two distinct prime numbers p and q...")
+        steps.append(f"Selected prime p = {self.rsa.p}")
+        steps.append(f"Selected prime q = {self.rsa.q}")
+        
+        # Step 2: Calculate n = p * q
+        steps.append("\nStep 2: Calculating n = p × q...")
+        steps.append(f"n = {self.rsa.p} × {self.rsa.q} = {self.rsa.n}")
+        
+        # Step 3: Calculate phi(n) = (p-1) * (q-1)
+        steps.append("\nStep 3: Calculating φ(n) = (p-1) × (q-1)...")
+        steps.append(f"φ(n) = ({self.rsa.p}-1) × ({self.rsa.q}-1) = {self.rsa.p-1} × {self.rsa.q-1} = {self.rsa.phi_n}")
+        
+        # Step 4: Select e
+        steps.append("\nStep 4: Selecting public exponent e...")
+        steps.append(f"Selected e = {self.rsa.e}")
+        steps.append(f"Verified gcd({self.rsa.e}, {self.rsa.phi_n}) = 1")
+        
+        # Step 5: Calculate d
+        steps.append("\nStep 5: Calculating private exponent d...")
+        steps.append(f"d = e⁻¹ mod φ(n) = {self.rsa.e}⁻¹ mod {self.rsa.phi_n}")
+        steps.append(f"d = {self.rsa.d}")
+        
+        # Step 6: Form key pairs
+        steps.append("\nStep 6: Forming the key pairs...")
+        steps.append(f"Public key (n, e) = {self.rsa.public_key}")
+        steps.append(f"Private key (n, d) = {self.rsa.private_key}")
+        
+        return steps
+    
+    def process_message(self):
+        """Encrypt and decrypt the input message in the background with detailed steps"""
+        message = self.message_var.get()
+        if not message:
+            messagebox.showwarning("Warning", "Please enter a message")
+            return
+            
+        if self.rsa.public_key == (0, 0) or self.rsa.private_key == (0, 0):
+            messagebox.showwarning("Warning", "Please generate keys first")
+            return
+        
+        self.run_task("Processing message...",
+                      lambda result: self.show_message_results(message, *result),
+                      2 * len(message), encrypt_and_decrypt, self.rsa._key_state(), message)
+    
+    def show_message_results(self, message, encrypted, encrypted_display, decrypted_message):
+        """Display the results of encrypt_and_decrypt, building the steps from them on demand"""
+        self.encrypted_result = encrypted
+        self.encryption_steps = tracing.EncryptionSteps(self.rsa.public_key, message, encrypted)
+        self.decryption_steps = tracing.DecryptionSteps(self.rsa.private_key, decrypted_message,
+                                                        encrypted)
+        
+        # Show encrypted text
+        self.encrypted_text.delete(1.0, tk.END)
+        self.encrypted_text.insert(tk.END, encrypted_display)
+        
+        # Show decrypted text
+        self.decrypted_text.delete(1.0, tk.END)
+        self.decrypted_text.insert(tk.END, decrypted_message)
+        
+        # Update step-by-step details
+        self.encryption_steps_view.set_source(self.encryption_steps)
+        self.decryption_steps_view.set_source(self.decryption_steps)
+        
+        # Switch to the step-by-step tab
+        self.notebook.select(2)  # Select Step-by-Step tab
+        self.steps_notebook.select(1)  # Start with encryption steps
+        
+        self.status_var.set("Message processed successfully")
+
+    def show_animation(self, process_type):
+        """Show a visual animation of the encryption or decryption process"""
+        if process_type not in ["encrypt", "decrypt"]:
+            return
+            
+        # Create animation window
+        anim_window = tk.Toplevel(self.root)
+        anim_window.title(f"{'Encryption' if process_type == 'encrypt' else 'Decryption'} Animation")
+        anim_window.geometry("600x400")
+        anim_window.transient(self.root)
+        anim_window.grab_set()
+        
+        # Animation canvas
+        canvas = tk.Canvas(anim_window, bg="white")
+        canvas.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        
+        # Animation controls
+        control_frame = ttk.Frame(anim_window)
+        control_frame.pack(fill=tk.X, padx=10, pady=10)
+        
+        speed_label = ttk.Label(control_frame, text="Animation Speed:")
+        speed_label.pack(side=tk.LEFT, padx=5)
+        
+        speed_var = tk.DoubleVar(value=1.0)
+        speed_scale = ttk.Scale(control_frame, from_=0.5, to=3.0, 
+                              orient=tk.HORIZONTAL, variable=speed_var,
+                              length=200)
+        speed_scale.pack(side=tk.LEFT, padx=5)
+        
+        close_button = ttk.Button(control_frame, text="Close",
+                                 command=anim_window.destroy)
+        close_button.pack(side=tk.RIGHT, padx=5)
+        
+        # TO-DO: Implement animation based on the process type
+
+def main():
+    """Main function to run the application"""
+    root = tk.Tk()
+    app = ModernRSA_Interface(root)
+    
+    # Center window on screen
+    root.update_idletasks()
+    width = root.winfo_width()
+    height = root.winfo_height()
+    x = (root.winfo_screenwidth() // 2) - (width // 2)
+    y = (root.winfo_screenheight() // 2) - (height // 2)
+    root.geometry(f'{width}x{height}+{x}+{y}')
+    
+    # Set window icon
+    # If you have an icon file, you can use:
+    # root.iconbitmap('icon.ico')
+    
+    root.mainloop()
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,126 @@
+import os
+import random
+import secrets
+
+from . import primality
+from .metrics import NULL_METRICS
+
+
+def default_workers():
+    """Number of worker processes used when none is configured"""
+    return os.cpu_count() or 1
+
+
+def segment_start(bits, seed, prime_index, segment):
+    """Deterministic odd starting point of one search segment"""
+    rng = random.Random(f"{seed}:{bits}:{prime_index}:{segment}")
+    # Setting the top two bits keeps the product of two such primes at 2 * bits bits
+    return primality.random_odd(bits, rng) | (1 << (bits - 2))
+
+
+def search_segment(bits, seed, prime_index, segment, rounds, mode):
+    """Search one sieve window for a prime; runs inside a worker process"""
+    start = segment_start(bits, seed, prime_index, segment)
+
+    def test(candidate):
+        return candidate.bit_length() == bits and primality.strong_test(candidate, rounds, mode)
+
+    return primality.first_prime_in_window(start, test)
+
+
+class _PrimeRace:
+    """Bookkeeping for the segments raced to find one prime"""
+
+    def __init__(self, prime_index):
+        self.prime_index = prime_index
+        self.next_segment = 0
+        self.results = {}
+        self.winner = None
+
+    def record(self, segment, prime):
+        self.results[segment] = prime
+        if prime is not None and (self.winner is None or segment < self.winner):
+            self.winner = segment
+
+    def done(self):
+        """The lowest successful segment wins once every earlier segment has failed"""
+        if self.winner is None:
+            return False
+        return all(s in self.results for s in range(self.winner))
+
+    def wants(self, segment):
+        return self.winner is None or segment < self.winner
+
+    def prime(self):
+        return self.results[self.winner]
+
+
+def find_primes(bits, count=2, workers=None, seed=None,
+                rounds=primality.DEFAULT_ROUNDS, mode=primality.MODE_MILLER_RABIN,
+                metrics=NULL_METRICS):
+    """Find count distinct primes of the given size, racing workers per prime
+
+    Each prime is searched over numbered segments whose starting points are
+    derived from seed. The lowest-numbered segment that holds a prime wins and
+    later segments are cancelled, so the result depends only on seed and never
+    on the number of workers or on scheduling. Each finished segment is
+    counted as prime_segments in metrics, which may stop the search by raising.
+    """
+    if seed is None:
+        # Unseeded searches start from 256 bits of OS randomness
+        seed = secrets.randbits(256)
+    workers = workers or default_workers()
+    races = [_PrimeRace(i) for i in range(count)]
+
+    if workers == 1:
+        for race in races:
+            while not race.done():
+                segment = race.next_segment
+                race.next_segment += 1
+                race.record(segment, search_segment(bits, seed, race.prime_index,
+                                                    segment, rounds, mode))
+                metrics.count("prime_segments")
+        return _distinct(races, bits, seed, rounds, mode)
+
+    # Imported here so that single-process callers do not pay for multiprocessing
+    from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = {}
+        while not all(race.done() for race in races):
+            # Keep every worker busy with the earliest segments still worth searching
+            open_races = [race for race in races if race.winner is None]
+            while open_races and len(pending) < workers:
+                for race in open_races:
+                    if len(pending) >= workers:
+                        break
+                    segment = race.next_segment
+                    race.next_segment += 1
+                    future = pool.submit(search_segment, bits, seed, race.prime_index,
+                                         segment, rounds, mode)
+                    pending[future] = (race, segment)
+            finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in finished:
+                race, segment = pending.pop(future)
+                race.record(segment, future.result())
+                metrics.count("prime_segments")
+            # Cancel the losers: segments after a known winner can never win
+            for future, (race, segment) in list(pending.items()):
+                if not race.wants(segment) and future.cancel():
+                    del pending[future]
+        for future in pending:
+            future.cancel()
+    return _distinct(races, bits, seed, rounds, mode)
+
+
+def _distinct(races, bits, seed, rounds, mode):
+    """Collect the winning primes, re-searching with a fresh index on a collision"""
+    primes = []
+    next_index = len(races)
+    for race in races:
+        prime = race.prime()
+        while prime in primes:
+            prime = find_primes(bits, 1, 1, f"{seed}:{next_index}", rounds, mode)[0]
+            next_index += 1
+        primes.append(prime)
+    return primes
@@ -0,0 +1,165 @@
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+
+from .core import RSA_Implementation
+
+DEFAULT_E = 65537
+
+
+def generate_keypair(bits, e):
+    """Generate one keypair; runs inside a background worker"""
+    rsa = RSA_Implementation()
+    rsa.generate_keys(bits=bits, e=e)
+    return rsa
+
+
+class KeyPool:
+    """Pool of pre-generated keypairs per (bits, e) configuration
+    
+    Each keypair is a ready RSA_Implementation instance. When the number of
+    ready plus in-flight keypairs for a configuration drops below low_watermark
+    the pool is topped back up to size on background workers. Memory stays
+    bounded by size keypairs per configuration and max_configs configurations.
+    """
+
+    def __init__(self, size=8, low_watermark=2, workers=2, max_configs=16, executor=None):
+        if not 0 <= low_watermark <= size:
+            raise ValueError("low_watermark must be between 0 and size")
+        self.size = size
+        self.low_watermark = low_watermark
+        self.max_configs = max_configs
+        self._executor = executor or ProcessPoolExecutor(max_workers=workers)
+        self._owns_executor = executor is None
+        self._lock = threading.Lock()
+        self._ready = OrderedDict()  # (bits, e) -> deque of keypairs, least recently used first
+        self._in_flight = {}
+        self._closed = False
+        self.hits = 0
+        self.misses = 0
+        self.refills = 0
+        self.refill_failures = 0
+        self.refill_seconds_total = 0.0
+        self.refill_seconds_max = 0.0
+
+    def get(self, bits, e=DEFAULT_E):
+        """Take a ready keypair, generating one inline if the pool is empty"""
+        config = (bits, e)
+        with self._lock:
+            ready = self._config(config)
+            keypair = ready.popleft() if ready else None
+            if keypair is not None:
+                self.hits += 1
+            else:
+                self.misses += 1
+            submitted = self._schedule_refill(config)
+        self._watch(submitted)
+        if keypair is None:
+            keypair = generate_keypair(bits, e)
+        return keypair
+
+    def put(self, keypair):
+        """Return an unused keypair to the pool; returns False if it was dropped"""
+        config = (keypair.n.bit_length(), keypair.e)
+        with self._lock:
+            ready = self._config(config)
+            if self._closed or len(ready) >= self.size:
+                return False
+            ready.append(keypair)
+            return True
+
+    def prefill(self, bits, e=DEFAULT_E):
+        """Start filling the pool for a configuration without taking a keypair"""
+        with self._lock:
+            self._config((bits, e))
+            submitted = self._schedule_refill((bits, e), force=True)
+        self._watch(submitted)
+
+    def available(self, bits, e=DEFAULT_E):
+        """Number of ready keypairs for a configuration"""
+        with self._lock:
+            return len(self._ready.get((bits, e), ()))
+
+    def stats(self):
+        """Snapshot of the pool counters"""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "refills": self.refills,
+                "refill_failures": self.refill_failures,
+                "refill_seconds_mean": (self.refill_seconds_total / self.refills
+                                        if self.refills else 0.0),
+                "refill_seconds_max": self.refill_seconds_max,
+                "ready": {config: len(ready) for config, ready in self._ready.items()},
+                "in_flight": dict(self._in_flight),
+            }
+
+    def close(self):
+        """Stop refilling and release the background workers"""
+        with self._lock:
+            self._closed = True
+            self._ready.clear()
+        if self._owns_executor:
+            self._executor.shutdown(cancel_futures=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _config(self, config):
+        """Return the keypair queue for a configuration, evicting the least recently used one"""
+        if config in self._ready:
+            self._ready.move_to_end(config)
+        else:
+            self._ready[config] = deque()
+            self._in_flight.setdefault(config, 0)
+            while len(self._ready) > self.max_configs:
+                evicted, _ = self._ready.popitem(last=False)
+                if not self._in_flight.get(evicted):
+                    self._in_flight.pop(evicted, None)
+        return self._ready[config]
+
+    def _schedule_refill(self, config, force=False):
+        """Top the configuration back up to size once it is below the low watermark
+
+        Called with the lock held. Returns the (config, started, future) triples
+        submitted, which the caller passes to _watch once the lock is released:
+        a future that is already done runs its callback immediately, and the
+        callback takes the lock.
+        """
+        if self._closed:
+            return []
+        pending = len(self._ready[config]) + self._in_flight[config]
+        if pending >= self.low_watermark and not force:
+            return []
+        submitted = []
+        for _ in range(self.size - pending):
+            self._in_flight[config] += 1
+            submitted.append((config, time.perf_counter(),
+                              self._executor.submit(generate_keypair, *config)))
+        return submitted
+
+    def _watch(self, submitted):
+        """Attach the completion callbacks of futures from _schedule_refill; call without the lock"""
+        for config, started, future in submitted:
+            future.add_done_callback(
+                lambda f, config=config, started=started: self._refilled(config, started, f))
+
+    def _refilled(self, config, started, future):
+        """Store a keypair produced by a background worker"""
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            self._in_flight[config] -= 1
+            if future.cancelled() or future.exception() is not None:
+                self.refill_failures += 1
+                return
+            self.refills += 1
+            self.refill_seconds_total += elapsed
+            self.refill_seconds_max = max(self.refill_seconds_max, elapsed)
+            ready = self._ready.get(config)
+            if not self._closed and ready is not None and len(ready) < self.size:
+                ready.append(future.result())
@@ -0,0 +1,110 @@
+from . import arith
+
+
+class PublicKey:
+    """Immutable RSA public key with its byte length precomputed"""
+    __slots__ = ("n", "e", "size")
+
+    def __init__(self, n, e):
+        object.__setattr__(self, "n", n)
+        object.__setattr__(self, "e", e)
+        object.__setattr__(self, "size", (n.bit_length() + 7) // 8)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __reduce__(self):
+        return PublicKey, (self.n, self.e)
+
+    def __eq__(self, other):
+        return isinstance(other, PublicKey) and (self.n, self.e) == (other.n, other.e)
+
+    def __hash__(self):
+        return hash((self.n, self.e))
+
+    def __repr__(self):
+        return f"PublicKey({self.n.bit_length()} bits, e={self.e})"
+
+
+class PrivateKey:
+    """Immutable RSA private key holding its public half and precomputed CRT parameters
+
+    extra is the tuple of (r_i, d_i, t_i) triples of a multi-prime key. The
+    private_key_crt and private_key_crt_extra properties use the names of the
+    RSA_Implementation attributes, so serialization accepts either object.
+    """
+    __slots__ = ("public", "d", "p", "q", "dP", "dQ", "q_inv", "extra")
+
+    def __init__(self, n, e, d, p, q, extra_primes=(), backend=None):
+        invert = (backend or arith.BACKEND).invert
+        primes = (p, q) + tuple(extra_primes)
+        product = 1
+        for prime in primes:
+            product *= prime
+        if product != n:
+            raise ValueError("The primes do not multiply to n")
+        extra = []
+        product = p * q
+        for prime in extra_primes:
+            extra.append((prime, d % (prime - 1), invert(product % prime, prime)))
+            product *= prime
+        for name, value in (("public", PublicKey(n, e)), ("d", d), ("p", p), ("q", q),
+                            ("dP", d % (p - 1)), ("dQ", d % (q - 1)),
+                            ("q_inv", invert(q, p)), ("extra", tuple(extra))):
+            object.__setattr__(self, name, value)
+
+    @classmethod
+    def _from_parameters(cls, public, d, crt, extra):
+        """Rebuild a key from already computed parameters without inverting anything"""
+        key = cls.__new__(cls)
+        p, q, dP, dQ, q_inv = crt
+        for name, value in (("public", public), ("d", d), ("p", p), ("q", q), ("dP", dP),
+                            ("dQ", dQ), ("q_inv", q_inv), ("extra", tuple(extra))):
+            object.__setattr__(key, name, value)
+        return key
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __reduce__(self):
+        return PrivateKey._from_parameters, (self.public, self.d, self.private_key_crt, self.extra)
+
+    @property
+    def n(self):
+        return self.public.n
+
+    @property
+    def e(self):
+        return self.public.e
+
+    @property
+    def size(self):
+        return self.public.size
+
+    @property
+    def private_key_crt(self):
+        return (self.p, self.q, self.dP, self.dQ, self.q_inv)
+
+    @property
+    def private_key_crt_extra(self):
+        return self.extra
+
+    @property
+    def extra_primes(self):
+        return tuple(prime for prime, _, _ in self.extra)
+
+    def __eq__(self, other):
+        return isinstance(other, PrivateKey) and (self.public, self.d) == (other.public, other.d)
+
+    def __hash__(self):
+        return hash((self.public, self.d))
+
+    def __repr__(self):
+        # The private parameters are left out on purpose
+        return f"PrivateKey({self.n.bit_length()} bits, {2 + len(self.extra)} primes, e={self.e})"
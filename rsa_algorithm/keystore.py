@@ -0,0 +1,284 @@
+import hashlib
+import mmap
+import os
+import struct
+import threading
+from collections import OrderedDict
+
+from . import serialization
+from .core import RSA_Implementation
+
+DATA_FILE = "keys.dat"
+INDEX_FILE = "keys.idx"
+
+DATA_MAGIC = b"RKSD"
+INDEX_MAGIC = b"RKSI"
+VERSION = 1
+
+DEFAULT_CACHE_SIZE = 256
+MIN_CAPACITY = 1024
+
+# Records: kind, SHA-256 fingerprint of the public key DER, DER length, then the DER
+_DATA_HEADER = struct.Struct(">4sB")
+_RECORD = struct.Struct(">B32sI")
+KIND_PUBLIC = 0
+KIND_PRIVATE = 1
+
+# Index: magic, version, capacity, count, then open-addressed slots of
+# (fingerprint prefix, record offset + 1); an offset of 0 marks an empty slot
+_INDEX_HEADER = struct.Struct(">4sB3xQQ")
+_SLOT = struct.Struct(">16sQ")
+
+# The index is doubled once it is three quarters full
+_MAX_LOAD_NUMERATOR = 3
+_MAX_LOAD_DENOMINATOR = 4
+
+
+def fingerprint(rsa):
+    """Hex SHA-256 of the PKCS#1 public key DER of rsa"""
+    return hashlib.sha256(serialization.public_key_der(rsa)).hexdigest()
+
+
+def _capacity_for(keys):
+    capacity = MIN_CAPACITY
+    while keys * _MAX_LOAD_DENOMINATOR >= capacity * _MAX_LOAD_NUMERATOR:
+        capacity *= 2
+    return capacity
+
+
+class KeyStore:
+    """Append-only keypair store with an on-disk hash index
+
+    Keys are stored as PKCS#1 DER records in keys.dat, which is only ever
+    appended to. keys.idx is an open-addressing hash table from fingerprint to
+    record offset that lives in an mmap, so a lookup touches a few slots and one
+    record whatever the number of keys. Keys are parsed only when asked for, and
+    the most recently used ones are kept with their CRT parameters in an LRU cache.
+    Pass expected_keys to size the index up front and avoid rebuilds while it fills.
+    """
+
+    def __init__(self, path, cache_size=DEFAULT_CACHE_SIZE, expected_keys=0):
+        os.makedirs(path, exist_ok=True)
+        self.path = path
+        self.cache_size = cache_size
+        self.hits = 0
+        self.misses = 0
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self._data = os.open(os.path.join(path, DATA_FILE), os.O_RDWR | os.O_CREAT, 0o600)
+        self._data_size = os.fstat(self._data).st_size
+        if self._data_size == 0:
+            self._data_size = os.write(self._data, _DATA_HEADER.pack(DATA_MAGIC, VERSION))
+        magic, version = _DATA_HEADER.unpack(os.pread(self._data, _DATA_HEADER.size, 0))
+        if magic != DATA_MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} keystore")
+        self._index_file = None
+        self._index = None
+        index_path = os.path.join(path, INDEX_FILE)
+        if os.path.exists(index_path):
+            self._open_index(index_path)
+        else:
+            self.rebuild_index(expected_keys)
+
+    def _open_index(self, index_path):
+        self._index_file = open(index_path, "r+b")
+        self._index = mmap.mmap(self._index_file.fileno(), 0)
+        magic, version, self._capacity, self._count = _INDEX_HEADER.unpack_from(self._index)
+        if magic != INDEX_MAGIC or version != VERSION:
+            raise ValueError(f"{index_path} is not a version {VERSION} keystore index")
+        self._mask = self._capacity - 1
+
+    def _close_index(self):
+        if self._index is not None:
+            self._index.close()
+            self._index_file.close()
+            self._index = self._index_file = None
+
+    def _write_empty_index(self, index_path, capacity):
+        with open(index_path, "wb") as f:
+            f.write(_INDEX_HEADER.pack(INDEX_MAGIC, VERSION, capacity, 0))
+            f.truncate(_INDEX_HEADER.size + capacity * _SLOT.size)
+
+    def _find(self, digest):
+        """Return (slot number, record offset) for digest, or (free slot, None)"""
+        prefix = digest[:16]
+        slot = int.from_bytes(prefix[:8], "big") & self._mask
+        while True:
+            position = _INDEX_HEADER.size + slot * _SLOT.size
+            stored, offset = _SLOT.unpack_from(self._index, position)
+            if offset == 0:
+                return slot, None
+            # A prefix match is confirmed against the full fingerprint in the record
+            if stored == prefix and self._read_header(offset - 1)[1] == digest:
+                return slot, offset - 1
+            slot = (slot + 1) & self._mask
+
+    def _store_slot(self, slot, digest, offset):
+        _SLOT.pack_into(self._index, _INDEX_HEADER.size + slot * _SLOT.size, digest[:16], offset + 1)
+
+    def _insert(self, digest, offset):
+        slot, existing = self._find(digest)
+        self._store_slot(slot, digest, offset)
+        if existing is None:
+            self._count += 1
+            _INDEX_HEADER.pack_into(self._index, 0, INDEX_MAGIC, VERSION, self._capacity, self._count)
+
+    def _read_header(self, offset):
+        return _RECORD.unpack(os.pread(self._data, _RECORD.size, offset))
+
+    def _read_der(self, offset):
+        kind, _, length = self._read_header(offset)
+        return kind, os.pread(self._data, length, offset + _RECORD.size)
+
+    def _records(self):
+        """Yield (offset, kind, digest, length) for every complete record in the data file"""
+        offset = _DATA_HEADER.size
+        while offset + _RECORD.size <= self._data_size:
+            kind, digest, length = self._read_header(offset)
+            if offset + _RECORD.size + length > self._data_size:
+                break
+            yield offset, kind, digest, length
+            offset += _RECORD.size + length
+
+    def rebuild_index(self, expected_keys=0):
+        """Rebuild keys.idx from the data file, e.g. after a crash between the two writes
+
+        A torn record at the end of the data file is cut off, so later records
+        are appended right after the last complete one.
+        """
+        with self._lock:
+            records = {}
+            end = _DATA_HEADER.size
+            for offset, kind, digest, length in self._records():
+                current = records.get(digest)
+                if current is None or kind >= current[1]:
+                    records[digest] = (offset, kind)
+                end = offset + _RECORD.size + length
+            if end < self._data_size:
+                os.ftruncate(self._data, end)
+                self._data_size = end
+            self._rebuild(max(expected_keys, len(records)), records)
+
+    def _rebuild(self, keys, records):
+        index_path = os.path.join(self.path, INDEX_FILE)
+        temporary = index_path + ".tmp"
+        self._close_index()
+        self._write_empty_index(temporary, _capacity_for(keys))
+        os.replace(temporary, index_path)
+        self._open_index(index_path)
+        for digest, (offset, _) in records.items():
+            self._insert(digest, offset)
+
+    def _grow(self):
+        records = {}
+        for slot in range(self._capacity):
+            _, offset = _SLOT.unpack_from(self._index, _INDEX_HEADER.size + slot * _SLOT.size)
+            if offset:
+                records[self._read_header(offset - 1)[1]] = (offset - 1, None)
+        self._rebuild(self._capacity, records)
+
+    def add(self, rsa, include_private=True):
+        """Store the key held by rsa and return its fingerprint
+
+        Adding a key that is already stored is a no-op, except that a private
+        key replaces a stored public-only copy.
+        """
+        public_der = serialization.public_key_der(rsa)
+        digest = hashlib.sha256(public_der).digest()
+        if include_private and rsa.private_key_crt is not None:
+            kind, der = KIND_PRIVATE, serialization.private_key_der(rsa)
+        else:
+            kind, der = KIND_PUBLIC, public_der
+        with self._lock:
+            _, existing = self._find(digest)
+            if existing is not None and self._read_header(existing)[0] >= kind:
+                return digest.hex()
+            if existing is None and (self._count + 1) * _MAX_LOAD_DENOMINATOR > self._capacity * _MAX_LOAD_NUMERATOR:
+                self._grow()
+            offset = self._data_size
+            record = _RECORD.pack(kind, digest, len(der)) + der
+            os.pwrite(self._data, record, offset)
+            self._data_size += len(record)
+            self._insert(digest, offset)
+            self._cache.pop(digest, None)
+        return digest.hex()
+
+    def get(self, key_fingerprint):
+        """Return a ready RSA_Implementation for the fingerprint, raising KeyError if unknown"""
+        digest = bytes.fromhex(key_fingerprint)
+        with self._lock:
+            rsa = self._cache.get(digest)
+            if rsa is not None:
+                self._cache.move_to_end(digest)
+                self.hits += 1
+                return rsa
+            self.misses += 1
+            _, offset = self._find(digest)
+            if offset is None:
+                raise KeyError(key_fingerprint)
+            _, der = self._read_der(offset)
+        rsa = serialization.load_key_der(der, RSA_Implementation())
+        with self._lock:
+            self._cache[digest] = rsa
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return rsa
+
+    def public_key(self, key_fingerprint):
+        """Return (n, e) for the fingerprint without parsing or caching the private key"""
+        digest = bytes.fromhex(key_fingerprint)
+        with self._lock:
+            rsa = self._cache.get(digest)
+            if rsa is not None:
+                return rsa.public_key
+            _, offset = self._find(digest)
+            if offset is None:
+                raise KeyError(key_fingerprint)
+            _, der = self._read_der(offset)
+        return serialization.public_numbers(der)
+
+    def has_private(self, key_fingerprint):
+        """Whether the stored copy of the key includes the private part"""
+        with self._lock:
+            _, offset = self._find(bytes.fromhex(key_fingerprint))
+            if offset is None:
+                raise KeyError(key_fingerprint)
+            return self._read_header(offset)[0] == KIND_PRIVATE
+
+    def __contains__(self, key_fingerprint):
+        with self._lock:
+            return self._find(bytes.fromhex(key_fingerprint))[1] is not None
+
+    def __len__(self):
+        return self._count
+
+    def fingerprints(self):
+        """Fingerprints of all stored keys, in index order"""
+        with self._lock:
+            found = []
+            for slot in range(self._capacity):
+                _, offset = _SLOT.unpack_from(self._index, _INDEX_HEADER.size + slot * _SLOT.size)
+                if offset:
+                    found.append(self._read_header(offset - 1)[1].hex())
+        return found
+
+    def flush(self):
+        """Push both files to disk"""
+        with self._lock:
+            os.fsync(self._data)
+            self._index.flush()
+
+    def close(self):
+        with self._lock:
+            if self._data is None:
+                return
+            self._close_index()
+            os.close(self._data)
+            self._data = None
+            self._cache.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
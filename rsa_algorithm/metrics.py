@@ -0,0 +1,202 @@
+import time
+from collections import Counter
+from contextlib import contextmanager
+
+from . import primality
+
+# Histogram buckets are powers of two in microseconds, up to about 9 minutes
+HISTOGRAM_BUCKETS = 30
+
+
+class NullMetrics:
+    """Metrics sink that records nothing; the default for every RSA_Implementation"""
+    enabled = False
+
+    def clock(self):
+        return 0.0
+
+    def count(self, name, amount=1):
+        pass
+
+    def observe(self, name, seconds):
+        pass
+
+    def record(self, name, started, size):
+        pass
+
+    def snapshot(self):
+        return {"counters": {}, "histograms": {}}
+
+    def reset(self):
+        pass
+
+
+class Metrics:
+    """Counters and timing histograms for one process
+
+    Updates are not locked, so counts from threads racing on the same name can
+    be slightly low. Work done in batch worker processes is not recorded.
+    """
+    enabled = True
+
+    def __init__(self):
+        self.counters = Counter()
+        self.histograms = {}
+
+    def clock(self):
+        return time.perf_counter()
+
+    def count(self, name, amount=1):
+        self.counters[name] += amount
+
+    def observe(self, name, seconds):
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            # count, total seconds, max seconds, buckets
+            histogram = self.histograms[name] = [0, 0.0, 0.0, [0] * HISTOGRAM_BUCKETS]
+        histogram[0] += 1
+        histogram[1] += seconds
+        if seconds > histogram[2]:
+            histogram[2] = seconds
+        bucket = min(int(seconds * 1e6).bit_length(), HISTOGRAM_BUCKETS - 1)
+        histogram[3][bucket] += 1
+
+    def record(self, name, started, size):
+        """Count one call of name over size bytes that began at clock() time started"""
+        self.observe(name, time.perf_counter() - started)
+        self.counters[name + "_calls"] += 1
+        self.counters[name + "_bytes"] += size
+
+    def snapshot(self):
+        """Return a plain dict copy of every counter and histogram"""
+        histograms = {}
+        for name, (count, total, longest, buckets) in self.histograms.items():
+            histograms[name] = {
+                "count": count,
+                "total_seconds": total,
+                "mean_seconds": total / count,
+                "max_seconds": longest,
+                # Upper bound of each bucket in microseconds -> number of observations
+                "buckets": {1 << i: n for i, n in enumerate(buckets) if n},
+            }
+        return {"counters": dict(self.counters), "histograms": histograms}
+
+    def reset(self):
+        self.counters.clear()
+        self.histograms.clear()
+
+
+NULL_METRICS = NullMetrics()
+
+
+class InstrumentedBackend:
+    """Arithmetic backend wrapper that feeds a Metrics instance
+
+    It replaces the backend of an RSA_Implementation only while metrics are
+    enabled, so the disabled path runs the plain backend with no checks at all.
+    Miller-Rabin rounds are derived from the outcome: a probable prime ran
+    every round, a composite is counted as one since strong liars are rare.
+    """
+
+    def __init__(self, inner, metrics):
+        self.inner = inner
+        self.metrics = metrics
+        self.name = inner.name
+
+    def powmod(self, base, exponent, modulus):
+        start = time.perf_counter()
+        result = self.inner.powmod(base, exponent, modulus)
+        self.metrics.observe("modexp", time.perf_counter() - start)
+        self.metrics.count("modexp_calls")
+        return result
+
+    def gcd(self, a, b):
+        return self.inner.gcd(a, b)
+
+    def invert(self, a, modulus):
+        self.metrics.count("mod_inverse_calls")
+        return self.inner.invert(a, modulus)
+
+    def batch_invert(self, values, modulus):
+        self.metrics.count("mod_inverse_calls")
+        self.metrics.count("batch_inverted_values", len(values))
+        return self.inner.batch_invert(values, modulus)
+
+    def is_prime(self, n, rounds=primality.DEFAULT_ROUNDS, mode=primality.MODE_MILLER_RABIN,
+                 prefiltered=False):
+        metrics = self.metrics
+        metrics.count("prime_candidates")
+        if not prefiltered:
+            decided = primality.small_prime_filter(n)
+            if decided is not None:
+                metrics.count("probable_primes" if decided else "small_prime_rejections")
+                return decided
+        start = time.perf_counter()
+        result = self.inner.is_prime(n, rounds, mode, prefiltered=True)
+        metrics.observe("is_prime", time.perf_counter() - start)
+        if mode == primality.MODE_MILLER_RABIN:
+            if not result:
+                metrics.count("miller_rabin_rounds")
+            elif n < primality.DETERMINISTIC_MR_LIMIT:
+                metrics.count("miller_rabin_rounds",
+                              sum(1 for a in primality.DETERMINISTIC_MR_BASES if a < n - 1))
+            else:
+                metrics.count("miller_rabin_rounds", rounds)
+        else:
+            # Baillie-PSW starts with a single base-2 round
+            metrics.count("miller_rabin_rounds")
+        if result:
+            metrics.count("probable_primes")
+        return result
+
+    def next_prime(self, n, rounds=primality.DEFAULT_ROUNDS, mode=primality.MODE_MILLER_RABIN):
+        self.metrics.count("next_prime_calls")
+        return self.inner.next_prime(n, rounds, mode)
+
+
+class ProfileReport:
+    """Results of a profiled block, filled in when the block exits"""
+
+    def __init__(self):
+        self.stats = None  # pstats.Stats when cpu profiling was on
+        self.memory = None  # tracemalloc.Snapshot when memory tracing was on
+        self.peak_bytes = None
+
+    def text(self, limit=20):
+        """Format the top entries of whatever was collected"""
+        import io
+        out = io.StringIO()
+        if self.stats is not None:
+            self.stats.stream = out
+            self.stats.sort_stats("cumulative").print_stats(limit)
+        if self.memory is not None:
+            out.write(f"Peak traced memory: {self.peak_bytes} bytes\n")
+            for stat in self.memory.statistics("lineno")[:limit]:
+                out.write(f"{stat}\n")
+        return out.getvalue()
+
+
+@contextmanager
+def profiled(cpu=True, memory=False):
+    """Run the block under cProfile and/or tracemalloc and yield a ProfileReport"""
+    report = ProfileReport()
+    profiler = None
+    if cpu:
+        import cProfile
+        profiler = cProfile.Profile()
+    if memory:
+        import tracemalloc
+        tracemalloc.start()
+    if profiler is not None:
+        profiler.enable()
+    try:
+        yield report
+    finally:
+        if profiler is not None:
+            profiler.disable()
+            import pstats
+            report.stats = pstats.Stats(profiler)
+        if memory:
+            report.memory = tracemalloc.take_snapshot()
+            report.peak_bytes = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
@@ -0,0 +1,324 @@
+import math
+import random
+import secrets
+
+
+def sieve_primes(limit):
+    """Return all primes below limit using the sieve of Eratosthenes"""
+    if limit < 3:
+        return []
+    sieve = bytearray([1]) * limit
+    sieve[0] = sieve[1] = 0
+    for i in range(2, int(limit ** 0.5) + 1):
+        if sieve[i]:
+            sieve[i * i::i] = bytearray(len(range(i * i, limit, i)))
+    return [i for i, flag in enumerate(sieve) if flag]
+
+
+# Small primes used to throw out most composites before any modular exponentiation
+SMALL_PRIME_LIMIT = 2000
+SMALL_PRIMES = sieve_primes(SMALL_PRIME_LIMIT)
+
+# Every n below this bound is decided exactly by the first 13 prime bases
+DETERMINISTIC_MR_LIMIT = 3317044064679887385961981
+DETERMINISTIC_MR_BASES = SMALL_PRIMES[:13]
+
+# Default number of random Miller-Rabin rounds above the deterministic bound
+DEFAULT_ROUNDS = 40
+
+MODE_MILLER_RABIN = "miller-rabin"
+MODE_BAILLIE_PSW = "baillie-psw"
+
+SEARCH_RANDOM = "random"
+SEARCH_INCREMENTAL = "incremental"
+
+# Prime searches draw from the OS CSPRNG unless the caller passes its own rng
+SYSTEM_RANDOM = secrets.SystemRandom()
+
+
+def small_prime_filter(n):
+    """Trial-divide by the small prime table: True/False if decided, None otherwise"""
+    if n < 2:
+        return False
+    for p in SMALL_PRIMES:
+        if n == p:
+            return True
+        if n % p == 0:
+            return False
+    if n < SMALL_PRIME_LIMIT * SMALL_PRIME_LIMIT:
+        return True
+    return None
+
+
+def _decompose(n):
+    """Write n - 1 as d * 2^s with d odd"""
+    d = n - 1
+    s = 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    return d, s
+
+
+def _is_strong_probable_prime(n, a, d, s):
+    """Run a single Miller-Rabin round for base a"""
+    x = pow(a, d, n)
+    if x == 1 or x == n - 1:
+        return True
+    for _ in range(s - 1):
+        x = x * x % n
+        if x == n - 1:
+            return True
+    return False
+
+
+def miller_rabin(n, rounds=DEFAULT_ROUNDS, rng=None):
+    """Miller-Rabin test, deterministic below DETERMINISTIC_MR_LIMIT"""
+    if n < 4:
+        return n in (2, 3)
+    if n % 2 == 0:
+        return False
+    d, s = _decompose(n)
+    if n < DETERMINISTIC_MR_LIMIT:
+        bases = [a for a in DETERMINISTIC_MR_BASES if a < n - 1]
+    else:
+        rng = rng or random
+        bases = [rng.randrange(2, n - 1) for _ in range(rounds)]
+    for a in bases:
+        if not _is_strong_probable_prime(n, a, d, s):
+            return False
+    return True
+
+
+def _jacobi(a, n):
+    """Compute the Jacobi symbol (a/n) for odd positive n"""
+    a %= n
+    result = 1
+    while a:
+        while a % 2 == 0:
+            a //= 2
+            if n % 8 in (3, 5):
+                result = -result
+        a, n = n, a
+        if a % 4 == 3 and n % 4 == 3:
+            result = -result
+        a %= n
+    return result if n == 1 else 0
+
+
+def _is_square(n):
+    """Check whether n is a perfect square"""
+    if n < 0:
+        return False
+    root = _isqrt(n)
+    return root * root == n
+
+
+def _isqrt(n):
+    """Integer square root by Newton's method"""
+    if n < 2:
+        return n
+    x = 1 << ((n.bit_length() + 1) // 2)
+    while True:
+        y = (x + n // x) // 2
+        if y >= x:
+            return x
+        x = y
+
+
+def strong_lucas(n):
+    """Strong Lucas probable prime test with Selfridge's parameters"""
+    if n < 2 or n % 2 == 0:
+        return n == 2
+    if _is_square(n):
+        return False
+
+    # Selfridge method A: first D in 5, -7, 9, -11, ... with (D/n) = -1
+    D = 5
+    while True:
+        j = _jacobi(D, n)
+        if j == -1:
+            break
+        if j == 0 and abs(D) != n:
+            return False
+        D = -D - 2 if D > 0 else -D + 2
+    P = 1
+    Q = (1 - D) // 4
+
+    # Write n + 1 = d * 2^s with d odd
+    d = n + 1
+    s = 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+
+    # Compute U_d, V_d and Q^d with a left-to-right binary ladder
+    U, V, Qk = 1, P, Q % n
+    for bit in bin(d)[3:]:
+        U = U * V % n
+        V = (V * V - 2 * Qk) % n
+        Qk = Qk * Qk % n
+        if bit == "1":
+            U, V = P * U + V, D * U + P * V
+            if U % 2:
+                U += n
+            if V % 2:
+                V += n
+            U, V = (U // 2) % n, (V // 2) % n
+            Qk = Qk * Q % n
+
+    if U == 0 or V == 0:
+        return True
+    for _ in range(s - 1):
+        V = (V * V - 2 * Qk) % n
+        if V == 0:
+            return True
+        Qk = Qk * Qk % n
+    return False
+
+
+def baillie_psw(n):
+    """Baillie-PSW test: a base-2 strong probable prime test plus a strong Lucas test"""
+    if n < 4:
+        return n in (2, 3)
+    if n % 2 == 0:
+        return False
+    d, s = _decompose(n)
+    if not _is_strong_probable_prime(n, 2, d, s):
+        return False
+    return strong_lucas(n)
+
+
+def strong_test(n, rounds=DEFAULT_ROUNDS, mode=MODE_MILLER_RABIN, rng=None):
+    """Run Miller-Rabin or Baillie-PSW without the small prime pre-filter"""
+    if mode == MODE_BAILLIE_PSW:
+        return baillie_psw(n)
+    if mode == MODE_MILLER_RABIN:
+        return miller_rabin(n, rounds, rng)
+    raise ValueError(f"Unknown primality mode: {mode}")
+
+
+def is_probable_prime(n, rounds=DEFAULT_ROUNDS, mode=MODE_MILLER_RABIN, rng=None):
+    """Sieve pre-filter followed by Miller-Rabin or Baillie-PSW"""
+    decided = small_prime_filter(n)
+    if decided is not None:
+        return decided
+    return strong_test(n, rounds, mode, rng)
+
+
+def random_odd(bits, rng=None):
+    """Draw a random odd integer with exactly the given number of bits"""
+    rng = rng or SYSTEM_RANDOM
+    return rng.getrandbits(bits) | (1 << (bits - 1)) | 1
+
+
+# Odd primes used by the incremental search; the first few thousand primes
+SIEVE_PRIME_COUNT = 4000
+SIEVE_PRIMES = sieve_primes(40000)[1:SIEVE_PRIME_COUNT + 1]
+
+# Number of odd candidates sieved at once by the incremental search
+SIEVE_WINDOW = 4096
+
+
+# Fraction of odd candidates left over after sieving by every SIEVE_PRIMES entry
+SIEVE_SURVIVAL = math.prod(1 - 1 / p for p in SIEVE_PRIMES)
+
+
+def expected_strong_tests(bits):
+    """Average number of sieve survivors the incremental search tests to find a prime of bits bits"""
+    # Primes make up 2 / ln(2^bits) of the odd numbers, and the sieve never removes them
+    return max(1.0, bits * math.log(2) / 2 * SIEVE_SURVIVAL)
+
+
+# (p + 1) / 2 is the inverse of 2 modulo each odd sieve prime
+_SIEVE_HALVES = [(p + 1) // 2 for p in SIEVE_PRIMES]
+
+
+def sieve_window(residues, window=SIEVE_WINDOW):
+    """Flag offsets k whose candidate base + 2k has a sieve prime factor
+
+    residues holds base modulo every entry of SIEVE_PRIMES.
+    """
+    composite = bytearray(window)
+    for p, r, half in zip(SIEVE_PRIMES, residues, _SIEVE_HALVES):
+        # smallest k with base + 2k ≡ 0 (mod p)
+        k = (p - r) * half % p
+        if k < window:
+            composite[k::p] = b"\x01" * ((window - 1 - k) // p + 1)
+    return composite
+
+
+def first_prime_in_window(base, test, window=SIEVE_WINDOW):
+    """Return the first prime among base, base + 2, ... inside one window, or None"""
+    composite = sieve_window([base % p for p in SIEVE_PRIMES], window)
+    k = composite.find(0)
+    while k != -1:
+        candidate = base + 2 * k
+        if test(candidate):
+            return candidate
+        k = composite.find(0, k + 1)
+    return None
+
+
+def incremental_prime_search(min_val, max_val, test, rng=None, window=SIEVE_WINDOW):
+    """Walk forward from a random odd start, sieving out multiples of small primes
+
+    The residues of the current window start modulo every sieve prime are kept
+    and advanced by one addition per window, so composites with a small factor
+    are discarded before test (the expensive strong test) ever runs.
+    """
+    if min_val <= SIEVE_PRIMES[-1]:
+        raise ValueError("Incremental search needs min_val above the sieve prime table")
+    if min_val > max_val:
+        raise ValueError("Empty range for prime search")
+    rng = rng or SYSTEM_RANDOM
+    first = min_val | 1
+    start = rng.randint(min_val, max_val) | 1
+    if start > max_val:
+        start = first
+    # offsets k in a window stand for base + 2k, so (2 * window) % p moves to the next window
+    steps = [(2 * window) % p for p in SIEVE_PRIMES]
+    base = start
+    residues = [base % p for p in SIEVE_PRIMES]
+    wrapped = False
+    while True:
+        composite = sieve_window(residues, window)
+        k = composite.find(0)
+        while k != -1:
+            candidate = base + 2 * k
+            if wrapped and candidate >= start:
+                raise ValueError("No prime found in range")
+            if candidate > max_val:
+                break
+            if test(candidate):
+                return candidate
+            k = composite.find(0, k + 1)
+        else:
+            base += 2 * window
+            residues = [(r + step) % p for p, r, step in zip(SIEVE_PRIMES, residues, steps)]
+            continue
+        # Walked past max_val: wrap around to the bottom of the range once
+        if wrapped:
+            raise ValueError("No prime found in range")
+        wrapped = True
+        base = first
+        residues = [base % p for p in SIEVE_PRIMES]
+
+
+def next_prime(n, rounds=DEFAULT_ROUNDS, mode=MODE_MILLER_RABIN):
+    """Return the smallest prime greater than n"""
+    candidate = max(n + 1, 2)
+    if candidate <= SIEVE_PRIMES[-1]:
+        while not is_probable_prime(candidate, rounds, mode):
+            candidate += 1
+        return candidate
+    base = candidate | 1
+
+    def test(value):
+        return strong_test(value, rounds, mode)
+
+    while True:
+        prime = first_prime_in_window(base, test)
+        if prime is not None:
+            return prime
+        base += 2 * SIEVE_WINDOW
@@ -0,0 +1,196 @@
+"""Compact binary formats for keys and ciphertexts.
+
+Keys use PKCS#1 DER (RSAPublicKey / RSAPrivateKey, including multi-prime
+OtherPrimeInfos), optionally wrapped in PEM. Per-character ciphertexts are
+stored as fixed-width big-endian blocks behind a small versioned header.
+Loaders accept any buffer (bytes, memoryview, mmap) and read integers straight
+out of memoryview slices without copying the input.
+"""
+import base64
+import struct
+
+CIPHERTEXT_MAGIC = b"RSAC"
+CIPHERTEXT_VERSION = 1
+
+# magic, version, block width in bytes, number of blocks
+_CIPHERTEXT_HEADER = struct.Struct(">4sBHQ")
+
+PEM_PUBLIC = "RSA PUBLIC KEY"
+PEM_PRIVATE = "RSA PRIVATE KEY"
+
+_INTEGER = 0x02
+_SEQUENCE = 0x30
+
+
+def _der_length(length):
+    if length < 0x80:
+        return bytes([length])
+    encoded = length.to_bytes((length.bit_length() + 7) // 8, "big")
+    return bytes([0x80 | len(encoded)]) + encoded
+
+
+def _der_integer(value):
+    if value < 0:
+        raise ValueError("Only non-negative integers are encoded")
+    # One extra bit keeps the sign bit clear, as DER integers are two's complement
+    body = value.to_bytes(value.bit_length() // 8 + 1, "big")
+    return bytes([_INTEGER]) + _der_length(len(body)) + body
+
+
+def _der_sequence(*items):
+    body = b"".join(items)
+    return bytes([_SEQUENCE]) + _der_length(len(body)) + body
+
+
+def _read_tlv(view, offset, expected_tag):
+    """Return (start, end) of the value of the DER element at offset"""
+    if offset + 2 > len(view):
+        raise ValueError("Truncated DER data")
+    if view[offset] != expected_tag:
+        raise ValueError(f"Expected DER tag {expected_tag:#04x}, found {view[offset]:#04x}")
+    length = view[offset + 1]
+    start = offset + 2
+    if length & 0x80:
+        count = length & 0x7F
+        length = int.from_bytes(view[start:start + count], "big")
+        start += count
+    end = start + length
+    if end > len(view):
+        raise ValueError("Truncated DER data")
+    return start, end
+
+
+def _read_integers(view, start, end):
+    """Read consecutive DER INTEGERs between start and end, stopping at the first non-integer"""
+    values = []
+    offset = start
+    while offset < end and view[offset] == _INTEGER:
+        value_start, value_end = _read_tlv(view, offset, _INTEGER)
+        values.append(int.from_bytes(view[value_start:value_end], "big", signed=True))
+        offset = value_end
+    return values, offset
+
+
+def public_key_der(rsa):
+    """PKCS#1 RSAPublicKey DER encoding of the key held by rsa"""
+    return _der_sequence(_der_integer(rsa.n), _der_integer(rsa.e))
+
+
+def private_key_der(rsa):
+    """PKCS#1 RSAPrivateKey DER encoding, version 1 with OtherPrimeInfos for multi-prime keys"""
+    if rsa.private_key_crt is None:
+        raise ValueError("The private key needs its primes and CRT parameters")
+    p, q, dP, dQ, q_inv = rsa.private_key_crt
+    fields = [_der_integer(1 if rsa.private_key_crt_extra else 0)]
+    fields += [_der_integer(value) for value in (rsa.n, rsa.e, rsa.d, p, q, dP, dQ, q_inv)]
+    if rsa.private_key_crt_extra:
+        fields.append(_der_sequence(*(
+            _der_sequence(_der_integer(prime), _der_integer(d_i), _der_integer(t_i))
+            for prime, d_i, t_i in rsa.private_key_crt_extra
+        )))
+    return _der_sequence(*fields)
+
+
+def to_pem(der, label):
+    """Wrap DER bytes in PEM armour"""
+    encoded = base64.encodebytes(der).decode("ascii").replace("\n", "")
+    lines = [encoded[i:i + 64] for i in range(0, len(encoded), 64)]
+    return f"-----BEGIN {label}-----\n" + "\n".join(lines) + f"\n-----END {label}-----\n"
+
+
+def from_pem(data):
+    """Return (label, der) from PEM text or bytes"""
+    if not isinstance(data, str):
+        data = bytes(data).decode("ascii")
+    lines = data.strip().splitlines()
+    if not lines or not lines[0].startswith("-----BEGIN ") or not lines[-1].startswith("-----END "):
+        raise ValueError("Not a PEM block")
+    label = lines[0][len("-----BEGIN "):].rstrip("-")
+    return label, base64.b64decode("".join(lines[1:-1]))
+
+
+def load_key_der(buffer, rsa):
+    """Load an RSAPublicKey or RSAPrivateKey DER structure from any buffer into rsa"""
+    with memoryview(buffer) as view:
+        start, end = _read_tlv(view, 0, _SEQUENCE)
+        values, offset = _read_integers(view, start, end)
+        extra = []
+        if offset < end:
+            others_start, others_end = _read_tlv(view, offset, _SEQUENCE)
+            offset = others_start
+            while offset < others_end:
+                info_start, info_end = _read_tlv(view, offset, _SEQUENCE)
+                triple, _ = _read_integers(view, info_start, info_end)
+                if len(triple) != 3:
+                    raise ValueError("Malformed OtherPrimeInfo")
+                extra.append(tuple(triple))
+                offset = info_end
+
+    if len(values) == 2:
+        rsa.n, rsa.e = values
+        rsa.d = rsa.p = rsa.q = rsa.phi_n = 0
+        rsa.extra_primes = ()
+    elif len(values) == 9:
+        _, rsa.n, rsa.e, rsa.d, rsa.p, rsa.q = values[:6]
+        rsa.extra_primes = tuple(prime for prime, _, _ in extra)
+        rsa.phi_n = (rsa.p - 1) * (rsa.q - 1)
+        for prime in rsa.extra_primes:
+            rsa.phi_n *= prime - 1
+    else:
+        raise ValueError("Not a PKCS#1 RSA key")
+    rsa.public_key = (rsa.n, rsa.e)
+    rsa.private_key = (rsa.n, rsa.d)
+    rsa.precompute_crt()
+    rsa.symbol_cache.clear()
+    return rsa
+
+
+def public_numbers(buffer):
+    """Return (n, e) from a public or private key DER without parsing the private fields"""
+    with memoryview(buffer) as view:
+        start, end = _read_tlv(view, 0, _SEQUENCE)
+        offset = start
+        values = []
+        while offset < end and len(values) < 3:
+            value_start, value_end = _read_tlv(view, offset, _INTEGER)
+            values.append(int.from_bytes(view[value_start:value_end], "big", signed=True))
+            offset = value_end
+            if len(values) == 2 and offset == end:
+                return tuple(values)
+    if len(values) != 3:
+        raise ValueError("Not a PKCS#1 RSA key")
+    # The private key form starts with its version number
+    return values[1], values[2]
+
+
+def pack_ciphertext(values, n):
+    """Pack per-character ciphertext ints as fixed-width big-endian blocks behind a header"""
+    width = (n.bit_length() + 7) // 8
+    values = list(values)
+    out = bytearray(_CIPHERTEXT_HEADER.pack(CIPHERTEXT_MAGIC, CIPHERTEXT_VERSION,
+                                            width, len(values)))
+    for value in values:
+        out += value.to_bytes(width, "big")
+    return bytes(out)
+
+
+def iter_ciphertext(buffer):
+    """Yield the ciphertext ints stored by pack_ciphertext, reading the buffer in place"""
+    with memoryview(buffer) as view:
+        if len(view) < _CIPHERTEXT_HEADER.size:
+            raise ValueError("Truncated ciphertext")
+        magic, version, width, count = _CIPHERTEXT_HEADER.unpack_from(view)
+        if magic != CIPHERTEXT_MAGIC:
+            raise ValueError("Not a packed RSA ciphertext")
+        if version != CIPHERTEXT_VERSION:
+            raise ValueError(f"Unsupported ciphertext format version {version}")
+        start = _CIPHERTEXT_HEADER.size
+        if len(view) < start + width * count:
+            raise ValueError("Truncated ciphertext")
+        for offset in range(start, start + width * count, width):
+            yield int.from_bytes(view[offset:offset + width], "big")
+
+
+def unpack_ciphertext(buffer):
+    """Return the list of ciphertext ints stored by pack_ciphertext"""
+    return list(iter_ciphertext(buffer))
@@ -0,0 +1,352 @@
+"""Long-lived local RSA service over a Unix socket or localhost TCP.
+
+The protocol is one JSON object per line in each direction. Requests look like
+{"id": 1, "op": "sign", "data": "<base64>", "deadline_ms": 500} and every
+request gets exactly one reply, {"id": 1, "ok": true, "result": ...} or
+{"id": 1, "ok": false, "error": "..."}, in whatever order they complete.
+
+  op       request fields            result
+  encrypt  text                      base64 of encrypt_blocks(text)
+  decrypt  data (base64)             text
+  sign     data (base64)             base64 signature
+  verify   data, signature (base64)  true or false
+"""
+import asyncio
+import base64
+import json
+import os
+import time
+
+from . import batch
+from .core import worker_instance
+
+OPERATIONS = ("encrypt", "decrypt", "sign", "verify")
+
+DEFAULT_PORT = 8765
+DEFAULT_WINDOW = 0.002
+DEFAULT_MAX_BATCH = 256
+DEFAULT_MAX_PENDING = 4096
+DEFAULT_DEADLINE = 5.0
+
+# Longest accepted request line
+MAX_LINE = 1 << 24
+
+
+def _decode(value):
+    return base64.b64decode(value, validate=True)
+
+
+def _encode(data):
+    return base64.b64encode(data).decode("ascii")
+
+
+def _handle(rsa, op, request):
+    """Run one request against rsa and return its JSON result"""
+    if op == "encrypt":
+        return _encode(rsa.encrypt_blocks(request["text"]))
+    if op == "decrypt":
+        return rsa.decrypt_blocks(_decode(request["data"]))
+    if op == "sign":
+        return _encode(rsa.sign(_decode(request["data"])))
+    return rsa.verify(_decode(request["data"]), _decode(request["signature"]))
+
+
+def _run_batch(state, op, requests):
+    """Run a batch of requests of one kind; runs inside a worker process"""
+    rsa = worker_instance(state)
+    results = []
+    for request in requests:
+        try:
+            results.append((True, _handle(rsa, op, request)))
+        except Exception as e:
+            # One bad request fails only itself, never the rest of its batch
+            results.append((False, f"bad request: {e}"))
+    return results
+
+
+class _Pending:
+    """One request waiting in the scheduler queue"""
+    __slots__ = ("request", "deadline", "future")
+
+    def __init__(self, request, deadline, future):
+        self.request = request
+        self.deadline = deadline
+        self.future = future
+
+
+class RSAService:
+    """asyncio server that batches requests and runs each batch on a process pool
+
+    Requests that arrive within window seconds of each other are grouped by
+    operation, up to max_batch per group, and each group is one pool task. At
+    most two batches per worker are in flight. Once max_pending requests are
+    queued, connections stop being read until the queue drains. A request whose
+    deadline passes before its batch is dispatched is answered with an error
+    without being run.
+    """
+
+    def __init__(self, rsa, workers=None, window=DEFAULT_WINDOW, max_batch=DEFAULT_MAX_BATCH,
+                 max_pending=DEFAULT_MAX_PENDING, executor=batch.EXECUTOR_PROCESS,
+                 default_deadline=DEFAULT_DEADLINE):
+        self.state = rsa._key_state()
+        self.workers = workers or os.cpu_count() or 1
+        self.window = window
+        self.max_batch = max_batch
+        self.max_pending = max_pending
+        self.executor_kind = executor
+        self.default_deadline = default_deadline
+        self.requests = 0
+        self.batches = 0
+        self.expired = 0
+        self._queue = None
+        self._pool = None
+        self._in_flight = None
+        self._server = None
+        self._scheduler = None
+        self._dispatches = set()
+
+    async def start(self, path=None, host="127.0.0.1", port=DEFAULT_PORT):
+        """Listen on the Unix socket at path, or on host:port when no path is given"""
+        self._queue = asyncio.Queue(self.max_pending)
+        self._in_flight = asyncio.Semaphore(2 * self.workers)
+        self._pool = batch.make_executor(self.executor_kind, self.workers)
+        self._scheduler = asyncio.create_task(self._schedule())
+        if path is not None:
+            self._server = await asyncio.start_unix_server(self._serve_client, path, limit=MAX_LINE)
+        else:
+            self._server = await asyncio.start_server(self._serve_client, host, port, limit=MAX_LINE)
+        return self._server
+
+    async def serve_forever(self, path=None, host="127.0.0.1", port=DEFAULT_PORT):
+        server = await self.start(path, host, port)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            await self.close()
+
+    async def close(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        if self._scheduler is not None:
+            self._scheduler.cancel()
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+
+    async def _serve_client(self, reader, writer):
+        loop = asyncio.get_running_loop()
+        replies = set()
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    # The line went over MAX_LINE, so the stream cannot be resynchronised
+                    break
+                if not line:
+                    break
+                request = None
+                try:
+                    request = json.loads(line)
+                    request_id = request.get("id")
+                    op = request["op"]
+                    if op not in OPERATIONS:
+                        raise ValueError(f"unknown op {op!r}")
+                    timeout = request.get("deadline_ms")
+                    timeout = self.default_deadline if timeout is None else timeout / 1000
+                except (AttributeError, KeyError, TypeError, ValueError) as e:
+                    request_id = request.get("id") if isinstance(request, dict) else None
+                    self._write(writer, request_id, False, f"bad request: {e}")
+                    continue
+                pending = _Pending(request, loop.time() + timeout, loop.create_future())
+                # Backpressure: a full queue stops this connection from being read
+                await self._queue.put(pending)
+                self.requests += 1
+                task = asyncio.create_task(self._reply(writer, request_id, pending.future))
+                replies.add(task)
+                task.add_done_callback(replies.discard)
+                # A client that stops reading its replies stops being read as well
+                await writer.drain()
+            if replies:
+                await asyncio.gather(*replies)
+        finally:
+            writer.close()
+
+    async def _reply(self, writer, request_id, future):
+        ok, result = await future
+        if not writer.is_closing():
+            self._write(writer, request_id, ok, result)
+
+    def _write(self, writer, request_id, ok, result):
+        reply = {"id": request_id, "ok": ok, "result" if ok else "error": result}
+        writer.write(json.dumps(reply).encode() + b"\n")
+
+    async def _schedule(self):
+        """Collect requests for one window and dispatch them in per-operation batches"""
+        loop = asyncio.get_running_loop()
+        while True:
+            collected = [await self._queue.get()]
+            window_end = loop.time() + self.window
+            while len(collected) < self.max_batch * len(OPERATIONS):
+                remaining = window_end - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    collected.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            groups = {}
+            now = loop.time()
+            for pending in collected:
+                if pending.deadline <= now:
+                    self.expired += 1
+                    pending.future.set_result((False, "deadline exceeded"))
+                else:
+                    groups.setdefault(pending.request["op"], []).append(pending)
+            for op, group in groups.items():
+                for start in range(0, len(group), self.max_batch):
+                    await self._in_flight.acquire()
+                    task = asyncio.create_task(self._dispatch(op, group[start:start + self.max_batch]))
+                    self._dispatches.add(task)
+                    task.add_done_callback(self._dispatches.discard)
+
+    async def _dispatch(self, op, group):
+        loop = asyncio.get_running_loop()
+        try:
+            # Requests can expire while waiting for a free worker slot
+            now = loop.time()
+            live = []
+            for pending in group:
+                if pending.deadline <= now:
+                    self.expired += 1
+                    pending.future.set_result((False, "deadline exceeded"))
+                else:
+                    live.append(pending)
+            if not live:
+                return
+            self.batches += 1
+            try:
+                results = await loop.run_in_executor(
+                    self._pool, _run_batch, self.state, op, [p.request for p in live])
+            except Exception as e:
+                results = [(False, f"internal error: {e}")] * len(live)
+            for pending, result in zip(live, results):
+                pending.future.set_result(result)
+        finally:
+            self._in_flight.release()
+
+
+class RSAClient:
+    """asyncio client for RSAService that can have many requests outstanding"""
+
+    def __init__(self, reader, writer):
+        self._reader = reader
+        self._writer = writer
+        self._next_id = 0
+        self._waiting = {}
+        self._listener = asyncio.create_task(self._listen())
+
+    @classmethod
+    async def connect(cls, path=None, host="127.0.0.1", port=DEFAULT_PORT):
+        if path is not None:
+            reader, writer = await asyncio.open_unix_connection(path, limit=MAX_LINE)
+        else:
+            reader, writer = await asyncio.open_connection(host, port, limit=MAX_LINE)
+        return cls(reader, writer)
+
+    async def _listen(self):
+        try:
+            while line := await self._reader.readline():
+                reply = json.loads(line)
+                future = self._waiting.pop(reply["id"], None)
+                if future is not None and not future.done():
+                    future.set_result(reply)
+        finally:
+            for future in self._waiting.values():
+                if not future.done():
+                    future.set_exception(ConnectionError("service closed the connection"))
+
+    async def request(self, op, deadline_ms=None, **fields):
+        """Send one request and return its result, raising ValueError on an error reply"""
+        self._next_id += 1
+        request = {"id": self._next_id, "op": op, **fields}
+        if deadline_ms is not None:
+            request["deadline_ms"] = deadline_ms
+        future = asyncio.get_running_loop().create_future()
+        self._waiting[self._next_id] = future
+        self._writer.write(json.dumps(request).encode() + b"\n")
+        await self._writer.drain()
+        reply = await future
+        if not reply["ok"]:
+            raise ValueError(reply["error"])
+        return reply["result"]
+
+    async def encrypt(self, text, deadline_ms=None):
+        return _decode(await self.request("encrypt", deadline_ms, text=text))
+
+    async def decrypt(self, data, deadline_ms=None):
+        return await self.request("decrypt", deadline_ms, data=_encode(data))
+
+    async def sign(self, data, deadline_ms=None):
+        return _decode(await self.request("sign", deadline_ms, data=_encode(data)))
+
+    async def verify(self, data, signature, deadline_ms=None):
+        return await self.request("verify", deadline_ms, data=_encode(data),
+                                  signature=_encode(signature))
+
+    async def close(self):
+        self._writer.close()
+        await self._writer.wait_closed()
+        self._listener.cancel()
+
+
+def _percentile(ordered, fraction):
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+async def load_test(path=None, host="127.0.0.1", port=DEFAULT_PORT, op="sign", requests=1000,
+                    concurrency=64, message_bytes=64, deadline_ms=None):
+    """Drive a running service with concurrency requests in flight and report latencies"""
+    client = await RSAClient.connect(path, host, port)
+    payload = os.urandom(message_bytes)
+    fields = {"data": _encode(payload)}
+    if op == "encrypt":
+        fields = {"text": payload.hex()}
+    elif op in ("decrypt", "verify"):
+        # Make one valid ciphertext or signature to send over and over
+        if op == "decrypt":
+            fields = {"data": _encode(await client.encrypt(payload.hex()))}
+        else:
+            fields["signature"] = _encode(await client.sign(payload))
+    latencies = []
+    errors = 0
+    remaining = requests
+
+    async def worker():
+        nonlocal remaining, errors
+        while remaining > 0:
+            remaining -= 1
+            start = time.perf_counter()
+            try:
+                await client.request(op, deadline_ms, **fields)
+            except ValueError:
+                errors += 1
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    await client.close()
+    latencies.sort()
+    return {
+        "op": op,
+        "requests": requests,
+        "concurrency": concurrency,
+        "errors": errors,
+        "requests_per_second": requests / elapsed,
+        "p50_seconds": _percentile(latencies, 0.50),
+        "p99_seconds": _percentile(latencies, 0.99),
+        "max_seconds": latencies[-1],
+    }
@@ -0,0 +1,176 @@
+import hashlib
+import hmac
+import mmap
+import os
+import secrets
+import stat
+import struct
+
+MAGIC = b"RKEM"
+VERSION = 1
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+# magic, version, chunk size, length of the wrapped session secret
+_HEADER = struct.Struct(">4sBIH")
+# final-chunk flag and chunk length in front of every encrypted chunk
+_RECORD = struct.Struct(">BI")
+TAG_SIZE = hashlib.sha256().digest_size
+
+
+def open_source(f):
+    """Return a readable view of f, memory-mapped when f is a non-empty regular file"""
+    try:
+        info = os.fstat(f.fileno())
+    except (AttributeError, OSError):
+        return f
+    if stat.S_ISREG(info.st_mode) and info.st_size > 0:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        mapped.seek(f.tell())
+        return mapped
+    return f
+
+
+def _release_pages(source, unread=0):
+    """Drop the already consumed pages of a memory map so resident memory stays flat
+
+    unread is how many bytes before the current position are still in use.
+    Other sources are left alone, as pipes cannot even report a position.
+    """
+    if isinstance(source, mmap.mmap) and hasattr(mmap, "MADV_DONTNEED"):
+        end = source.tell() - unread
+        end -= end % mmap.PAGESIZE
+        if end > 0:
+            source.madvise(mmap.MADV_DONTNEED, 0, end)
+
+
+def iter_chunks(source, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Yield (data, is_final) pairs of at most chunk_size bytes from a readable source"""
+    current = source.read(chunk_size)
+    while True:
+        following = source.read(chunk_size) if len(current) == chunk_size else b""
+        yield current, not following
+        if not following:
+            return
+        _release_pages(source, len(following))
+        current = following
+
+
+def wrap_session_key(rsa):
+    """Encapsulate a fresh random secret under the public key: returns (secret, wrapped)"""
+    n, e = rsa.public_key
+    width = (n.bit_length() + 7) // 8
+    r = secrets.randbelow(n - 3) + 2
+    wrapped = pow(r, e, n).to_bytes(width, "big")
+    return _derive_secret(r, wrapped, width), wrapped
+
+
+def unwrap_session_key(rsa, wrapped):
+    """Recover the secret encapsulated by wrap_session_key with the private key"""
+    n = rsa.public_key[0]
+    width = (n.bit_length() + 7) // 8
+    r = rsa.private_operation(int.from_bytes(wrapped, "big"))
+    return _derive_secret(r, wrapped, width)
+
+
+def _derive_secret(r, wrapped, width):
+    return hashlib.sha256(r.to_bytes(width, "big") + wrapped).digest()
+
+
+class _ChunkCipher:
+    """Hash-based stream cipher with a MAC per chunk, keyed from the session secret"""
+
+    def __init__(self, secret):
+        self.enc_key = hmac.new(secret, b"encrypt", hashlib.sha256).digest()
+        self.mac_key = hmac.new(secret, b"authenticate", hashlib.sha256).digest()
+
+    def _xor(self, index, data):
+        if not data:
+            return b""
+        keystream = hashlib.shake_256(self.enc_key + index.to_bytes(8, "big")).digest(len(data))
+        mixed = int.from_bytes(data, "big") ^ int.from_bytes(keystream, "big")
+        return mixed.to_bytes(len(data), "big")
+
+    def _tag(self, index, record, body):
+        return hmac.new(self.mac_key, index.to_bytes(8, "big") + record + body,
+                        hashlib.sha256).digest()
+
+    def seal(self, index, data, is_final):
+        body = self._xor(index, data)
+        record = _RECORD.pack(is_final, len(body))
+        return record + body + self._tag(index, record, body)
+
+    def open(self, index, record, body, tag):
+        if not hmac.compare_digest(tag, self._tag(index, record, body)):
+            raise ValueError(f"Authentication failed for chunk {index}")
+        return self._xor(index, body)
+
+
+def encrypt_chunks(rsa, chunks, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Yield the header and then one sealed record per (data, is_final) chunk"""
+    secret, wrapped = wrap_session_key(rsa)
+    yield _HEADER.pack(MAGIC, VERSION, chunk_size, len(wrapped)) + wrapped
+    cipher = _ChunkCipher(secret)
+    for index, (data, is_final) in enumerate(chunks):
+        yield cipher.seal(index, data, is_final)
+
+
+def decrypt_chunks(rsa, source):
+    """Read a stream written by encrypt_chunks and yield the plaintext chunk by chunk"""
+    header = _read_exact(source, _HEADER.size)
+    magic, version, chunk_size, wrapped_size = _HEADER.unpack(header)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("Not an RSA-KEM stream or unsupported version")
+    cipher = _ChunkCipher(unwrap_session_key(rsa, _read_exact(source, wrapped_size)))
+    index = 0
+    while True:
+        record = _read_exact(source, _RECORD.size)
+        is_final, size = _RECORD.unpack(record)
+        if size > chunk_size:
+            raise ValueError(f"Chunk {index} is larger than the declared chunk size")
+        body = _read_exact(source, size)
+        yield cipher.open(index, record, body, _read_exact(source, TAG_SIZE))
+        if is_final:
+            return
+        _release_pages(source)
+        index += 1
+
+
+def _read_exact(source, size):
+    data = source.read(size)
+    if len(data) != size:
+        raise ValueError("Truncated RSA-KEM stream")
+    return data
+
+
+def encrypt_stream(rsa, src, dst, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Encrypt the binary file object src into dst with constant memory"""
+    source = open_source(src)
+    try:
+        for piece in encrypt_chunks(rsa, iter_chunks(source, chunk_size), chunk_size):
+            dst.write(piece)
+    finally:
+        if source is not src:
+            source.close()
+
+
+def decrypt_stream(rsa, src, dst):
+    """Decrypt the binary file object src into dst with constant memory"""
+    source = open_source(src)
+    try:
+        for piece in decrypt_chunks(rsa, source):
+            dst.write(piece)
+    finally:
+        if source is not src:
+            source.close()
+
+
+def encrypt_file(rsa, in_path, out_path, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Encrypt the file at in_path into out_path"""
+    with open(in_path, "rb") as src, open(out_path, "wb") as dst:
+        encrypt_stream(rsa, src, dst, chunk_size)
+
+
+def decrypt_file(rsa, in_path, out_path):
+    """Decrypt the file at in_path into out_path"""
+    with open(in_path, "rb") as src, open(out_path, "wb") as dst:
+        decrypt_stream(rsa, src, dst)
@@ -0,0 +1,83 @@
+import sys
+from collections import OrderedDict
+
+# Default memory budget for the cached tables of one key
+DEFAULT_MAX_BYTES = 4 << 20
+
+# Rough per-entry cost of an OrderedDict slot and its link, on top of key and value
+_ENTRY_OVERHEAD = 100
+
+
+class SymbolCache:
+    """Per-key LRU tables mapping code points to ciphertexts and back
+
+    In the per-character mode every character maps to the same ciphertext, so
+    both directions are filled lazily from whichever operation sees a symbol
+    first. The tables are dropped whenever the key they were built for changes.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES, powmod=pow):
+        self.max_bytes = max_bytes
+        self.powmod = powmod
+        self.key = None
+        self.n = 0  # Modulus of the bound key
+        self.max_entries = 0
+        self.hits = 0
+        self.misses = 0
+        self._encrypt = OrderedDict()
+        self._decrypt = OrderedDict()
+
+    def bind(self, public_key, private_key):
+        """Make sure the tables belong to the given key, clearing them otherwise"""
+        key = (public_key, private_key)
+        if key != self.key:
+            self.clear()
+            self.key = key
+            n = self.n = public_key[0]
+            entry_bytes = 2 * (sys.getsizeof(n) + _ENTRY_OVERHEAD)
+            self.max_entries = self.max_bytes // entry_bytes
+
+    def clear(self):
+        self.key = None
+        self._encrypt.clear()
+        self._decrypt.clear()
+
+    def __len__(self):
+        return len(self._encrypt) + len(self._decrypt)
+
+    def _store(self, table, key, value):
+        table[key] = value
+        if len(table) > self.max_entries:
+            table.popitem(last=False)
+
+    def encrypt(self, m, e, n):
+        """Return m^e mod n from the table, computing and remembering it on a miss"""
+        c = self._encrypt.get(m)
+        if c is not None:
+            self._encrypt.move_to_end(m)
+            self.hits += 1
+            return c
+        self.misses += 1
+        c = self.powmod(m, e, n)
+        if self.max_entries:
+            self._store(self._encrypt, m, c)
+            # A code point of n or more only decrypts back to m mod n, so it has no reverse entry
+            if m < n:
+                self._store(self._decrypt, c, m)
+        return c
+
+    def decrypt(self, c, private_operation):
+        """Return the plaintext of c from the table, computing and remembering it on a miss"""
+        m = self._decrypt.get(c)
+        if m is not None:
+            self._decrypt.move_to_end(c)
+            self.hits += 1
+            return m
+        self.misses += 1
+        m = private_operation(c)
+        if self.max_entries:
+            self._store(self._decrypt, c, m)
+            # Likewise m only encrypts to c when c is already reduced
+            if c < self.n:
+                self._store(self._encrypt, m, c)
+        return m
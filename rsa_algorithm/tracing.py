@@ -0,0 +1,133 @@
+class NullTracer:
+    """Tracer that records nothing; the default for library and CLI callers"""
+    enabled = False
+
+    def step(self, template, *args):
+        pass
+
+    def progress(self, done, total):
+        pass
+
+    def __iter__(self):
+        return iter(())
+
+    def __len__(self):
+        return 0
+
+    def lines(self):
+        return []
+
+
+class LazyTracer:
+    """Tracer that keeps step templates and arguments and only formats them when read"""
+    enabled = True
+
+    def __init__(self):
+        self._records = []
+
+    def step(self, template, *args):
+        self._records.append((template, args))
+
+    def progress(self, done, total):
+        """Called after each item of a traced operation; subclasses can report or cancel here"""
+
+    def __iter__(self):
+        for template, args in self._records:
+            yield template.format(*args) if args else template
+
+    def __len__(self):
+        return len(self._records)
+
+    def __getitem__(self, index):
+        template, args = self._records[index]
+        return template.format(*args) if args else template
+
+    def lines(self):
+        return list(self)
+
+
+class _SymbolSteps:
+    """Steps of a traced per-character encrypt or decrypt, formatted on demand
+
+    Only the key, the message and the ciphertext are kept. Step i past the
+    header is line (i - 2) % 5 of character (i - 2) // 5, built when it is
+    indexed, so a view over a long message holds no step strings of its own.
+    The templates match the ones RSA_Implementation.encrypt and decrypt record.
+    """
+    title = None
+    key_template = None
+    templates = ()
+    footer_templates = ()
+
+    def __init__(self, key, message, encrypted):
+        self.key = key
+        self.message = message
+        self.encrypted = encrypted
+
+    def symbol_args(self, i):
+        raise NotImplementedError
+
+    def footer_args(self):
+        return ()
+
+    def __len__(self):
+        return 2 + len(self.templates) * len(self.message) + len(self.footer_templates)
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        if index == 0:
+            return self.title
+        if index == 1:
+            return self.key_template.format(self.key)
+        i, line = divmod(index - 2, len(self.templates))
+        if i < len(self.message):
+            templates, args = self.templates, self.symbol_args(i)
+        else:
+            templates, args = self.footer_templates, self.footer_args()
+            line = index - 2 - len(self.templates) * len(self.message)
+        return templates[line].format(*args[line]) if args[line] else templates[line]
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+    def lines(self):
+        return list(self)
+
+
+class EncryptionSteps(_SymbolSteps):
+    """The steps RSA_Implementation.encrypt records, rebuilt from the message and ciphertext"""
+    title = "ENCRYPTION PROCESS"
+    key_template = "Using public key (n, e) = {}"
+    templates = ("\nEncrypting character '{}' (position {}):", "1. Convert to ASCII: '{}' → {}",
+                 "2. Apply formula c = m^e mod n:", "   c = {}^{} mod {}", "3. Result: c = {}")
+
+    def symbol_args(self, i):
+        n, e = self.key
+        char = self.message[i]
+        m = ord(char)
+        return (char, i + 1), (char, m), (), (m, e, n), (self.encrypted[i],)
+
+
+class DecryptionSteps(_SymbolSteps):
+    """The steps RSA_Implementation.decrypt records, rebuilt from the ciphertext and message"""
+    title = "DECRYPTION PROCESS"
+    key_template = "Using private key (n, d) = {}"
+    templates = ("\nDecrypting cipher value {} (position {}):", "1. Apply formula m = c^d mod n:",
+                 "   m = {}^{} mod {}", "2. Result: m = {}", "3. Convert to character: {} → '{}'")
+    footer_templates = ("\nFinal decrypted message: '{}'",)
+
+    def symbol_args(self, i):
+        n, d = self.key
+        c = self.encrypted[i]
+        char = self.message[i]
+        m = ord(char)
+        return (c, i + 1), (), (c, d, n), (m,), (m, char)
+
+    def footer_args(self):
+        return ((self.message,),)
+
+
+NULL_TRACER = NullTracer()
@@ -0,0 +1,83 @@
+# Moduli up to this many bits are handled with uint64 arithmetic
+MAX_MODULUS_BITS = 48
+
+np = None  # NumPy once load_numpy has imported it
+_numpy_checked = False
+
+
+def load_numpy():
+    """Import NumPy on first use and return it, or None when it is not installed
+
+    The import is deferred because it costs tens of milliseconds and only
+    demonstration-sized moduli use this module.
+    """
+    global np, _numpy_checked
+    if not _numpy_checked:
+        _numpy_checked = True
+        try:
+            import numpy
+            np = numpy
+        except ImportError:  # NumPy is optional; callers fall back to Python ints
+            pass
+    return np
+
+
+def available(n):
+    """Check whether the vectorized backend can work modulo n"""
+    return 1 < n and n.bit_length() <= MAX_MODULUS_BITS and load_numpy() is not None
+
+
+def _mulmod(a, b, n, bits):
+    """Elementwise a * b mod n for arrays of values below n < 2^bits
+
+    When the product does not fit in 64 bits, b is split into chunks of
+    63 - bits bits and folded in with Horner's rule so that every
+    intermediate value stays below 2^64.
+    """
+    if 2 * bits <= 64:
+        return a * b % n
+    shift = 63 - bits
+    mask = np.uint64((1 << shift) - 1)
+    chunks = -(-bits // shift)
+    result = np.zeros_like(a)
+    for i in reversed(range(chunks)):
+        chunk = (b >> np.uint64(i * shift)) & mask
+        result = ((result << np.uint64(shift)) % n + a * chunk % n) % n
+    return result
+
+
+def powmod(base, exponent, n):
+    """Elementwise base^exponent mod n by left-to-right square-and-multiply over arrays"""
+    bits = n.bit_length()
+    modulus = np.uint64(n)
+    base = np.asarray(base, dtype=np.uint64) % modulus
+    result = np.ones_like(base)
+    if n == 1:
+        return np.zeros_like(base)
+    for bit in bin(exponent)[2:]:
+        result = _mulmod(result, result, modulus, bits)
+        if bit == "1":
+            result = _mulmod(result, base, modulus, bits)
+    return result
+
+
+def encrypt(message, e, n):
+    """Encrypt every character of message as one array operation"""
+    codes = np.fromiter(map(ord, message), dtype=np.uint64, count=len(message))
+    return powmod(codes, e, n).tolist()
+
+
+def decrypt(encrypted_message, n, d, crt=None):
+    """Decrypt a list of per-character ciphertexts, using the CRT when (p, q, dP, dQ, qInv) is given"""
+    values = np.fromiter(encrypted_message, dtype=np.uint64)
+    if crt is None:
+        return "".join(map(chr, powmod(values, d, n).tolist()))
+    p, q, dP, dQ, q_inv = crt
+    m1 = powmod(values, dP, p)
+    m2 = powmod(values, dQ, q)
+    p_mod = np.uint64(p)
+    # (m1 - m2) mod p without going negative in unsigned arithmetic
+    diff = (m1 + p_mod - m2 % p_mod) % p_mod
+    h = _mulmod(np.full_like(diff, q_inv % p), diff, p_mod, p.bit_length())
+    m = m2 + h * np.uint64(q)
+    return "".join(map(chr, m.tolist()))
@@ -0,0 +1,105 @@
+import math
+import random
+import unittest
+
+from rsa_algorithm import arith, primality
+
+# Strong pseudoprime to every prime base up to 37
+STRONG_PSEUDOPRIME = 3825123056546413051
+CARMICHAEL = (561, 1105, 1729, 2465, 2821, 6601, 8911, 41041, 825265, 321197185)
+MERSENNE_521 = (1 << 521) - 1
+
+
+class BackendTests:
+    """Checks every arithmetic backend must pass; subclasses name the backend"""
+    backend_name = None
+
+    def setUp(self):
+        self.backend = arith.get_backend(self.backend_name)
+        self.reference = arith.PythonBackend()
+        self.rng = random.Random(1234)
+
+    def test_small_numbers(self):
+        for mode in (primality.MODE_MILLER_RABIN, primality.MODE_BAILLIE_PSW):
+            primes = [n for n in range(-5, 200) if self.backend.is_prime(n, mode=mode)]
+            self.assertEqual(primes, [n for n in range(2, 200)
+                                      if all(n % d for d in range(2, math.isqrt(n) + 1))])
+
+    def test_known_primes(self):
+        for mode in (primality.MODE_MILLER_RABIN, primality.MODE_BAILLIE_PSW):
+            with self.subTest(mode=mode):
+                self.assertTrue(self.backend.is_prime(MERSENNE_521, mode=mode))
+                self.assertTrue(self.backend.is_prime((1 << 127) - 1, mode=mode))
+                self.assertFalse(self.backend.is_prime(MERSENNE_521 + 2, mode=mode))
+
+    def test_pseudoprimes_are_composite(self):
+        for mode in (primality.MODE_MILLER_RABIN, primality.MODE_BAILLIE_PSW):
+            for n in CARMICHAEL + (STRONG_PSEUDOPRIME,):
+                with self.subTest(mode=mode, n=n):
+                    self.assertFalse(self.backend.is_prime(n, mode=mode))
+
+    def test_next_prime(self):
+        self.assertEqual(self.backend.next_prime(1 << 64), (1 << 64) + 13)
+        self.assertEqual(self.backend.next_prime(13), 17)
+
+    def test_powmod_matches_reference(self):
+        for bits in (64, 512, 2048):
+            modulus = self.rng.getrandbits(bits) | 1
+            for _ in range(20):
+                a, b = self.rng.getrandbits(bits), self.rng.getrandbits(bits)
+                self.assertEqual(self.backend.powmod(a, b, modulus),
+                                 self.reference.powmod(a, b, modulus))
+        self.assertEqual(self.backend.powmod(5, 0, 7), 1)
+        self.assertEqual(self.backend.powmod(5, 3, 1), 0)
+
+    def test_results_are_python_ints(self):
+        self.assertIs(type(self.backend.powmod(3, 5, 7)), int)
+        self.assertIs(type(self.backend.invert(3, 7)), int)
+        self.assertIs(type(self.backend.gcd(12, 18)), int)
+
+    def test_gcd_and_invert_match_reference(self):
+        for bits in (64, 512, 2048):
+            modulus = self.rng.getrandbits(bits) | 1
+            for _ in range(20):
+                a = self.rng.getrandbits(bits)
+                self.assertEqual(self.backend.gcd(a, modulus), self.reference.gcd(a, modulus))
+                if math.gcd(a, modulus) == 1:
+                    self.assertEqual(self.backend.invert(a, modulus),
+                                     self.reference.invert(a, modulus))
+
+    def test_invert_without_inverse(self):
+        with self.assertRaises(ValueError):
+            self.backend.invert(6, 9)
+
+    def test_batch_invert(self):
+        for bits in (64, 512, 2048):
+            modulus = self.rng.getrandbits(bits) | 1
+            units = [a for a in (self.rng.getrandbits(bits) for _ in range(20))
+                     if math.gcd(a, modulus) == 1]
+            self.assertEqual(self.backend.batch_invert(units, modulus),
+                             [self.reference.invert(a, modulus) for a in units])
+        self.assertEqual(self.backend.batch_invert([], 7), [])
+        with self.assertRaises(ValueError):
+            self.backend.batch_invert([2, 3], 9)
+
+
+class PythonBackendTest(BackendTests, unittest.TestCase):
+    backend_name = "python"
+
+
+@unittest.skipIf(arith.gmpy2 is None, "gmpy2 is not installed")
+class Gmpy2BackendTest(BackendTests, unittest.TestCase):
+    backend_name = "gmpy2"
+
+
+class GetBackendTest(unittest.TestCase):
+    def test_unknown_backend(self):
+        with self.assertRaises(ValueError):
+            arith.get_backend("nope")
+
+    def test_every_backend_is_covered(self):
+        self.assertLessEqual(set(arith.BACKENDS), {"python", "gmpy2"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,36 @@
+import threading
+import unittest
+
+from rsa_algorithm import batch
+from rsa_algorithm.core import RSA_Implementation, worker_instance
+
+
+class WorkerInstanceTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.rsa = RSA_Implementation(blinding=True)
+        cls.rsa.generate_keys(bits=512, seed=1, e=65537)
+
+    def test_instance_is_reused_per_key(self):
+        state = self.rsa._key_state()
+        self.assertIs(worker_instance(state), worker_instance(state))
+        other = RSA_Implementation()
+        other.generate_keys(bits=512, seed=2, e=65537)
+        self.assertIsNot(worker_instance(other._key_state()), worker_instance(state))
+
+    def test_blinded_chunks_do_not_leak_threads(self):
+        messages = [f"message {i}" for i in range(100)]
+        encrypted = list(self.rsa.encrypt_many(messages, workers=1, blocks=True,
+                                               executor=batch.EXECUTOR_THREAD, chunk_size=1))
+        before = threading.active_count()
+        decrypted = list(self.rsa.decrypt_many(encrypted, workers=1, blocks=True,
+                                               executor=batch.EXECUTOR_THREAD, chunk_size=1))
+        self.assertEqual(decrypted, messages)
+        refills = [thread for thread in threading.enumerate()
+                   if thread.name == "rsa-blinding-refill"]
+        self.assertLessEqual(len(refills), 2)
+        self.assertLessEqual(threading.active_count(), before + 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
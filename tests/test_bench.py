@@ -0,0 +1,33 @@
+import unittest
+
+from rsa_algorithm import bench
+
+
+def _results(backend="gmpy2", seconds=1.0):
+    return {"version": bench.SUITE_VERSION, "seed": bench.SUITE_SEED, "python": "3.11.0",
+            "machine": "x86_64", "backend": backend,
+            "cases": {"encrypt/512/16": {"min_seconds": seconds, "median_seconds": seconds,
+                                         "runs": 3}}}
+
+
+class CompareToBaselineTest(unittest.TestCase):
+    def test_regression_is_reported(self):
+        regressions = bench.compare_to_baseline(_results(seconds=1.5), _results(seconds=1.0))
+        self.assertEqual([row["case"] for row in regressions], ["encrypt/512/16"])
+
+    def test_within_threshold(self):
+        self.assertEqual(bench.compare_to_baseline(_results(seconds=1.05), _results()), [])
+
+    def test_different_backend_is_rejected(self):
+        with self.assertRaisesRegex(ValueError, "backend"):
+            bench.compare_to_baseline(_results(backend="python"), _results(backend="gmpy2"))
+
+    def test_different_seed_is_rejected(self):
+        baseline = _results()
+        baseline["seed"] += 1
+        with self.assertRaises(ValueError):
+            bench.compare_to_baseline(_results(), baseline)
+
+
+if __name__ == "__main__":
+    unittest.main()
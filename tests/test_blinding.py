@@ -0,0 +1,102 @@
+import threading
+import time
+import unittest
+from unittest import mock
+
+from rsa_algorithm import arith, blinding
+from rsa_algorithm.blinding import BlindingCache
+from rsa_algorithm.core import RSA_Implementation
+
+
+def _refill_threads():
+    return [thread for thread in threading.enumerate() if thread.name == "rsa-blinding-refill"]
+
+
+class BlindingCacheTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        rsa = RSA_Implementation()
+        rsa.generate_keys(bits=512, seed=24, e=65537)
+        cls.n, cls.e = rsa.public_key
+
+    def make_cache(self, **options):
+        cache = BlindingCache(self.n, self.e, arith.get_backend(), **options)
+        self.addCleanup(cache.close)
+        return cache
+
+    def assertValidPair(self, blind, unblind):
+        self.assertEqual(blind * pow(unblind, self.e, self.n) % self.n, 1)
+
+    def wait_for(self, condition, timeout=5.0):
+        deadline = time.monotonic() + timeout
+        while not condition():
+            if time.monotonic() > deadline:
+                self.fail("timed out")
+            time.sleep(0.01)
+
+    def test_squared_pairs_stay_valid(self):
+        cache = self.make_cache(size=1, refresh_uses=8)
+        cache.prefill()
+        previous = None
+        for _ in range(7):
+            blind, unblind = cache.take()
+            self.assertValidPair(blind, unblind)
+            if previous is not None:
+                # Each use hands out the square of the pair before it
+                self.assertEqual((blind, unblind),
+                                 (previous[0] ** 2 % self.n, previous[1] ** 2 % self.n))
+            previous = blind, unblind
+        self.assertEqual((cache.hits, cache.misses), (7, 0))
+
+    def test_pair_retires_after_refresh_uses(self):
+        cache = self.make_cache(size=1, refresh_uses=3)
+        cache.prefill()
+        first = cache.take()
+        cache.take()
+        cache.take()
+        # The third use retired the pair rather than squaring it back into the pool
+        with cache._lock:
+            self.assertTrue(all(pair[2] == 0 for pair in cache._pairs))
+        blind, unblind = cache.take()
+        self.assertValidPair(blind, unblind)
+        self.assertNotEqual(blind, pow(first[0], 8, self.n))
+
+    def test_empty_pool_counts_a_miss(self):
+        cache = self.make_cache()
+        blind, unblind = cache.take()
+        self.assertValidPair(blind, unblind)
+        self.assertEqual((cache.hits, cache.misses), (0, 1))
+
+    def test_refill_thread_exits_when_idle(self):
+        with mock.patch.object(blinding, "IDLE_SECONDS", 0.05):
+            cache = self.make_cache(size=3)
+            cache.start()
+            thread = cache._thread
+            self.assertIn(thread, _refill_threads())
+            self.wait_for(lambda: cache._thread is None)
+            thread.join(timeout=5.0)
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(len(cache._pairs), 3)
+        # Taking a pair starts the thread again to replace it
+        for _ in range(cache.refresh_uses):
+            self.assertValidPair(*cache.take())
+        self.wait_for(lambda: len(cache._pairs) == 3)
+
+    def test_close_stops_the_refill_thread(self):
+        with mock.patch.object(blinding, "IDLE_SECONDS", 60.0):
+            cache = self.make_cache(size=2)
+            cache.start()
+            self.wait_for(lambda: len(cache._pairs) == 2)
+            thread = cache._thread
+            self.assertTrue(thread.is_alive())
+            cache.close()
+            thread.join(timeout=5.0)
+            self.assertFalse(thread.is_alive())
+            self.assertIsNone(cache._thread)
+            # A closed cache still blinds, without starting a new thread
+            self.assertValidPair(*cache.take())
+            self.assertIsNone(cache._thread)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+import unittest
+
+from rsa_algorithm.core import RSA_Implementation
+from rsa_algorithm.engine import RSAEngine
+
+
+class DecryptBlocksRejectionTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.rsa = RSA_Implementation()
+        cls.rsa.generate_keys(bits=512, seed=1, e=65537)
+        cls.other = RSA_Implementation()
+        cls.other.generate_keys(bits=512, seed=2, e=65537)
+        cls.engine = RSAEngine()
+        cls.public, cls.private = cls.rsa.export_keys()
+
+    def decryptors(self):
+        yield self.rsa.decrypt_blocks
+        yield lambda data: self.engine.decrypt_blocks(self.private, data)
+
+    def test_round_trip(self):
+        message = "block mode ✓" * 20
+        for decrypt in self.decryptors():
+            self.assertEqual(decrypt(self.rsa.encrypt_blocks(message)), message)
+
+    def test_wrong_key_raises_value_error(self):
+        encrypted = self.other.encrypt_blocks("secret" * 10)
+        for decrypt in self.decryptors():
+            with self.assertRaises(ValueError):
+                decrypt(encrypted)
+
+    def test_junk_raises_value_error(self):
+        size = self.public.size
+        for junk in (b"\xff" * size, bytes(range(size)), b"\x01" * size * 3):
+            for decrypt in self.decryptors():
+                with self.assertRaises(ValueError):
+                    decrypt(junk)
+
+    def test_ciphertext_not_below_modulus(self):
+        block = self.public.n.to_bytes(self.public.size, "big")
+        for decrypt in self.decryptors():
+            with self.assertRaisesRegex(ValueError, "Invalid ciphertext block"):
+                decrypt(block)
+
+    def test_partial_block(self):
+        for decrypt in self.decryptors():
+            with self.assertRaises(ValueError):
+                decrypt(b"\x00" * (self.public.size + 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
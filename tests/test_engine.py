@@ -0,0 +1,103 @@
+import pickle
+import threading
+import unittest
+
+from rsa_algorithm import serialization
+from rsa_algorithm.core import RSA_Implementation
+from rsa_algorithm.engine import RSAEngine
+from rsa_algorithm.keys import PrivateKey
+
+
+class KeyObjectTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.rsa = RSA_Implementation()
+        cls.rsa.generate_keys(bits=768, seed=3, e=65537, primes=3)
+        cls.public, cls.private = cls.rsa.export_keys()
+
+    def test_keys_are_immutable(self):
+        for key, name in ((self.public, "n"), (self.private, "d")):
+            with self.assertRaises(AttributeError):
+                setattr(key, name, 3)
+            with self.assertRaises(AttributeError):
+                delattr(key, name)
+            with self.assertRaises(AttributeError):
+                key.other = 1
+
+    def test_constructor_matches_export(self):
+        rsa = self.rsa
+        built = PrivateKey(rsa.n, rsa.e, rsa.d, rsa.p, rsa.q, rsa.extra_primes)
+        self.assertEqual(built, self.private)
+        self.assertEqual(built.private_key_crt, rsa.private_key_crt)
+        self.assertEqual(built.extra, rsa.private_key_crt_extra)
+        self.assertEqual(self.public.size, (rsa.n.bit_length() + 7) // 8)
+
+    def test_wrong_primes(self):
+        rsa = self.rsa
+        with self.assertRaises(ValueError):
+            PrivateKey(rsa.n, rsa.e, rsa.d, rsa.p, rsa.q)
+
+    def test_pickle_and_der(self):
+        self.assertEqual(pickle.loads(pickle.dumps(self.private)).private_key_crt,
+                         self.private.private_key_crt)
+        self.assertEqual(pickle.loads(pickle.dumps(self.public)), self.public)
+        self.assertEqual(serialization.private_key_der(self.private),
+                         serialization.private_key_der(self.rsa))
+
+    def test_repr_hides_private_parameters(self):
+        self.assertNotIn(str(self.private.d), repr(self.private))
+
+    def test_from_keys(self):
+        rsa = RSA_Implementation.from_keys(self.public, self.private)
+        self.assertEqual(rsa._key_state(), self.rsa._key_state())
+        public_only = RSA_Implementation.from_keys(self.public)
+        self.assertIsNone(public_only.private_key_crt)
+
+
+class EngineTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.keys = []
+        for e in (65537, 3):
+            rsa = RSA_Implementation()
+            rsa.generate_keys(bits=768, seed=4, e=e)
+            cls.keys.append((rsa,) + rsa.export_keys())
+
+    def engines(self):
+        yield RSAEngine()
+        yield RSAEngine(blinding=True)
+
+    def test_matches_rsa_implementation(self):
+        for rsa, public, private in self.keys:
+            for engine in self.engines():
+                with self.subTest(e=public.e, blinding=engine.blinding):
+                    text = "engine ✓" * 30
+                    self.assertEqual(engine.decrypt_blocks(private, rsa.encrypt_blocks(text)), text)
+                    self.assertEqual(rsa.decrypt_blocks(engine.encrypt_blocks(public, text)), text)
+                    self.assertEqual(engine.decrypt(private, engine.encrypt(public, "abc")), "abc")
+                    signature = engine.sign(private, b"message")
+                    self.assertEqual(signature, rsa.sign(b"message"))
+                    self.assertTrue(engine.verify(public, b"message", signature))
+                    self.assertFalse(engine.verify(public, b"other", signature))
+                    self.assertFalse(engine.verify(public, b"message", signature[:-1]))
+
+    def test_shared_between_threads(self):
+        engine = RSAEngine()
+        failures = []
+
+        def work(rsa, public, private):
+            for i in range(20):
+                message = f"thread message {i}".encode()
+                if not engine.verify(public, message, engine.sign(private, message)):
+                    failures.append(i)
+
+        threads = [threading.Thread(target=work, args=self.keys[i % 2]) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(failures, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,27 @@
+import unittest
+
+from rsa_algorithm import keygen
+from rsa_algorithm.core import RSA_Implementation
+
+
+class SeededKeygenTest(unittest.TestCase):
+    def test_seed_fixes_the_modulus_for_any_worker_count(self):
+        for primes in (2, 3):
+            moduli = {}
+            for workers in (1, 2, 4):
+                rsa = RSA_Implementation()
+                rsa.generate_keys(bits=256, workers=workers, seed=1234, e=65537, primes=primes)
+                self.assertEqual(rsa.n.bit_length(), 256)
+                moduli[workers] = rsa.n
+            with self.subTest(primes=primes):
+                self.assertEqual(len(set(moduli.values())), 1, moduli)
+
+    def test_unseeded_searches_differ(self):
+        first = keygen.find_primes(128, 2, workers=1)
+        second = keygen.find_primes(128, 2, workers=1)
+        self.assertNotEqual(first, second)
+        self.assertEqual(keygen.find_primes(128, 2, 2, seed=5), keygen.find_primes(128, 2, 1, seed=5))
+
+
+if __name__ == "__main__":
+    unittest.main()
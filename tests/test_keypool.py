@@ -0,0 +1,45 @@
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from rsa_algorithm.keypool import KeyPool
+
+
+class KeyPoolThreadExecutorTest(unittest.TestCase):
+    def setUp(self):
+        self.executor = ThreadPoolExecutor(4)
+        self.pool = KeyPool(size=4, low_watermark=2, executor=self.executor)
+
+    def tearDown(self):
+        self.pool.close()
+        self.executor.shutdown(wait=True)
+
+    def test_get_does_not_deadlock(self):
+        rsa = self.pool.get(64)
+        self.assertEqual(rsa.n.bit_length(), 64)
+        self.executor.shutdown(wait=True)
+        self.assertEqual(self.pool.available(64), 4)
+        self.assertEqual(self.pool.stats()["in_flight"][(64, 65537)], 0)
+
+    def test_refill_serves_hits(self):
+        self.pool.prefill(64)
+        self.executor.shutdown(wait=True)
+        self.pool.get(64)
+        self.assertEqual(self.pool.hits, 1)
+
+    def test_finished_future_runs_callback_outside_lock(self):
+        class DoneExecutor:
+            """Runs the work inline so every future is already done when returned"""
+
+            def submit(self, fn, *args):
+                with ThreadPoolExecutor(1) as inline:
+                    future = inline.submit(fn, *args)
+                    future.result()
+                return future
+
+        pool = KeyPool(size=2, low_watermark=1, executor=DoneExecutor())
+        pool.get(64)
+        self.assertEqual(pool.available(64), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,150 @@
+import os
+import random
+import tempfile
+import unittest
+
+from rsa_algorithm import keystore
+from rsa_algorithm.core import RSA_Implementation
+from rsa_algorithm.keystore import KeyStore
+
+
+def _public_only(n):
+    """A public-only key with the given modulus, as the keystore benchmark builds them"""
+    rsa = RSA_Implementation()
+    rsa.n, rsa.e = n, 65537
+    rsa.public_key = (rsa.n, rsa.e)
+    return rsa
+
+
+class KeyStoreTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.private = RSA_Implementation()
+        cls.private.generate_keys(bits=512, seed=18, e=65537)
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.path = self.directory.name
+        self.rng = random.Random(1234)
+
+    def open_store(self, **options):
+        store = KeyStore(self.path, **options)
+        self.addCleanup(store.close)
+        return store
+
+    def random_keys(self, count):
+        return [_public_only(self.rng.getrandbits(512) | 1) for _ in range(count)]
+
+    def test_add_and_get(self):
+        store = self.open_store()
+        fingerprint = store.add(self.private)
+        self.assertEqual(fingerprint, keystore.fingerprint(self.private))
+        self.assertIn(fingerprint, store)
+        self.assertNotIn("00" * 32, store)
+        self.assertEqual(len(store), 1)
+        self.assertTrue(store.has_private(fingerprint))
+        self.assertEqual(store.public_key(fingerprint), self.private.public_key)
+        loaded = store.get(fingerprint)
+        self.assertEqual(loaded.private_key_crt, self.private.private_key_crt)
+        self.assertEqual(loaded.decrypt_blocks(self.private.encrypt_blocks("stored")), "stored")
+        self.assertIs(store.get(fingerprint), loaded)
+        self.assertEqual((store.hits, store.misses), (1, 1))
+        with self.assertRaises(KeyError):
+            store.get("00" * 32)
+        with self.assertRaises(KeyError):
+            store.public_key("00" * 32)
+
+    def test_adding_twice_is_a_no_op(self):
+        store = self.open_store()
+        fingerprint = store.add(self.private)
+        size = os.path.getsize(os.path.join(self.path, keystore.DATA_FILE))
+        self.assertEqual(store.add(self.private), fingerprint)
+        self.assertEqual(store.add(self.private, include_private=False), fingerprint)
+        self.assertEqual(len(store), 1)
+        self.assertEqual(os.path.getsize(os.path.join(self.path, keystore.DATA_FILE)), size)
+
+    def test_public_copy_upgraded_to_private(self):
+        store = self.open_store()
+        fingerprint = store.add(self.private, include_private=False)
+        self.assertFalse(store.has_private(fingerprint))
+        self.assertIsNone(store.get(fingerprint).private_key_crt)
+        self.assertEqual(store.add(self.private), fingerprint)
+        self.assertEqual(len(store), 1)
+        self.assertTrue(store.has_private(fingerprint))
+        self.assertEqual(store.get(fingerprint).private_key_crt, self.private.private_key_crt)
+        store.close()
+        # The rebuilt index keeps the private copy over the older public one
+        os.remove(os.path.join(self.path, keystore.INDEX_FILE))
+        reopened = self.open_store()
+        self.assertEqual(len(reopened), 1)
+        self.assertTrue(reopened.has_private(fingerprint))
+
+    def test_reopen(self):
+        keys = self.random_keys(20)
+        with KeyStore(self.path) as store:
+            fingerprints = [store.add(rsa) for rsa in keys]
+            fingerprints.append(store.add(self.private))
+            store.flush()
+        reopened = self.open_store()
+        self.assertEqual(len(reopened), 21)
+        self.assertEqual(sorted(reopened.fingerprints()), sorted(fingerprints))
+        self.assertTrue(reopened.has_private(fingerprints[-1]))
+        self.assertFalse(reopened.has_private(fingerprints[0]))
+        self.assertEqual(reopened.get(fingerprints[0]).public_key, keys[0].public_key)
+
+    def test_growth_past_the_load_limit(self):
+        store = self.open_store()
+        keys = self.random_keys(keystore.MIN_CAPACITY * 3 // 4 + 50)
+        fingerprints = [store.add(rsa) for rsa in keys]
+        self.assertEqual(len(store), len(keys))
+        self.assertEqual(store._capacity, keystore.MIN_CAPACITY * 2)
+        for rsa, fingerprint in zip(keys, fingerprints):
+            self.assertEqual(store.public_key(fingerprint), rsa.public_key)
+        store.close()
+        reopened = self.open_store()
+        self.assertEqual(len(reopened), len(keys))
+        self.assertEqual(reopened.public_key(fingerprints[0]), keys[0].public_key)
+
+    def test_rebuild_after_losing_the_index(self):
+        with KeyStore(self.path) as store:
+            fingerprints = [store.add(rsa) for rsa in self.random_keys(30)]
+        os.remove(os.path.join(self.path, keystore.INDEX_FILE))
+        reopened = self.open_store()
+        self.assertEqual(len(reopened), 30)
+        self.assertEqual(sorted(reopened.fingerprints()), sorted(fingerprints))
+        reopened.rebuild_index(expected_keys=5000)
+        self.assertEqual(len(reopened), 30)
+        self.assertTrue(all(fingerprint in reopened for fingerprint in fingerprints))
+
+    def test_torn_final_record(self):
+        keys = self.random_keys(10)
+        with KeyStore(self.path) as store:
+            fingerprints = [store.add(rsa) for rsa in keys]
+        data_path = os.path.join(self.path, keystore.DATA_FILE)
+        with open(data_path, "r+b") as f:
+            f.truncate(os.path.getsize(data_path) - 7)
+        os.remove(os.path.join(self.path, keystore.INDEX_FILE))
+        store = self.open_store()
+        self.assertEqual(len(store), 9)
+        self.assertNotIn(fingerprints[-1], store)
+        for rsa, fingerprint in zip(keys[:-1], fingerprints):
+            self.assertEqual(store.public_key(fingerprint), rsa.public_key)
+        # The torn bytes are cut off, so the key can be added again cleanly
+        self.assertEqual(store.add(keys[-1]), fingerprints[-1])
+        store.close()
+        os.remove(os.path.join(self.path, keystore.INDEX_FILE))
+        reopened = self.open_store()
+        self.assertEqual(sorted(reopened.fingerprints()), sorted(fingerprints))
+        for rsa, fingerprint in zip(keys, fingerprints):
+            self.assertEqual(reopened.public_key(fingerprint), rsa.public_key)
+
+    def test_rejects_foreign_files(self):
+        with open(os.path.join(self.path, keystore.DATA_FILE), "wb") as f:
+            f.write(b"not a keystore")
+        with self.assertRaisesRegex(ValueError, "keystore"):
+            KeyStore(self.path)
+
+
+if __name__ == "__main__":
+    unittest.main()
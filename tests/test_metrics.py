@@ -0,0 +1,104 @@
+import time
+import unittest
+
+from rsa_algorithm import blinding
+from rsa_algorithm.core import RSA_Implementation
+from rsa_algorithm.metrics import NULL_METRICS, InstrumentedBackend, Metrics
+
+
+class MetricsTest(unittest.TestCase):
+    def setUp(self):
+        self.rsa = RSA_Implementation()
+
+    def test_enable_metrics(self):
+        metrics = self.rsa.enable_metrics()
+        self.assertIsInstance(metrics, Metrics)
+        self.assertIsInstance(self.rsa.arith, InstrumentedBackend)
+        self.rsa.generate_keys(bits=512, e=65537)
+        encrypted = self.rsa.encrypt_blocks("metrics")
+        self.assertEqual(self.rsa.decrypt_blocks(encrypted), "metrics")
+        counters = metrics.counters
+        self.assertGreater(counters["prime_candidates"], 0)
+        self.assertGreaterEqual(counters["probable_primes"], 2)
+        self.assertEqual(counters["generate_keys_calls"], 1)
+        self.assertEqual(counters["encrypt_blocks_calls"], 1)
+        self.assertEqual(counters["decrypt_blocks_bytes"], len(encrypted))
+        self.assertGreaterEqual(counters["modexp_calls"], 3)
+
+    def test_enabling_twice_does_not_stack_backends(self):
+        first = self.rsa.enable_metrics()
+        second = self.rsa.enable_metrics(Metrics())
+        self.assertIsNot(first, second)
+        self.assertNotIsInstance(self.rsa.arith.inner, InstrumentedBackend)
+
+    def test_disable_metrics(self):
+        metrics = self.rsa.enable_metrics()
+        self.rsa.generate_keys(bits=512, e=65537)
+        self.rsa.disable_metrics()
+        self.assertIs(self.rsa.metrics, NULL_METRICS)
+        self.assertNotIsInstance(self.rsa.arith, InstrumentedBackend)
+        self.assertIs(self.rsa.symbol_cache.powmod.__self__, self.rsa.arith)
+        before = dict(metrics.counters)
+        self.rsa.decrypt_blocks(self.rsa.encrypt_blocks("quiet"))
+        self.assertEqual(dict(metrics.counters), before)
+        self.assertEqual(self.rsa.metrics_snapshot(), {"counters": {}, "histograms": {}})
+
+    def test_blinding_cache_follows_the_backend(self):
+        rsa = RSA_Implementation(blinding=True)
+        rsa.generate_keys(bits=512, e=65537)
+        metrics = rsa.enable_metrics()
+        cache = rsa.blinding_cache()
+        self.addCleanup(cache.close)
+        self.assertIs(cache.arith, rsa.arith)
+        rsa.disable_metrics()
+        self.assertIs(cache.arith, rsa.arith)
+        self.assertNotIsInstance(cache.arith, InstrumentedBackend)
+        # Wait for the refill thread to settle, then check that new pairs go uncounted
+        rsa.decrypt_blocks(rsa.encrypt_blocks("blinded"))
+        time.sleep(blinding.IDLE_SECONDS / 10)
+        before = dict(metrics.counters)
+        for _ in range(cache.size * cache.refresh_uses):
+            rsa.decrypt_blocks(rsa.encrypt_blocks("x"))
+        cache.prefill()
+        self.assertEqual(dict(metrics.counters), before)
+        metrics = rsa.enable_metrics()
+        self.assertIs(rsa.blinding_cache(), cache)
+        self.assertIs(cache.arith, rsa.arith)
+        cache.fresh_pair()
+        self.assertEqual(metrics.counters["mod_inverse_calls"], 1)
+
+    def test_metrics_snapshot(self):
+        self.rsa.enable_metrics()
+        self.rsa.generate_keys(bits=512, e=65537)
+        self.rsa.encrypt_blocks("snapshot")
+        snapshot = self.rsa.metrics_snapshot()
+        self.assertEqual(set(snapshot), {"counters", "histograms"})
+        self.assertEqual(snapshot["counters"]["encrypt_blocks_calls"], 1)
+        histogram = snapshot["histograms"]["modexp"]
+        self.assertEqual(histogram["count"], snapshot["counters"]["modexp_calls"])
+        self.assertEqual(sum(histogram["buckets"].values()), histogram["count"])
+        self.assertLessEqual(histogram["mean_seconds"], histogram["max_seconds"])
+        # The snapshot is a copy that later work does not change
+        self.rsa.encrypt_blocks("again")
+        self.assertEqual(snapshot["counters"]["encrypt_blocks_calls"], 1)
+        self.rsa.metrics.reset()
+        self.assertEqual(self.rsa.metrics_snapshot(), {"counters": {}, "histograms": {}})
+
+    def test_profile(self):
+        self.rsa.generate_keys(bits=512, e=65537)
+        with self.rsa.profile(cpu=True, memory=True) as report:
+            self.rsa.decrypt_blocks(self.rsa.encrypt_blocks("profiled" * 50))
+        self.assertIsNotNone(report.stats)
+        self.assertGreater(report.peak_bytes, 0)
+        text = report.text(limit=5)
+        self.assertIn("decrypt_blocks", text)
+        self.assertIn("Peak traced memory", text)
+        with self.rsa.profile(cpu=False) as report:
+            pass
+        self.assertIsNone(report.stats)
+        self.assertIsNone(report.memory)
+        self.assertEqual(report.text(), "")
+
+
+if __name__ == "__main__":
+    unittest.main()
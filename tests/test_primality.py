@@ -0,0 +1,66 @@
+import random
+import unittest
+
+from rsa_algorithm import primality
+
+LOW = primality.SIEVE_PRIMES[-1] + 1
+
+
+class FixedStart:
+    """rng stand-in whose randint always lands on the top of the range"""
+
+    def randint(self, low, high):
+        return high
+
+
+def is_prime(n):
+    return primality.is_probable_prime(n)
+
+
+class IncrementalPrimeSearchTest(unittest.TestCase):
+    def test_results_stay_in_range(self):
+        rng = random.Random(1234)
+        for _ in range(200):
+            min_val = rng.randrange(LOW, LOW + 10 ** 6)
+            max_val = min_val + rng.randrange(200, 5000)
+            for window in (8, 64, primality.SIEVE_WINDOW):
+                prime = primality.incremental_prime_search(min_val, max_val, is_prime,
+                                                           rng, window)
+                self.assertTrue(min_val <= prime <= max_val)
+                self.assertTrue(is_prime(prime))
+
+    def test_wraps_around_to_the_bottom_of_the_range(self):
+        lowest = primality.next_prime(LOW)
+        following = primality.next_prime(lowest + 1)
+        # The walk starts above the only prime in the range and has to wrap
+        for window in (2, 8, primality.SIEVE_WINDOW):
+            prime = primality.incremental_prime_search(LOW, following - 1, is_prime,
+                                                       FixedStart(), window)
+            self.assertEqual(prime, lowest)
+
+    def test_no_prime_in_range(self):
+        lowest = primality.next_prime(LOW)
+        following = primality.next_prime(lowest + 1)
+        self.assertGreater(following - lowest, 2)
+        for rng in (FixedStart(), random.Random(1)):
+            with self.assertRaisesRegex(ValueError, "No prime found in range"):
+                primality.incremental_prime_search(lowest + 1, following - 1, is_prime, rng)
+        with self.assertRaisesRegex(ValueError, "No prime found in range"):
+            primality.incremental_prime_search(LOW, LOW + 10 ** 5, lambda n: False,
+                                               random.Random(2), 64)
+
+    def test_rejects_bad_ranges(self):
+        with self.assertRaisesRegex(ValueError, "sieve prime table"):
+            primality.incremental_prime_search(1000, 10 ** 6, is_prime)
+        with self.assertRaisesRegex(ValueError, "Empty range"):
+            primality.incremental_prime_search(LOW + 10, LOW, is_prime)
+
+    def test_defaults_to_the_system_random(self):
+        self.assertIsInstance(primality.SYSTEM_RANDOM, random.SystemRandom)
+        prime = primality.incremental_prime_search(LOW, LOW + 10 ** 6, is_prime)
+        self.assertTrue(LOW <= prime <= LOW + 10 ** 6)
+        self.assertEqual(primality.random_odd(64).bit_length(), 64)
+
+
+if __name__ == "__main__":
+    unittest.main()
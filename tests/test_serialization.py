@@ -0,0 +1,177 @@
+import mmap
+import os
+import tempfile
+import unittest
+
+from rsa_algorithm import serialization, stream
+from rsa_algorithm.core import RSA_Implementation
+
+
+def _key_tuples(rsa):
+    """The tuple representation a loaded key has to reproduce"""
+    return (rsa.public_key, rsa.private_key, rsa.private_key_crt, rsa.extra_primes,
+            rsa.private_key_crt_extra)
+
+
+class KeyFormatTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.keys = {}
+        for primes in (2, 3):
+            rsa = RSA_Implementation()
+            rsa.generate_keys(bits=768, seed=primes, e=65537, primes=primes)
+            cls.keys[primes] = rsa
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def round_trip(self, rsa, name, **save_options):
+        path = os.path.join(self.directory.name, name)
+        rsa.save_keys(path, **save_options)
+        loaded = RSA_Implementation()
+        loaded.load_keys(path)
+        return loaded
+
+    def test_private_key_round_trips(self):
+        for primes, rsa in self.keys.items():
+            for name in ("key.json", "key.pem", "key.der"):
+                with self.subTest(primes=primes, format=name):
+                    loaded = self.round_trip(rsa, name)
+                    self.assertEqual(_key_tuples(loaded), _key_tuples(rsa))
+                    self.assertEqual(loaded.phi_n, rsa.phi_n)
+                    self.assertEqual(loaded.decrypt_blocks(rsa.encrypt_blocks("round trip")),
+                                     "round trip")
+
+    def test_public_key_round_trips(self):
+        for primes, rsa in self.keys.items():
+            for name in ("public.json", "public.pem", "public.der"):
+                with self.subTest(primes=primes, format=name):
+                    loaded = self.round_trip(rsa, name, include_private=False)
+                    self.assertEqual(loaded.public_key, rsa.public_key)
+                    self.assertIsNone(loaded.private_key_crt)
+                    self.assertEqual(loaded.extra_primes, ())
+                    self.assertTrue(loaded.verify(b"message", rsa.sign(b"message")))
+
+    def test_public_key_refuses_private_operations(self):
+        rsa = self.keys[2]
+        loaded = self.round_trip(rsa, "public.json", include_private=False)
+        secret, wrapped = stream.wrap_session_key(loaded)
+        for blinding in (False, True):
+            loaded.blinding = blinding
+            operations = {
+                "sign": lambda: loaded.sign(b"message"),
+                "decrypt": lambda: loaded.decrypt(rsa.encrypt("hi")[0]),
+                "decrypt_blocks": lambda: loaded.decrypt_blocks(rsa.encrypt_blocks("hi")),
+                "unwrap_session_key": lambda: stream.unwrap_session_key(loaded, wrapped),
+            }
+            for name, operation in operations.items():
+                with self.subTest(operation=name, blinding=blinding):
+                    with self.assertRaisesRegex(ValueError, "needs the private key"):
+                        operation()
+        self.assertEqual(stream.unwrap_session_key(rsa, wrapped), secret)
+
+    def test_format_argument_overrides_extension(self):
+        rsa = self.keys[2]
+        loaded = self.round_trip(rsa, "key.bin", format="der")
+        self.assertEqual(_key_tuples(loaded), _key_tuples(rsa))
+
+    def test_pem_labels(self):
+        rsa = self.keys[3]
+        label, der = serialization.from_pem(
+            serialization.to_pem(serialization.private_key_der(rsa), serialization.PEM_PRIVATE))
+        self.assertEqual(label, serialization.PEM_PRIVATE)
+        self.assertEqual(der, serialization.private_key_der(rsa))
+
+    def test_public_numbers(self):
+        for rsa in self.keys.values():
+            self.assertEqual(serialization.public_numbers(serialization.public_key_der(rsa)),
+                             rsa.public_key)
+            self.assertEqual(serialization.public_numbers(serialization.private_key_der(rsa)),
+                             rsa.public_key)
+
+    def test_malformed_keys(self):
+        der = serialization.private_key_der(self.keys[2])
+        for bad in (b"", b"\x30", der[:len(der) // 2], b"\x02\x01\x01",
+                    serialization.public_key_der(self.keys[2])[:-1]):
+            with self.subTest(bad=bad[:8]):
+                with self.assertRaises(ValueError):
+                    serialization.load_key_der(bad, RSA_Implementation())
+        with self.assertRaises(ValueError):
+            serialization.from_pem("not a pem block")
+
+    def test_malformed_json_keys(self):
+        cases = {
+            '{"e": 65537}': "missing the field 'n'",
+            '{"n": 3233}': "missing the field 'e'",
+            '{"n": "3233", "e": 17}': "'n' must be a non-negative integer",
+            '{"n": 3233, "e": 17, "d": null}': "missing the field 'd'",
+            '{"n": 3233, "e": 17, "other_primes": [{"d": 1}]}': "missing the field 'r'",
+            '[3233, 17]': "not a JSON key object",
+        }
+        for text, message in cases.items():
+            with self.subTest(text=text):
+                path = os.path.join(self.directory.name, "bad.json")
+                with open(path, "w") as f:
+                    f.write(text)
+                with self.assertRaisesRegex(ValueError, message):
+                    RSA_Implementation().load_keys(path)
+
+    def test_public_key_cannot_be_saved_as_private(self):
+        rsa = RSA_Implementation()
+        rsa.n, rsa.e = self.keys[2].public_key
+        rsa.public_key = (rsa.n, rsa.e)
+        with self.assertRaises(ValueError):
+            serialization.private_key_der(rsa)
+
+
+class CiphertextContainerTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.rsa = RSA_Implementation()
+        cls.rsa.generate_keys(bits=512, seed=1, e=65537)
+        cls.values = cls.rsa.encrypt("packed ciphertext")[0]
+
+    def test_round_trip_over_buffers(self):
+        packed = serialization.pack_ciphertext(self.values, self.rsa.n)
+        for buffer in (packed, bytearray(packed), memoryview(packed)):
+            self.assertEqual(serialization.unpack_ciphertext(buffer), self.values)
+        self.assertEqual(list(serialization.iter_ciphertext(memoryview(packed))), self.values)
+
+    def test_round_trip_over_mmap(self):
+        with tempfile.TemporaryFile() as f:
+            f.write(b"\x00" * 7)  # the container does not have to start the file
+            f.write(serialization.pack_ciphertext(self.values, self.rsa.n))
+            f.flush()
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                self.assertEqual(serialization.unpack_ciphertext(memoryview(mapped)[7:]),
+                                 self.values)
+                self.assertEqual(self.rsa.decrypt(serialization.iter_ciphertext(mapped[7:]))[0],
+                                 "packed ciphertext")
+
+    def test_empty_list(self):
+        packed = serialization.pack_ciphertext([], self.rsa.n)
+        self.assertEqual(serialization.unpack_ciphertext(packed), [])
+
+    def test_wrong_magic(self):
+        packed = bytearray(serialization.pack_ciphertext(self.values, self.rsa.n))
+        packed[0:4] = b"XXXX"
+        with self.assertRaisesRegex(ValueError, "Not a packed"):
+            serialization.unpack_ciphertext(packed)
+
+    def test_unsupported_version(self):
+        packed = bytearray(serialization.pack_ciphertext(self.values, self.rsa.n))
+        packed[4] = serialization.CIPHERTEXT_VERSION + 1
+        with self.assertRaisesRegex(ValueError, "version"):
+            serialization.unpack_ciphertext(packed)
+
+    def test_truncation(self):
+        packed = serialization.pack_ciphertext(self.values, self.rsa.n)
+        for length in range(len(packed)):
+            with self.subTest(length=length):
+                with self.assertRaises(ValueError):
+                    serialization.unpack_ciphertext(packed[:length])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import asyncio
+import os
+import tempfile
+import unittest
+
+from rsa_algorithm import batch
+from rsa_algorithm.core import RSA_Implementation
+from rsa_algorithm.service import RSAClient, RSAService
+
+
+class ServiceBatchTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.rsa = RSA_Implementation()
+        cls.rsa.generate_keys(bits=512, seed=1, e=65537)
+
+    def run_service(self, scenario):
+        async def main():
+            with tempfile.TemporaryDirectory() as directory:
+                path = os.path.join(directory, "rsa.sock")
+                # A long window puts every request of the scenario in one batch
+                service = RSAService(self.rsa, workers=1, window=0.2,
+                                     executor=batch.EXECUTOR_THREAD)
+                await service.start(path)
+                client = await RSAClient.connect(path)
+                try:
+                    return await scenario(client), service
+                finally:
+                    await client.close()
+                    await service.close()
+        return asyncio.run(main())
+
+    def test_bad_request_fails_only_itself(self):
+        async def scenario(client):
+            return await asyncio.gather(
+                client.encrypt("first"),
+                client.request("encrypt", text=5),
+                client.encrypt("second"),
+                return_exceptions=True)
+
+        (first, bad, second), service = self.run_service(scenario)
+        self.assertEqual(service.batches, 1)
+        self.assertIsInstance(bad, ValueError)
+        self.assertTrue(str(bad).startswith("bad request"))
+        self.assertEqual(self.rsa.decrypt_blocks(first), "first")
+        self.assertEqual(self.rsa.decrypt_blocks(second), "second")
+
+    def test_junk_ciphertext_fails_only_itself(self):
+        async def scenario(client):
+            good = await client.encrypt("hello")
+            return await asyncio.gather(
+                client.decrypt(good),
+                client.decrypt(b"\xff" * len(good)),
+                return_exceptions=True)
+
+        (good, junk), _ = self.run_service(scenario)
+        self.assertEqual(good, "hello")
+        self.assertIsInstance(junk, ValueError)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,181 @@
+import hashlib
+import io
+import os
+import tempfile
+import threading
+import unittest
+
+from rsa_algorithm import stream
+from rsa_algorithm.core import RSA_Implementation
+
+CHUNK = 4096
+
+# Set to a size in GiB to also round-trip a sparse file of that size, e.g. 5
+LARGE_FILE_GIB = float(os.environ.get("RSA_LARGE_FILE_GIB", "0"))
+
+
+class _HashSink:
+    """Writable that only keeps a running SHA-256, so huge outputs never hit the disk"""
+
+    def __init__(self):
+        self.hash = hashlib.sha256()
+
+    def write(self, data):
+        self.hash.update(data)
+
+
+def _file_digest(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while block := f.read(1 << 20):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _make_sparse(path, size):
+    """A file of size bytes that is mostly a hole, with data at the edges and in the middle"""
+    with open(path, "wb") as f:
+        f.truncate(size)
+        for offset in (0, size // 3, size // 2 - 5, size - 7):
+            f.seek(offset)
+            f.write(b"marker!")
+
+
+class StreamTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.rsa = RSA_Implementation()
+        cls.rsa.generate_keys(bits=512, seed=1, e=65537)
+        cls.other = RSA_Implementation()
+        cls.other.generate_keys(bits=512, seed=2, e=65537)
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def path(self, name):
+        return os.path.join(self.directory.name, name)
+
+    def encrypt(self, data, chunk_size=CHUNK):
+        out = io.BytesIO()
+        stream.encrypt_stream(self.rsa, io.BytesIO(data), out, chunk_size)
+        return out.getvalue()
+
+    def decrypt(self, encrypted, rsa=None):
+        out = io.BytesIO()
+        stream.decrypt_stream(rsa or self.rsa, io.BytesIO(encrypted), out)
+        return out.getvalue()
+
+    def record_count(self, encrypted):
+        """Walk the records of a stream and return how many there are"""
+        wrapped_size = stream._HEADER.unpack_from(encrypted)[3]
+        offset = stream._HEADER.size + wrapped_size
+        count = 0
+        while offset < len(encrypted):
+            _, size = stream._RECORD.unpack_from(encrypted, offset)
+            offset += stream._RECORD.size + size + stream.TAG_SIZE
+            count += 1
+        self.assertEqual(offset, len(encrypted))
+        return count
+
+    def test_round_trip_sizes(self):
+        for size in (0, 1, CHUNK - 1, CHUNK, CHUNK + 1, 3 * CHUNK, 3 * CHUNK + 17):
+            data = os.urandom(size)
+            self.assertEqual(self.decrypt(self.encrypt(data)), data, size)
+
+    def test_empty_input_is_one_final_record(self):
+        encrypted = self.encrypt(b"")
+        self.assertEqual(self.record_count(encrypted), 1)
+        self.assertEqual(self.decrypt(encrypted), b"")
+
+    def test_exactly_one_chunk_is_one_record(self):
+        data = os.urandom(CHUNK)
+        encrypted = self.encrypt(data)
+        self.assertEqual(self.record_count(encrypted), 1)
+        self.assertEqual(self.decrypt(encrypted), data)
+        self.assertEqual(self.record_count(self.encrypt(data + b"x")), 2)
+
+    def test_files_round_trip_through_mmap(self):
+        data = os.urandom(5 * CHUNK + 3)
+        with open(self.path("plain"), "wb") as f:
+            f.write(data)
+        stream.encrypt_file(self.rsa, self.path("plain"), self.path("enc"), CHUNK)
+        stream.decrypt_file(self.rsa, self.path("enc"), self.path("out"))
+        with open(self.path("out"), "rb") as f:
+            self.assertEqual(f.read(), data)
+
+    def test_empty_file(self):
+        open(self.path("plain"), "wb").close()
+        stream.encrypt_file(self.rsa, self.path("plain"), self.path("enc"), CHUNK)
+        stream.decrypt_file(self.rsa, self.path("enc"), self.path("out"))
+        self.assertEqual(os.path.getsize(self.path("out")), 0)
+
+    def test_sparse_file_round_trip(self):
+        _make_sparse(self.path("sparse"), 64 << 20)
+        stream.encrypt_file(self.rsa, self.path("sparse"), self.path("enc"))
+        stream.decrypt_file(self.rsa, self.path("enc"), self.path("out"))
+        self.assertEqual(_file_digest(self.path("out")), _file_digest(self.path("sparse")))
+
+    @unittest.skipUnless(LARGE_FILE_GIB, "set RSA_LARGE_FILE_GIB to round-trip a multi-GB sparse file")
+    def test_large_sparse_file_round_trip(self):
+        _make_sparse(self.path("sparse"), int(LARGE_FILE_GIB * (1 << 30)))
+        stream.encrypt_file(self.rsa, self.path("sparse"), self.path("enc"))
+        sink = _HashSink()
+        with open(self.path("enc"), "rb") as src:
+            stream.decrypt_stream(self.rsa, src, sink)
+        self.assertEqual(sink.hash.hexdigest(), _file_digest(self.path("sparse")))
+
+    def through_pipe(self, data):
+        """Return the read end of a pipe that a background thread fills with data"""
+        read_end, write_end = os.pipe()
+
+        def feed():
+            with os.fdopen(write_end, "wb") as f:
+                f.write(data)
+
+        writer = threading.Thread(target=feed)
+        writer.start()
+        self.addCleanup(writer.join)
+        return os.fdopen(read_end, "rb")
+
+    def test_pipe_sources(self):
+        data = os.urandom(2 * CHUNK + 5)
+        encrypted = io.BytesIO()
+        with self.through_pipe(data) as src:
+            stream.encrypt_stream(self.rsa, src, encrypted, CHUNK)
+        decrypted = io.BytesIO()
+        with self.through_pipe(encrypted.getvalue()) as src:
+            stream.decrypt_stream(self.rsa, src, decrypted)
+        self.assertEqual(decrypted.getvalue(), data)
+
+    def test_tampering_is_rejected(self):
+        encrypted = self.encrypt(os.urandom(2 * CHUNK + 100))
+        body_start = stream._HEADER.size + stream._HEADER.unpack_from(encrypted)[3]
+        # Magic, wrapped secret, record flag, chunk body, tag, and a later record
+        for position in (0, stream._HEADER.size + 3, body_start, body_start + 10,
+                         body_start + stream._RECORD.size + CHUNK + 2, len(encrypted) - 50):
+            tampered = bytearray(encrypted)
+            tampered[position] ^= 0x01
+            with self.assertRaises(ValueError, msg=position):
+                self.decrypt(bytes(tampered))
+
+    def test_truncation_is_rejected(self):
+        encrypted = self.encrypt(os.urandom(2 * 64 + 9), chunk_size=64)
+        for length in range(len(encrypted)):
+            with self.assertRaises(ValueError, msg=length):
+                self.decrypt(encrypted[:length])
+
+    def test_dropped_final_record_is_rejected(self):
+        data = os.urandom(3 * CHUNK)
+        encrypted = self.encrypt(data)
+        final_record = stream._RECORD.size + CHUNK + stream.TAG_SIZE
+        with self.assertRaisesRegex(ValueError, "Truncated"):
+            self.decrypt(encrypted[:-final_record])
+
+    def test_wrong_key_is_rejected(self):
+        with self.assertRaises(ValueError):
+            self.decrypt(self.encrypt(b"secret"), self.other)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+import unittest
+
+from rsa_algorithm.core import RSA_Implementation
+from rsa_algorithm.symbolcache import SymbolCache
+
+
+class SymbolCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.n, self.e, self.d = 3233, 17, 2753  # p = 61, q = 53
+        self.cache = SymbolCache()
+        self.cache.bind((self.n, self.e), (self.n, self.d))
+        self.private_operation = lambda c: pow(c, self.d, self.n)
+
+    def test_both_directions_fill_each_other(self):
+        c = self.cache.encrypt(65, self.e, self.n)
+        self.assertEqual(c, pow(65, self.e, self.n))
+        self.assertEqual(self.cache.decrypt(c, self.private_operation), 65)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+    def test_lru_bound(self):
+        self.cache.max_entries = 4
+        for m in range(10):
+            self.cache.encrypt(m + 2, self.e, self.n)
+        self.assertEqual(len(self.cache._encrypt), 4)
+        self.assertEqual(list(self.cache._encrypt), [8, 9, 10, 11])
+        # A hit moves the entry to the most recently used end
+        self.cache.encrypt(8, self.e, self.n)
+        self.cache.encrypt(12, self.e, self.n)
+        self.assertEqual(list(self.cache._encrypt), [10, 11, 8, 12])
+
+    def test_memory_budget(self):
+        cache = SymbolCache(max_bytes=0)
+        cache.bind((self.n, self.e), (self.n, self.d))
+        cache.encrypt(65, self.e, self.n)
+        self.assertEqual(len(cache), 0)
+
+    def test_new_key_clears_tables(self):
+        self.cache.encrypt(65, self.e, self.n)
+        self.cache.bind((self.n, self.e), (self.n, self.d))
+        self.assertEqual(len(self.cache), 2)
+        self.cache.bind((3127, 3), (3127, 2011))
+        self.assertEqual(len(self.cache), 0)
+
+    def test_unreduced_code_point_does_not_alias(self):
+        c = self.cache.encrypt(self.n + 65, self.e, self.n)
+        self.assertEqual(c, pow(65, self.e, self.n))
+        self.assertEqual(self.cache.decrypt(c, self.private_operation), 65)
+
+    def test_unreduced_ciphertext_does_not_alias(self):
+        c = pow(65, self.e, self.n)
+        self.assertEqual(self.cache.decrypt(c + self.n, self.private_operation), 65)
+        self.assertEqual(self.cache.encrypt(65, self.e, self.n), c)
+
+
+class SymbolCacheAliasingTest(unittest.TestCase):
+    def test_decrypt_does_not_depend_on_earlier_encryptions(self):
+        rsa = RSA_Implementation(vectorize=False)
+        rsa.generate_keys(prime_range=(10, 99))
+        ciphertext = rsa.encrypt("A")[0]
+        rsa.encrypt(chr(rsa.n + 65))
+        self.assertEqual(rsa.decrypt(ciphertext)[0], "A")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,42 @@
+import unittest
+
+from rsa_algorithm import tracing
+from rsa_algorithm.core import RSA_Implementation
+
+
+class SymbolStepsTest(unittest.TestCase):
+    message = "Steps on demand: ∑ ü\n"
+
+    def traced_round_trip(self, rsa):
+        encrypted, encryption_steps = rsa.encrypt(self.message, tracing.LazyTracer())
+        decrypted, decryption_steps = rsa.decrypt(encrypted, tracing.LazyTracer())
+        return encrypted, decrypted, encryption_steps.lines(), decryption_steps.lines()
+
+    def test_matches_the_recorded_steps(self):
+        for vectorize, prime_range in ((False, (100, 500)), (True, (10000, 99999))):
+            with self.subTest(vectorize=vectorize):
+                rsa = RSA_Implementation(vectorize=vectorize)
+                rsa.generate_keys(prime_range=prime_range, seed=22)
+                encrypted, decrypted, encryption, decryption = self.traced_round_trip(rsa)
+                self.assertEqual(decrypted, self.message)
+                steps = tracing.EncryptionSteps(rsa.public_key, self.message, encrypted)
+                self.assertEqual(len(steps), len(encryption))
+                self.assertEqual(steps.lines(), encryption)
+                steps = tracing.DecryptionSteps(rsa.private_key, decrypted, encrypted)
+                self.assertEqual(len(steps), len(decryption))
+                self.assertEqual(steps.lines(), decryption)
+
+    def test_indexing(self):
+        steps = tracing.EncryptionSteps((3233, 17), "ab", [2790, 2159])
+        self.assertEqual(len(steps), 12)
+        self.assertEqual(steps[-1], "3. Result: c = 2159")
+        self.assertEqual(steps[7], "\nEncrypting character 'b' (position 2):")
+        with self.assertRaises(IndexError):
+            steps[12]
+        with self.assertRaises(IndexError):
+            steps[-13]
+        self.assertEqual(len(tracing.DecryptionSteps((3233, 2753), "", [])), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
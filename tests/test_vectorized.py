@@ -0,0 +1,44 @@
+import subprocess
+import sys
+import unittest
+
+from rsa_algorithm import serialization, vectorized
+from rsa_algorithm.core import RSA_Implementation
+from rsa_algorithm.tracing import LazyTracer
+
+
+class VectorizedDecryptTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.rsa = RSA_Implementation()
+        cls.rsa.generate_keys(prime_range=(10000, 99999))
+        cls.message = "vectorized decrypt"
+        cls.encrypted = cls.rsa.encrypt(cls.message)[0]
+
+    def test_decrypt_accepts_iterables_without_length(self):
+        for vectorize in (True, False):
+            self.rsa.vectorize = vectorize
+            packed = self.rsa.pack_encrypted(self.encrypted)
+            self.assertEqual(self.rsa.decrypt(serialization.iter_ciphertext(packed))[0],
+                             self.message)
+            self.assertEqual(self.rsa.decrypt(c for c in self.encrypted)[0], self.message)
+        self.rsa.vectorize = True
+
+    def test_traced_decrypt_of_generator(self):
+        decrypted, steps = self.rsa.decrypt(iter(self.encrypted), LazyTracer())
+        self.assertEqual(decrypted, self.message)
+        self.assertIn("Final decrypted message", "\n".join(steps))
+
+    @unittest.skipIf(vectorized.load_numpy() is None, "NumPy is not installed")
+    def test_uses_numpy_for_small_moduli(self):
+        self.assertTrue(vectorized.available(self.rsa.n))
+
+    def test_cli_import_does_not_load_numpy(self):
+        probe = subprocess.run(
+            [sys.executable, "-c", "import sys, rsa_algorithm.cli; print('numpy' in sys.modules)"],
+            check=True, capture_output=True, text=True)
+        self.assertEqual(probe.stdout.strip(), "False")
+
+
+if __name__ == "__main__":
+    unittest.main()